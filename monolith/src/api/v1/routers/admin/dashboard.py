@@ -2,9 +2,9 @@
 Admin Dashboard API router
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.database import get_db
+from src.common.database import get_session
 from src.modules.auth.services.authentication_service import get_current_user
 from src.modules.identity.schemas.internal import UserResponse
 from src.modules.admin.services.admin_dashboard_service import AdminDashboardService
@@ -14,7 +14,7 @@
 
 @router.get("", response_model=DashboardStatsResponse)
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -28,13 +28,13 @@ async def get_dashboard_stats(
         )
     
     dashboard_service = AdminDashboardService(db)
-    stats = dashboard_service.get_dashboard_stats()
+    stats = await dashboard_service.get_dashboard_stats()
     return stats
 
 @router.get("/recent-activity")
 async def get_recent_activity(
     limit: int = 10,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -48,13 +48,13 @@ async def get_recent_activity(
         )
     
     dashboard_service = AdminDashboardService(db)
-    activity = dashboard_service.get_recent_activity(limit)
+    activity = await dashboard_service.get_recent_activity(limit)
     return activity
 
 @router.get("/revenue-stats")
 async def get_revenue_stats(
     period: str = "month", # day, week, month, year
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -68,5 +68,5 @@ async def get_revenue_stats(
         )
     
     dashboard_service = AdminDashboardService(db)
-    revenue_stats = dashboard_service.get_revenue_stats(period)
+    revenue_stats = await dashboard_service.get_revenue_stats(period)
     return revenue_stats 
\ No newline at end of file
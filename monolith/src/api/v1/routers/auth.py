@@ -3,9 +3,10 @@
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.database import get_db
+from src.common.database import get_session
+from src.common.jwt_keys import get_key_ring
 from src.modules.auth.services.authentication_service import AuthenticationService
 from src.modules.auth.schemas.internal import (
     UserCreate,
@@ -16,17 +17,24 @@
 
 router = APIRouter(prefix="/auth")
 
+@router.get("/jwks.json")
+async def jwks():
+    """
+    Public keys for verifying tokens issued by this service
+    """
+    return get_key_ring().jwks()
+
 @router.post("/register", response_model=LoginResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ):
     """
     Register a new user
     """
     auth_service = AuthenticationService(db)
     try:
-        user, token = auth_service.register_user(user_data)
+        user, token = await auth_service.register_user(user_data)
         return {
             "user": user,
             "token": token
@@ -40,14 +48,14 @@ async def register(
 @router.post("/login", response_model=LoginResponse)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ):
     """
     Login with username and password
     """
     auth_service = AuthenticationService(db)
     try:
-        user, token = auth_service.authenticate_user(
+        user, token = await auth_service.authenticate_user(
             email=form_data.username,
             password=form_data.password
         )
@@ -65,14 +73,14 @@ async def login(
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     refresh_data: TokenRefreshRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ):
     """
     Refresh access token using refresh token
     """
     auth_service = AuthenticationService(db)
     try:
-        token = auth_service.refresh_token(refresh_data.refresh_token)
+        token = await auth_service.refresh_token(refresh_data.refresh_token)
         return token
     except ValueError as e:
         raise HTTPException(
@@ -84,11 +92,11 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     refresh_data: TokenRefreshRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ):
     """
     Logout user by invalidating their refresh token
     """
     auth_service = AuthenticationService(db)
-    auth_service.invalidate_token(refresh_data.refresh_token)
+    await auth_service.invalidate_token(refresh_data.refresh_token)
     return {"detail": "Successfully logged out"} 
\ No newline at end of file
@@ -2,10 +2,15 @@
 Courses API router
 """
 from typing import List, Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.database import get_db
+from src.common.database import get_session
+from src.common.schemas import CourseOutline, CourseSuggestion, SearchResponse
+from src.course.adapter import get_course_service, to_course_outline_schema
+from src.course.search import faceted_search_courses, search_courses, suggest_courses
+from src.course.service import CourseService
 from src.modules.auth.services.authentication_service import get_current_user
 from src.modules.course.services.course_management_service import CourseManagementService
 from src.modules.course.schemas.internal import (
@@ -29,33 +34,70 @@ async def list_courses(
     skip: int = 0,
     limit: int = 10,
     search: Optional[str] = None,
-    category: Optional[str] = None,
-    level: Optional[str] = None,
-    db: Session = Depends(get_db)
+    level: Optional[str] = None
 ):
     """
-    Get a list of courses with optional filtering
+    Get a list of courses with optional filtering, served from the search index
     """
-    course_service = CourseManagementService(db)
-    courses = course_service.get_courses(
-        skip=skip,
-        limit=limit,
+    courses = await search_courses(
         search=search,
-        category=category,
-        level=level
+        level=level,
+        skip=skip,
+        limit=limit
     )
     return courses
 
+@router.get("/search", response_model=SearchResponse)
+async def search_course_catalog(
+    search: Optional[str] = None,
+    level: Optional[str] = None,
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None
+):
+    """
+    Search courses with total, facet counts (level, price and duration bands)
+    and a next_cursor for paging past the first page
+    """
+    return await faceted_search_courses(
+        search=search,
+        level=level,
+        page=page,
+        size=size,
+        cursor=cursor
+    )
+
+@router.get("/suggest", response_model=List[CourseSuggestion])
+async def suggest_courses_route(
+    q: str = Query(..., min_length=1, max_length=100),
+    size: int = Query(8, ge=1, le=20)
+):
+    """
+    Type-ahead suggestions of published courses by title or instructor name prefix
+    """
+    return await suggest_courses(q, size=size)
+
+@router.get("/{course_id}/outline", response_model=CourseOutline)
+async def get_course_outline(
+    course_id: UUID,
+    course_service: CourseService = Depends(get_course_service)
+):
+    """
+    Get a course with its modules and lessons in order, without lesson content
+    """
+    course = await course_service.get_course_outline(course_id)
+    return to_course_outline_schema(course)
+
 @router.get("/{course_id}", response_model=CourseResponse)
 async def get_course(
     course_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ):
     """
     Get a course by ID
     """
     course_service = CourseManagementService(db)
-    course = course_service.get_course(course_id)
+    course = await course_service.get_course(course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -66,7 +108,7 @@ async def get_course(
 @router.post("", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
 async def create_course(
     course_data: CourseCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -81,7 +123,7 @@ async def create_course(
     
     course_service = CourseManagementService(db)
     try:
-        course = course_service.create_course(course_data, current_user.id)
+        course = await course_service.create_course(course_data, current_user.id)
         return course
     except ValueError as e:
         raise HTTPException(
@@ -93,7 +135,7 @@ async def create_course(
 async def update_course(
     course_id: str,
     course_data: CourseUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -101,7 +143,7 @@ async def update_course(
     """
     course_service = CourseManagementService(db)
     # Retrieve the course to check ownership
-    course = course_service.get_course(course_id)
+    course = await course_service.get_course(course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -116,7 +158,7 @@ async def update_course(
         )
     
     try:
-        updated_course = course_service.update_course(course_id, course_data)
+        updated_course = await course_service.update_course(course_id, course_data)
         return updated_course
     except ValueError as e:
         raise HTTPException(
@@ -127,7 +169,7 @@ async def update_course(
 @router.delete("/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_course(
     course_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -135,7 +177,7 @@ async def delete_course(
     """
     course_service = CourseManagementService(db)
     # Retrieve the course to check ownership
-    course = course_service.get_course(course_id)
+    course = await course_service.get_course(course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -149,7 +191,7 @@ async def delete_course(
             detail="Not enough permissions to delete this course"
         )
     
-    course_service.delete_course(course_id)
+    await course_service.delete_course(course_id)
     return None
 
 # Module endpoints
@@ -157,28 +199,28 @@ async def delete_course(
 @router.get("/{course_id}/modules", response_model=List[ModuleResponse])
 async def list_modules(
     course_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ):
     """
     Get all modules for a course
     """
     course_service = CourseManagementService(db)
     # Check if course exists
-    course = course_service.get_course(course_id)
+    course = await course_service.get_course(course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Course not found"
         )
     
-    modules = course_service.get_modules(course_id)
+    modules = await course_service.get_modules(course_id)
     return modules
 
 @router.post("/{course_id}/modules", response_model=ModuleResponse, status_code=status.HTTP_201_CREATED)
 async def create_module(
     course_id: str,
     module_data: ModuleCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -186,7 +228,7 @@ async def create_module(
     """
     course_service = CourseManagementService(db)
     # Check if course exists and user has permission
-    course = course_service.get_course(course_id)
+    course = await course_service.get_course(course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -201,7 +243,7 @@ async def create_module(
         )
     
     try:
-        module = course_service.create_module(course_id, module_data)
+        module = await course_service.create_module(course_id, module_data)
         return module
     except ValueError as e:
         raise HTTPException(
@@ -216,7 +258,7 @@ async def create_lesson(
     course_id: str,
     module_id: str,
     lesson_data: LessonCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
@@ -224,7 +266,7 @@ async def create_lesson(
     """
     course_service = CourseManagementService(db)
     # Check if course and module exist and user has permission
-    course = course_service.get_course(course_id)
+    course = await course_service.get_course(course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -232,7 +274,7 @@ async def create_lesson(
         )
     
     # Check module
-    module = course_service.get_module(module_id)
+    module = await course_service.get_module(module_id)
     if not module or module.course_id != course_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -247,7 +289,7 @@ async def create_lesson(
         )
     
     try:
-        lesson = course_service.create_lesson(module_id, lesson_data)
+        lesson = await course_service.create_lesson(module_id, lesson_data)
         return lesson
     except ValueError as e:
         raise HTTPException(
@@ -3,7 +3,9 @@
 from typing import Optional
 from uuid import UUID
 
-from ..common.kafka import produce_event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..common.outbox import stage_event
 
 
 @dataclass
@@ -14,8 +16,9 @@ class UserCreatedEvent:
     last_name: Optional[str]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "user.created",
             {
                 "user_id": str(self.user_id),
@@ -35,8 +38,9 @@ class UserUpdatedEvent:
     is_active: Optional[bool]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "user.updated",
             {
                 "user_id": str(self.user_id),
@@ -53,8 +57,9 @@ class UserDeletedEvent:
     user_id: UUID
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "user.deleted",
             {
                 "user_id": str(self.user_id),
@@ -74,8 +79,9 @@ class UserProfileCreatedEvent:
     website: Optional[str]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "user.profile.created",
             {
                 "user_id": str(self.user_id),
@@ -101,8 +107,9 @@ class UserProfileUpdatedEvent:
     website: Optional[str]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "user.profile.updated",
             {
                 "user_id": str(self.user_id),
@@ -19,13 +19,8 @@
     to_user_schema,
     to_user_profile_schema,
 )
-from .events import (
-    UserCreatedEvent,
-    UserUpdatedEvent,
-    UserDeletedEvent,
-    UserProfileCreatedEvent,
-    UserProfileUpdatedEvent,
-)
+from .model import User
+from .service import AuthService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -36,13 +31,6 @@ async def create_user(
     auth_service: AuthService = Depends(get_auth_service),
 ):
     user = await auth_service.create_user(user_data)
-    event = UserCreatedEvent(
-        user_id=user.id,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-    )
-    await event.publish()
     return to_user_schema(user)
 
 
@@ -58,13 +46,6 @@ async def update_me(
     auth_service: AuthService = Depends(get_auth_service),
 ):
     updated_user = await auth_service.update_user(user.id, user_data)
-    event = UserUpdatedEvent(
-        user_id=updated_user.id,
-        first_name=updated_user.first_name,
-        last_name=updated_user.last_name,
-        is_active=updated_user.is_active,
-    )
-    await event.publish()
     return to_user_schema(updated_user)
 
 
@@ -74,8 +55,6 @@ async def delete_me(
     auth_service: AuthService = Depends(get_auth_service),
 ):
     await auth_service.delete_user(user.id)
-    event = UserDeletedEvent(user_id=user.id)
-    await event.publish()
 
 
 @router.post("/users/me/profile", response_model=UserProfileBase, status_code=status.HTTP_201_CREATED)
@@ -85,16 +64,6 @@ async def create_profile(
     auth_service: AuthService = Depends(get_auth_service),
 ):
     profile = await auth_service.create_profile(user.id, profile_data)
-    event = UserProfileCreatedEvent(
-        user_id=user.id,
-        bio=profile.bio,
-        avatar_url=profile.avatar_url,
-        job_title=profile.job_title,
-        company=profile.company,
-        location=profile.location,
-        website=profile.website,
-    )
-    await event.publish()
     return to_user_profile_schema(profile)
 
 
@@ -114,14 +83,4 @@ async def update_profile(
     auth_service: AuthService = Depends(get_auth_service),
 ):
     profile = await auth_service.update_profile(user.id, profile_data)
-    event = UserProfileUpdatedEvent(
-        user_id=user.id,
-        bio=profile.bio,
-        avatar_url=profile.avatar_url,
-        job_title=profile.job_title,
-        company=profile.company,
-        location=profile.location,
-        website=profile.website,
-    )
-    await event.publish()
     return to_user_profile_schema(profile) 
\ No newline at end of file
@@ -1,19 +1,26 @@
 from typing import Optional
 from uuid import UUID
 
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..common.exceptions import NotFoundException, UnauthorizedException
+from ..common.executor import password_executor
+from ..common.passwords import get_password_hasher
 from ..common.schemas import UserCreate, UserUpdate, UserProfileCreate, UserProfileUpdate
+from .events import (
+    UserCreatedEvent,
+    UserUpdatedEvent,
+    UserDeletedEvent,
+    UserProfileCreatedEvent,
+    UserProfileUpdatedEvent,
+)
 from .model import User, UserProfile
 from .repository import UserRepository, UserProfileRepository
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class AuthService:
     def __init__(self, session: AsyncSession):
+        self.session = session
         self.user_repo = UserRepository(session)
         self.profile_repo = UserProfileRepository(session)
 
@@ -26,10 +33,18 @@ async def create_user(self, user_data: UserCreate) -> User:
         # Create new user
         user = User(
             email=user_data.email,
-            password_hash=pwd_context.hash(user_data.password),
+            password_hash=await password_executor.run(get_password_hasher().hash, user_data.password),
             first_name=user_data.first_name,
             last_name=user_data.last_name,
         )
+        self.session.add(user)
+        await self.session.flush()
+        UserCreatedEvent(
+            user_id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+        ).stage(self.session)
         return await self.user_repo.create(user)
 
     async def get_user(self, user_id: UUID) -> Optional[User]:
@@ -46,16 +61,27 @@ async def update_user(self, user_id: UUID, user_data: UserUpdate) -> User:
             user.last_name = user_data.last_name
         if user_data.is_active is not None:
             user.is_active = user_data.is_active
+        UserUpdatedEvent(
+            user_id=user.id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            is_active=user.is_active,
+        ).stage(self.session)
         return await self.user_repo.update(user)
 
     async def delete_user(self, user_id: UUID) -> None:
         user = await self.get_user(user_id)
+        UserDeletedEvent(user_id=user.id).stage(self.session)
         await self.user_repo.delete(user)
 
     async def verify_password(self, email: str, password: str) -> Optional[User]:
         user = await self.user_repo.get_by_email(email)
-        if not user or not pwd_context.verify(password, user.password_hash):
+        hasher = get_password_hasher()
+        if not user or not await password_executor.run(hasher.verify, password, user.password_hash):
             return None
+        if hasher.needs_rehash(user.password_hash):
+            user.password_hash = await password_executor.run(hasher.hash, password)
+            user = await self.user_repo.update(user)
         return user
 
     async def create_profile(self, user_id: UUID, profile_data: UserProfileCreate) -> UserProfile:
@@ -69,6 +95,15 @@ async def create_profile(self, user_id: UUID, profile_data: UserProfileCreate) -
             location=profile_data.location,
             website=profile_data.website,
         )
+        UserProfileCreatedEvent(
+            user_id=user.id,
+            bio=profile.bio,
+            avatar_url=profile.avatar_url,
+            job_title=profile.job_title,
+            company=profile.company,
+            location=profile.location,
+            website=profile.website,
+        ).stage(self.session)
         return await self.profile_repo.create(profile)
 
     async def get_profile(self, user_id: UUID) -> Optional[UserProfile]:
@@ -91,4 +126,13 @@ async def update_profile(self, user_id: UUID, profile_data: UserProfileUpdate) -
             profile.location = profile_data.location
         if profile_data.website:
             profile.website = profile_data.website
+        UserProfileUpdatedEvent(
+            user_id=user_id,
+            bio=profile.bio,
+            avatar_url=profile.avatar_url,
+            job_title=profile.job_title,
+            company=profile.company,
+            location=profile.location,
+            website=profile.website,
+        ).stage(self.session)
         return await self.profile_repo.update(profile) 
\ No newline at end of file
@@ -0,0 +1,534 @@
+import asyncio
+import functools
+import inspect
+import math
+import pickle
+import random
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type
+from uuid import uuid4
+
+import orjson
+from pydantic import BaseModel
+
+from .config import get_settings
+from .logger import get_logger
+from .redis import get_async_binary_redis, get_binary_redis
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+# Redis entries are prefixed with (expires_at, compute time) for early expiry
+_ENTRY_HEADER = struct.Struct("!dd")
+
+# Delete the lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class _LoadCancelled(Exception):
+    """The request running a shared load was cancelled; waiters should load themselves."""
+
+
+class CacheSerializer(ABC):
+    """Encodes cached values for the Redis tier."""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value."""
+
+    @abstractmethod
+    def loads(self, payload: bytes) -> Any:
+        """Decode a value."""
+
+
+class PickleCacheSerializer(CacheSerializer):
+    """Pickle values; handles ORM instances and other arbitrary Python objects.
+
+    Anyone who can write to Redis can run code in every pod that reads a
+    pickled entry, so this is opt-in per cached function.
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, payload: bytes) -> Any:
+        return pickle.loads(payload)
+
+
+class JsonCacheSerializer(CacheSerializer):
+    """Encode JSON-compatible values with orjson; the default.
+
+    With ``model``, values are instances of that pydantic model and are
+    parsed back into it.
+    """
+
+    def __init__(self, model: Optional[Type[BaseModel]] = None):
+        self.model = model
+
+    def dumps(self, value: Any) -> bytes:
+        if self.model is not None:
+            value = value.dict()
+        return orjson.dumps(value)
+
+    def loads(self, payload: bytes) -> Any:
+        value = orjson.loads(payload)
+        if self.model is not None:
+            return self.model.parse_obj(value)
+        return value
+
+
+class LRUCache:
+    """Thread-safe, size-bounded in-process cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TwoTierCache:
+    """Read-through cache with an in-process LRU in front of Redis.
+
+    The local tier keeps a short TTL so entries evicted on another pod do
+    not linger for long; Redis holds the shared copy for the full TTL.
+    Both tiers hold serialized values and every read decodes its own copy,
+    so callers never share (or mutate) one cached object. Cached ORM
+    instances come back detached: only their loaded attributes are usable.
+
+    ``get_or_load`` protects hot keys from stampedes: concurrent misses in
+    one process share a single load, a Redis lock lets only one pod run the
+    loader while the others wait for its result, and entries are refreshed
+    early with a probability that grows as they approach expiry (XFetch), so
+    a hot key is usually recomputed before it expires at all.
+    """
+
+    def __init__(
+        self,
+        prefix: str = settings.CACHE_KEY_PREFIX,
+        serializer: Optional[CacheSerializer] = None,
+        local_maxsize: int = settings.CACHE_LOCAL_MAXSIZE,
+        local_ttl: float = settings.CACHE_LOCAL_TTL,
+        early_expiry_beta: float = settings.CACHE_EARLY_EXPIRY_BETA,
+    ):
+        self.prefix = prefix
+        self.serializer = serializer or JsonCacheSerializer()
+        self.local = LRUCache(maxsize=local_maxsize, ttl=local_ttl)
+        self.early_expiry_beta = early_expiry_beta
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.prefix}:lock:{key}"
+
+    def _encode(self, body: bytes, ttl: int, delta: float) -> bytes:
+        # Header: absolute expiry and how long the value took to compute
+        return _ENTRY_HEADER.pack(time.time() + ttl, delta) + body
+
+    def _decode(self, payload: bytes) -> Tuple[bytes, float, float]:
+        expires_at, delta = _ENTRY_HEADER.unpack_from(payload)
+        return payload[_ENTRY_HEADER.size:], expires_at, delta
+
+    def _get_local(self, key: str, serializer: CacheSerializer) -> Any:
+        body = self.local.get(key, _MISSING)
+        if body is _MISSING:
+            return _MISSING
+        return serializer.loads(body)
+
+    def _set_local(self, key: str, body: bytes, expires_at: float) -> None:
+        self.local.set(key, body, ttl=min(self.local.ttl, max(expires_at - time.time(), 0)))
+
+    def _should_refresh_early(self, expires_at: float, delta: float) -> bool:
+        if delta <= 0 or self.early_expiry_beta <= 0:
+            return False
+        return time.time() - delta * self.early_expiry_beta * math.log(random.random()) >= expires_at
+
+    async def _read(self, key: str) -> Optional[Tuple[bytes, float, float]]:
+        """Serialized value, expiry and compute time of the Redis entry."""
+        try:
+            payload = await get_async_binary_redis().get(self._redis_key(key))
+        except Exception as e:
+            logger.warning(
+                "Cache read failed",
+                extra={
+                    "key": key,
+                    "error": str(e),
+                },
+            )
+            return None
+        if payload is None:
+            return None
+        return self._decode(payload)
+
+    async def get(
+        self,
+        key: str,
+        default: Any = None,
+        serializer: Optional[CacheSerializer] = None,
+    ) -> Any:
+        """Get a value from the local tier, falling back to Redis."""
+        serializer = serializer or self.serializer
+        value = self._get_local(key, serializer)
+        if value is not _MISSING:
+            return value
+
+        entry = await self._read(key)
+        if entry is None:
+            return default
+        body, expires_at, _ = entry
+        self._set_local(key, body, expires_at)
+        return serializer.loads(body)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = settings.CACHE_DEFAULT_TTL,
+        delta: float = 0.0,
+        serializer: Optional[CacheSerializer] = None,
+    ) -> None:
+        """Store a value in both tiers; ``delta`` is how long it took to compute."""
+        await self._store(key, (serializer or self.serializer).dumps(value), ttl, delta)
+
+    async def _store(self, key: str, body: bytes, ttl: int, delta: float) -> None:
+        self._set_local(key, body, time.time() + ttl)
+        try:
+            await get_async_binary_redis().set(
+                self._redis_key(key), self._encode(body, ttl, delta), ex=ttl
+            )
+        except Exception as e:
+            logger.warning(
+                "Cache write failed",
+                extra={
+                    "key": key,
+                    "error": str(e),
+                },
+            )
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = settings.CACHE_DEFAULT_TTL,
+        serializer: Optional[CacheSerializer] = None,
+    ) -> Any:
+        """Get a value, running ``loader`` at most once across the cluster on a miss."""
+        serializer = serializer or self.serializer
+        value = self._get_local(key, serializer)
+        if value is not _MISSING:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                body = await asyncio.shield(inflight)
+            except _LoadCancelled:
+                # Our own request is still alive; take over the load
+                return await self.get_or_load(key, loader, ttl, serializer)
+            return serializer.loads(body)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await self._load_shared(key, loader, ttl, serializer)
+        except asyncio.CancelledError:
+            # Only the leader's request was cancelled; do not fail the waiters with it
+            future.set_exception(_LoadCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; make sure an unobserved exception is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(body)
+            return serializer.loads(body)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load_shared(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        serializer: CacheSerializer,
+    ) -> bytes:
+        """Serialized value for a key, from Redis or from running ``loader``."""
+        entry = await self._read(key)
+        if entry is not None:
+            body, expires_at, delta = entry
+            if not self._should_refresh_early(expires_at, delta):
+                self._set_local(key, body, expires_at)
+                return body
+            # Refresh early if no other pod is already doing it, else serve the still-valid value
+            token = await self._acquire_lock(key)
+            if token is None:
+                return body
+            try:
+                return await self._load(key, loader, ttl, serializer)
+            finally:
+                await self._release_lock(key, token)
+
+        token = await self._acquire_lock(key)
+        if token is None:
+            body = await self._wait_for_value(key)
+            if body is not _MISSING:
+                return body
+            # The lock holder did not produce a value in time; load it ourselves
+            return await self._load(key, loader, ttl, serializer)
+        try:
+            return await self._load(key, loader, ttl, serializer)
+        finally:
+            await self._release_lock(key, token)
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        serializer: CacheSerializer,
+    ) -> bytes:
+        started = time.monotonic()
+        body = serializer.dumps(await loader())
+        await self._store(key, body, ttl, time.monotonic() - started)
+        return body
+
+    async def _wait_for_value(self, key: str) -> Any:
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            entry = await self._read(key)
+            if entry is not None:
+                body, expires_at, _ = entry
+                self._set_local(key, body, expires_at)
+                return body
+        return _MISSING
+
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """Try to take the cluster-wide load lock for a key, returning its token."""
+        token = uuid4().hex
+        try:
+            acquired = await get_async_binary_redis().set(
+                self._lock_key(key),
+                token,
+                nx=True,
+                px=int(settings.CACHE_LOCK_TTL * 1000),
+            )
+        except Exception as e:
+            logger.warning(
+                "Cache lock failed",
+                extra={
+                    "key": key,
+                    "error": str(e),
+                },
+            )
+            # Without Redis, fall back to per-process single-flight
+            return token
+        return token if acquired else None
+
+    async def _release_lock(self, key: str, token: str) -> None:
+        try:
+            await get_async_binary_redis().eval(_RELEASE_LOCK_SCRIPT, 1, self._lock_key(key), token)
+        except Exception as e:
+            logger.warning(
+                "Cache lock release failed",
+                extra={
+                    "key": key,
+                    "error": str(e),
+                },
+            )
+
+    async def invalidate(self, *keys: str) -> None:
+        """Evict keys from both tiers."""
+        if not keys:
+            return
+        for key in keys:
+            self.local.delete(key)
+        try:
+            async with get_async_binary_redis().pipeline(transaction=False) as pipe:
+                pipe.delete(*(self._redis_key(key) for key in keys))
+                # Evict the local tiers of every other pod
+                pipe.publish(self.invalidation_channel, orjson.dumps(list(keys)))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "Cache invalidation failed",
+                extra={
+                    "keys": list(keys),
+                    "error": str(e),
+                },
+            )
+
+    @property
+    def invalidation_channel(self) -> str:
+        return f"{self.prefix}:invalidations"
+
+
+# Default cache shared by service-level decorators
+cache = TwoTierCache()
+
+
+class CacheInvalidationListener:
+    """Evicts local-tier entries when any pod invalidates them.
+
+    Subscribes to the cache's Redis pub/sub channel from a background
+    thread; the LRU tier is thread-safe so evictions apply directly.
+    """
+
+    def __init__(self, target: TwoTierCache):
+        self.target = target
+        self._pubsub = None
+        self._thread = None
+
+    def start(self) -> None:
+        self._pubsub = get_binary_redis().pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.target.invalidation_channel: self._on_message})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=self._on_error
+        )
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread.join(timeout=5)
+        if self._pubsub is not None:
+            self._pubsub.close()
+        self._pubsub, self._thread = None, None
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        try:
+            keys = orjson.loads(message["data"])
+        except orjson.JSONDecodeError:
+            return
+        for key in keys:
+            self.target.local.delete(key)
+
+    def _on_error(self, e: Exception, pubsub, thread) -> None:
+        # Entries may be stale until the connection comes back; drop them all
+        logger.warning(
+            "Cache invalidation listener error",
+            extra={
+                "error": str(e),
+            },
+        )
+        self.target.local.clear()
+        time.sleep(1.0)
+
+
+_listener: Optional[CacheInvalidationListener] = None
+
+
+def start_cache_invalidation_listener() -> None:
+    """Start evicting the default cache's local tier on invalidations from other pods."""
+    global _listener
+    if _listener is not None:
+        return
+    _listener = CacheInvalidationListener(cache)
+    _listener.start()
+
+
+def stop_cache_invalidation_listener() -> None:
+    """Stop the local-tier invalidation listener."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+
+
+def _format_key(template: str, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> str:
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return template.format(**bound.arguments)
+
+
+def cached(
+    key: str,
+    ttl: int = settings.CACHE_DEFAULT_TTL,
+    cache_instance: Optional[TwoTierCache] = None,
+    serializer: Optional[CacheSerializer] = None,
+):
+    """Cache an async function's result under ``key``, formatted from its arguments.
+
+    Results are stored as JSON unless another ``serializer`` is given.
+
+    Example::
+
+        @cached(key="course:{course_id}", ttl=600, serializer=JsonCacheSerializer(CourseResponse))
+        async def get_course(self, course_id: UUID) -> CourseResponse:
+            ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = _format_key(key, func, args, kwargs)
+            return await (cache_instance or cache).get_or_load(
+                cache_key, lambda: func(*args, **kwargs), ttl=ttl, serializer=serializer
+            )
+        return wrapper
+    return decorator
+
+
+def cache_evict(*keys: str, cache_instance: Optional[TwoTierCache] = None):
+    """Evict the formatted ``keys`` after the decorated async function succeeds."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            await (cache_instance or cache).invalidate(
+                *(_format_key(key, func, args, kwargs) for key in keys)
+            )
+            return result
+        return wrapper
+    return decorator
+
+
+async def invalidate(*keys: str) -> None:
+    """Evict keys from the default cache."""
+    await cache.invalidate(*keys)
@@ -16,7 +16,43 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
-    ALGORITHM: str = "HS256"
+    # JWTs: RS256/EdDSA sign with keys from JWT_KEYS_DIR; HS256 uses JWT_SECRET_KEY,
+    # which defaults to SECRET_KEY
+    JWT_ALGORITHM: str = "HS256"
+    JWT_SECRET_KEY: Optional[str] = None
+    JWT_KEYS_DIR: str = "keys/jwt"
+    JWT_ACTIVE_KID: Optional[str] = None
+    JWT_VERIFIED_CACHE_SIZE: int = 100000
+    JWT_VERIFIED_CACHE_MAX_TTL: float = 900.0
+    # Where get_current_user gets the user from: claims, cache or database
+    AUTH_CURRENT_USER_SOURCE: str = "cache"
+    AUTH_USER_CACHE_TTL: int = 60
+    # Rate limiting, enforced by RateLimitMiddleware
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_KEY_PREFIX: str = "ratelimit"
+    RATE_LIMIT_DEFAULT_PER_MINUTE: int = 600
+    RATE_LIMIT_LOGIN_PER_MINUTE: int = 10
+    RATE_LIMIT_REGISTER_PER_HOUR: int = 20
+    RATE_LIMIT_API_KEY_HEADER: str = "X-API-Key"
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+    # Revoked token jtis, mirrored into a per-pod Bloom filter
+    TOKEN_REVOCATION_FILTER_CAPACITY: int = 100000
+    TOKEN_REVOCATION_REBUILD_INTERVAL: float = 300.0
+    # Password hashing: bcrypt or argon2id. Costs are pinned fleet-wide; measure them for
+    # the target latency offline with ``python -m src.common.passwords``
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    PASSWORD_HASH_TARGET_MS: float = 250.0
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_COST: int = 65536
+    PASSWORD_ARGON2_PARALLELISM: int = 1
+    # Bounded pool for bcrypt; calls beyond workers + queue get a 503
+    PASSWORD_HASHING_WORKERS: int = 4
+    PASSWORD_HASHING_QUEUE_SIZE: int = 64
+
+    @validator("JWT_SECRET_KEY", always=True)
+    def default_jwt_secret_key(cls, v: Optional[str], values: dict) -> Optional[str]:
+        return v or values.get("SECRET_KEY")
 
     # Database
     POSTGRES_SERVER: str
@@ -24,6 +60,12 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30
+    # Read replicas; reads go to the primary for this long after a write
+    SQLALCHEMY_REPLICA_URIS: List[str] = []
+    DATABASE_PRIMARY_STICKINESS_SECONDS: float = 2.0
 
     @validator("SQLALCHEMY_DATABASE_URI", pre=True)
     def assemble_db_connection(cls, v: Optional[str], values: dict) -> str:
@@ -43,6 +85,24 @@ def assemble_db_connection(cls, v: Optional[str], values: dict) -> str:
     REDIS_PASSWORD: Optional[str] = None
     REDIS_DB: int = 0
     REDIS_URI: Optional[RedisDsn] = None
+    REDIS_MAX_CONNECTIONS: int = 100
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    # Two-tier cache (in-process LRU in front of Redis)
+    CACHE_KEY_PREFIX: str = "cache"
+    CACHE_DEFAULT_TTL: int = 300
+    CACHE_LOCAL_MAXSIZE: int = 10000
+    CACHE_LOCAL_TTL: float = 30.0
+    # Stampede protection: cross-pod load lock and probabilistic early refresh
+    CACHE_LOCK_TTL: float = 10.0
+    CACHE_LOCK_WAIT_TIMEOUT: float = 5.0
+    CACHE_LOCK_POLL_INTERVAL: float = 0.05
+    CACHE_EARLY_EXPIRY_BETA: float = 1.0
+    # Evict cache entries from course and user domain events
+    CACHE_INVALIDATION_ENABLED: bool = True
+    CACHE_INVALIDATION_GROUP_ID: str = "cache-invalidation"
 
     @validator("REDIS_URI", pre=True)
     def assemble_redis_connection(cls, v: Optional[str], values: dict) -> str:
@@ -59,12 +119,53 @@ def assemble_redis_connection(cls, v: Optional[str], values: dict) -> str:
     # Kafka
     KAFKA_BOOTSTRAP_SERVERS: str
     KAFKA_TOPIC_PREFIX: str = "elearning"
+    KAFKA_LINGER_MS: int = 5
+    KAFKA_BATCH_SIZE: int = 131072
+    KAFKA_COMPRESSION_TYPE: str = "lz4"
+    KAFKA_ACKS: str = "all"
+    KAFKA_QUEUE_MAX_MESSAGES: int = 100000
+    # How long produce waits for room when the local queue is full
+    KAFKA_QUEUE_FULL_TIMEOUT: float = 1.0
+    KAFKA_FLUSH_TIMEOUT: float = 10.0
+    KAFKA_EVENT_SERIALIZER: str = "json"  # json or protobuf
+    KAFKA_CONSUMER_BATCH_SIZE: int = 500
+    KAFKA_CONSUMER_POLL_TIMEOUT: float = 1.0
+    KAFKA_CONSUMER_MAX_CONCURRENCY: int = 32
+    KAFKA_CONSUMER_MAX_RETRIES: int = 3
+    KAFKA_CONSUMER_RETRY_BACKOFF: float = 0.2
+    # Dead letters go to <prefix>.<topic>, outside every <KAFKA_TOPIC_PREFIX>.* subscription
+    KAFKA_DEAD_LETTER_PREFIX: str = "dlq"
+
+    # Transactional outbox relay
+    OUTBOX_RELAY_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL: float = 0.5
 
     # Elasticsearch
     ELASTICSEARCH_HOST: str
     ELASTICSEARCH_PORT: int = 9200
     ELASTICSEARCH_USERNAME: Optional[str] = None
     ELASTICSEARCH_PASSWORD: Optional[str] = None
+    # Bulk indexing: a chunk is flushed at whichever limit is hit first
+    ELASTICSEARCH_BULK_CHUNK_SIZE: int = 500
+    ELASTICSEARCH_BULK_MAX_CHUNK_BYTES: int = 10 * 1024 * 1024
+    ELASTICSEARCH_BULK_MAX_CONCURRENCY: int = 4
+    ELASTICSEARCH_BULK_MAX_RETRIES: int = 5
+    ELASTICSEARCH_BULK_INITIAL_BACKOFF: float = 0.5
+    ELASTICSEARCH_BULK_MAX_BACKOFF: float = 30.0
+    # Versioned indices behind aliases: settings restored once a rebuild is loaded
+    ELASTICSEARCH_NUMBER_OF_REPLICAS: int = 1
+    ELASTICSEARCH_REFRESH_INTERVAL: str = "1s"
+    ELASTICSEARCH_KEEP_INDEX_VERSIONS: int = 1
+    ELASTICSEARCH_HEALTH_TIMEOUT: str = "60s"
+    # How long a search_after cursor's point-in-time stays open between pages
+    ELASTICSEARCH_PIT_KEEP_ALIVE: str = "1m"
+    # Course autocomplete: per-pod cache of suggestions by prefix
+    SEARCH_SUGGEST_CACHE_SIZE: int = 10000
+    SEARCH_SUGGEST_CACHE_TTL: float = 30.0
+    # Course search projection fed by course/module/lesson events
+    SEARCH_PROJECTION_ENABLED: bool = True
+    SEARCH_PROJECTION_GROUP_ID: str = "course-search-projection"
 
     # MinIO (S3-compatible storage)
     MINIO_ENDPOINT: str
@@ -85,6 +186,13 @@ def assemble_redis_connection(cls, v: Optional[str], values: dict) -> str:
     OIDC_ISSUER: str
     OIDC_CLIENT_ID: str
     OIDC_CLIENT_SECRET: str
+    # Discovery/JWKS cache; Cache-Control max-age wins within these bounds
+    OIDC_METADATA_DEFAULT_TTL: int = 3600
+    OIDC_METADATA_MIN_TTL: int = 60
+    OIDC_HTTP_TIMEOUT: float = 5.0
+    OIDC_CLOCK_SKEW: int = 60
+    # Lifetime of the server-side token set behind an OIDC session
+    OIDC_SESSION_TTL: int = 86400
 
     class Config:
         case_sensitive = True
@@ -0,0 +1,234 @@
+import asyncio
+import fnmatch
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from confluent_kafka import Message
+
+from .config import get_settings
+from .exceptions import MessageQueueException
+from .kafka import KafkaConsumer, get_producer
+from .logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+BatchHook = Callable[[], Awaitable[None]]
+
+
+class EventConsumer:
+    """Batch consumer that dispatches decoded events to registered async handlers.
+
+    Each polled batch is split by message key: events sharing a key are
+    handled one after another in offset order, different keys run
+    concurrently up to ``max_concurrency``. Once the whole batch is handled
+    the ``after_batch`` hooks run, then offsets are committed; a failing
+    hook rewinds the batch so it is delivered again. A message whose handler keeps failing after
+    ``max_retries`` attempts, or that cannot be decoded, is copied to
+    ``<KAFKA_DEAD_LETTER_PREFIX>.<topic>`` so it does not block the partition.
+
+    Usage::
+
+        consumer = EventConsumer("search-indexer")
+
+        @consumer.handler("course.created", "course.updated")
+        async def index_course(event):
+            ...
+
+        await consumer.run()
+    """
+
+    def __init__(
+        self,
+        group_id: str,
+        batch_size: int = settings.KAFKA_CONSUMER_BATCH_SIZE,
+        poll_timeout: float = settings.KAFKA_CONSUMER_POLL_TIMEOUT,
+        max_concurrency: int = settings.KAFKA_CONSUMER_MAX_CONCURRENCY,
+        max_retries: int = settings.KAFKA_CONSUMER_MAX_RETRIES,
+        retry_backoff: float = settings.KAFKA_CONSUMER_RETRY_BACKOFF,
+    ):
+        self.group_id = group_id
+        self.batch_size = batch_size
+        self.poll_timeout = poll_timeout
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.handlers: Dict[str, List[EventHandler]] = {}
+        self.batch_hooks: List[BatchHook] = []
+        self._stopped = asyncio.Event()
+        # The underlying consumer is only ever touched from this one thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"kafka-consumer-{group_id}")
+
+    def handler(self, *event_types: str) -> Callable[[EventHandler], EventHandler]:
+        """Register a handler for event types; ``*`` patterns such as ``course.*`` are allowed."""
+        def decorator(func: EventHandler) -> EventHandler:
+            for event_type in event_types:
+                self.handlers.setdefault(event_type, []).append(func)
+            return func
+        return decorator
+
+    def after_batch(self, func: BatchHook) -> BatchHook:
+        """Register a coroutine to run after every batch, before its offsets are committed."""
+        self.batch_hooks.append(func)
+        return func
+
+    def stop(self) -> None:
+        """Ask the consumer loop to exit after the current batch."""
+        self._stopped.set()
+
+    async def run(self) -> None:
+        """Poll, dispatch and commit batches until stopped."""
+        consumer = KafkaConsumer(self.group_id, enable_auto_commit=False)
+        consumer.subscribe(sorted(self.handlers))
+        try:
+            while not self._stopped.is_set():
+                try:
+                    messages = await self._in_consumer_thread(
+                        consumer.consume_batch, self.batch_size, self.poll_timeout
+                    )
+                except Exception as e:
+                    # Broker errors and rebalances are transient; keep polling
+                    logger.error(
+                        "Failed to poll batch",
+                        extra={
+                            "group_id": self.group_id,
+                            "error": str(e),
+                        },
+                    )
+                    await asyncio.sleep(self.retry_backoff)
+                    continue
+                if not messages:
+                    continue
+                try:
+                    await self.process_batch(messages)
+                    await self._in_consumer_thread(consumer.commit, messages)
+                except Exception as e:
+                    logger.error(
+                        "Failed to process batch",
+                        extra={
+                            "group_id": self.group_id,
+                            "size": len(messages),
+                            "error": str(e),
+                        },
+                    )
+                    await self._in_consumer_thread(consumer.rewind, messages)
+                    await asyncio.sleep(self.retry_backoff)
+        finally:
+            await self._in_consumer_thread(consumer.close)
+            self._executor.shutdown(wait=False)
+
+    async def process_batch(self, messages: List[Message]) -> None:
+        """Handle a batch with per-key ordering and bounded concurrency."""
+        by_key: "OrderedDict[Optional[bytes], List[Message]]" = OrderedDict()
+        for msg in messages:
+            by_key.setdefault(msg.key(), []).append(msg)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        dead_letters: List[Message] = []
+
+        async def handle_key(key_messages: List[Message]) -> None:
+            async with semaphore:
+                for msg in key_messages:
+                    if not await self._handle(msg):
+                        dead_letters.append(msg)
+
+        await asyncio.gather(*(handle_key(key_messages) for key_messages in by_key.values()))
+
+        for hook in self.batch_hooks:
+            await hook()
+        if dead_letters:
+            await self._dead_letter(dead_letters)
+
+    async def _handle(self, msg: Message) -> bool:
+        """Run the handlers for one message, returning False if it should be dead-lettered."""
+        try:
+            event = KafkaConsumer.decode(msg)["value"]
+        except Exception as e:
+            logger.error(
+                "Failed to decode message",
+                extra={
+                    "topic": msg.topic(),
+                    "offset": msg.offset(),
+                    "error": str(e),
+                },
+            )
+            return False
+
+        handlers = self._handlers_for(event.get("event_type", ""))
+        for attempt in range(self.max_retries + 1):
+            try:
+                for handler in handlers:
+                    await handler(event)
+                return True
+            except Exception as e:
+                logger.warning(
+                    "Event handler failed",
+                    extra={
+                        "event_type": event.get("event_type"),
+                        "event_id": event.get("event_id"),
+                        "attempt": attempt + 1,
+                        "error": str(e),
+                    },
+                )
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+        return False
+
+    def _handlers_for(self, event_type: str) -> List[EventHandler]:
+        handlers = []
+        for pattern, pattern_handlers in self.handlers.items():
+            if fnmatch.fnmatchcase(event_type, pattern):
+                handlers.extend(pattern_handlers)
+        return handlers
+
+    async def _dead_letter(self, messages: List[Message]) -> None:
+        """Copy poison messages to their dead-letter topics and wait for delivery."""
+        producer = get_producer()
+        for msg in messages:
+            headers = list(msg.headers() or [])
+            headers.append(("x-original-partition", str(msg.partition())))
+            headers.append(("x-original-offset", str(msg.offset())))
+            headers.append(("x-consumer-group", self.group_id))
+            await producer.produce_raw(
+                KafkaConsumer.dead_letter_topic(msg.topic()),
+                msg.key(),
+                msg.value(),
+                headers,
+            )
+            logger.error(
+                "Message dead-lettered",
+                extra={
+                    "topic": msg.topic(),
+                    "partition": msg.partition(),
+                    "offset": msg.offset(),
+                },
+            )
+
+        remaining = await asyncio.get_running_loop().run_in_executor(
+            None, producer.flush, settings.KAFKA_FLUSH_TIMEOUT
+        )
+        if remaining:
+            raise MessageQueueException(f"{remaining} dead-letter messages not delivered")
+
+    async def _in_consumer_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+
+_consumer_tasks: Dict[EventConsumer, asyncio.Task] = {}
+
+
+def start_consumer(consumer: EventConsumer) -> None:
+    """Run an event consumer as a background task of the running loop."""
+    if consumer in _consumer_tasks:
+        return
+    _consumer_tasks[consumer] = asyncio.create_task(consumer.run())
+
+
+async def stop_consumers() -> None:
+    """Stop every background consumer and wait for its current batch."""
+    for consumer in _consumer_tasks:
+        consumer.stop()
+    await asyncio.gather(*_consumer_tasks.values(), return_exceptions=True)
+    _consumer_tasks.clear()
@@ -1,28 +1,178 @@
-from typing import Generator
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncGenerator, Iterator, List, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
 
 from .config import get_settings
 
 settings = get_settings()
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI),
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+# Cookie carrying the primary-stickiness deadline between requests
+PRIMARY_STICKINESS_COOKIE = "db_primary_until"
+
+
+def get_async_database_uri(uri: str) -> str:
+    """Point a plain PostgreSQL URI at the asyncpg driver."""
+    scheme, separator, rest = uri.partition("://")
+    if scheme in ("postgres", "postgresql"):
+        return f"postgresql+asyncpg{separator}{rest}"
+    return uri
+
+
+def _create_engine(uri: str) -> AsyncEngine:
+    return create_async_engine(
+        get_async_database_uri(uri),
+        pool_pre_ping=True,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    )
+
+
+# Create async SQLAlchemy engines
+engine = _create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+replica_engines: List[AsyncEngine] = [
+    _create_engine(uri) for uri in settings.SQLALCHEMY_REPLICA_URIS
+]
+
+
+@dataclass
+class RoutingState:
+    """Per-request routing decisions shared by every session of that request."""
+
+    force_primary: bool = False
+    primary_until: float = 0.0
+    wrote: bool = False
+
+
+_routing_state: ContextVar[Optional[RoutingState]] = ContextVar("routing_state", default=None)
+
+
+class RoutingSession(Session):
+    """Session that sends plain reads to a replica and everything else to the primary.
+
+    Reads stay on the primary when the request or session asked for it, while
+    the session has pending writes, and for a stickiness window after a write
+    so that clients read their own writes despite replication lag.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if self._is_write(clause):
+            self._record_write()
+            return engine.sync_engine
+        if not self._is_plain_read(clause) or self._use_primary():
+            return engine.sync_engine
+        return random.choice(replica_engines).sync_engine
+
+    def _is_write(self, clause) -> bool:
+        return self._flushing or getattr(clause, "is_dml", False)
+
+    @staticmethod
+    def _is_plain_read(clause) -> bool:
+        if not getattr(clause, "is_select", False):
+            return False
+        return getattr(clause, "_for_update_arg", None) is None
+
+    def _use_primary(self) -> bool:
+        if not replica_engines or self.info.get("force_primary") or self.info.get("wrote"):
+            return True
+        state = _routing_state.get()
+        if state is None:
+            return False
+        return state.force_primary or state.primary_until > time.time()
+
+    def _record_write(self) -> None:
+        self.info["wrote"] = True
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+            state.primary_until = time.time() + settings.DATABASE_PRIMARY_STICKINESS_SECONDS
+
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Declarative base for ORM models
+Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Get database session."""
-    db = SessionLocal()
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """Route every read issued inside the block to the primary."""
+    state = _routing_state.get()
+    if state is None:
+        token = _routing_state.set(RoutingState(force_primary=True))
+        try:
+            yield
+        finally:
+            _routing_state.reset(token)
+        return
+
+    previous = state.force_primary
+    state.force_primary = True
     try:
-        yield db
+        yield
     finally:
-        db.close() 
\ No newline at end of file
+        state.force_primary = previous
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session."""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_primary_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session whose reads always go to the primary."""
+    async with AsyncSessionLocal() as session:
+        session.sync_session.info["force_primary"] = True
+        yield session
+
+
+class DatabaseRoutingMiddleware(BaseHTTPMiddleware):
+    """Carry the primary-stickiness window across requests of the same client."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        try:
+            primary_until = float(request.cookies.get(PRIMARY_STICKINESS_COOKIE, 0))
+        except ValueError:
+            primary_until = 0.0
+
+        state = RoutingState(primary_until=primary_until)
+        token = _routing_state.set(state)
+        try:
+            response = await call_next(request)
+        finally:
+            _routing_state.reset(token)
+
+        if state.wrote:
+            response.set_cookie(
+                PRIMARY_STICKINESS_COOKIE,
+                str(state.primary_until),
+                max_age=max(1, int(settings.DATABASE_PRIMARY_STICKINESS_SECONDS) + 1),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
+
+async def close_engine() -> None:
+    """Dispose of the primary and replica connection pools."""
+    await engine.dispose()
+    for replica_engine in replica_engines:
+        await replica_engine.dispose()
@@ -1,9 +1,17 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import base64
+import binascii
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from elasticsearch import AsyncElasticsearch
-from elasticsearch.exceptions import NotFoundError
+from elasticsearch.exceptions import NotFoundError, RequestError, TransportError
 
+from .cache import LRUCache
 from .config import get_settings
+from .exceptions import BadRequestException, SearchException
 from .logger import get_logger
 
 settings = get_settings()
@@ -70,6 +78,211 @@ async def delete_index(index: str) -> bool:
         raise
 
 
+# Alias marking the index a rebuild is loading, so writers can keep it current
+BUILDING_ALIAS_SUFFIX = "_building"
+# How long a pod may keep writing to a stale list of targets
+WRITE_INDICES_TTL = 5.0
+
+_write_indices = LRUCache(maxsize=128, ttl=WRITE_INDICES_TTL)
+
+
+def versioned_index_name(alias: str, version: int) -> str:
+    return f"{alias}_v{version}"
+
+
+async def get_alias_indices(alias: str) -> List[str]:
+    """Concrete indices an alias points at."""
+    try:
+        response = await es_client.indices.get_alias(name=alias)
+    except NotFoundError:
+        return []
+    return sorted(response)
+
+
+async def get_index_versions(alias: str) -> Dict[str, int]:
+    """Existing ``<alias>_v<n>`` indices, by name."""
+    response = await es_client.indices.get(index=f"{alias}_v*")
+    versions = {}
+    for name in response:
+        suffix = name[len(alias) + 2:]
+        if suffix.isdigit():
+            versions[name] = int(suffix)
+    return versions
+
+
+async def get_write_indices(alias: str) -> List[str]:
+    """Indices writes for ``alias`` must go to: the live one plus any being rebuilt.
+
+    Cached for ``WRITE_INDICES_TTL`` seconds; rebuild_index waits that long
+    before loading so no pod is still writing to the old list alone.
+    """
+    indices = _write_indices.get(alias)
+    if indices is None:
+        indices = await get_alias_indices(alias)
+        indices += await get_alias_indices(alias + BUILDING_ALIAS_SUFFIX)
+        if not indices:
+            # Not aliased yet; write through the name itself
+            indices = [alias]
+        _write_indices.set(alias, indices)
+    return indices
+
+
+async def ensure_versioned_index(
+    alias: str,
+    mappings: Dict[str, Any],
+    index_settings: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Create the first version of ``alias`` if nothing answers to that name yet.
+
+    Returns the index created, or None if the alias (or a legacy concrete
+    index of that name) already exists or another pod created it first.
+    """
+    if await es_client.indices.exists(index=alias):
+        return None
+    versions = await get_index_versions(alias)
+    index = versioned_index_name(alias, max(versions.values(), default=0) + 1)
+    try:
+        await es_client.indices.create(
+            index=index,
+            body={
+                "settings": index_settings or {},
+                "mappings": mappings,
+                "aliases": {alias: {}},
+            },
+        )
+    except RequestError as e:
+        if e.error == "resource_already_exists_exception":
+            return None
+        raise
+    logger.info(
+        "Index created",
+        extra={
+            "index": index,
+            "alias": alias,
+        },
+    )
+    return index
+
+
+async def rebuild_index(
+    alias: str,
+    mappings: Dict[str, Any],
+    load: Callable[[str], Awaitable[Tuple[int, int]]],
+    index_settings: Optional[Dict[str, Any]] = None,
+    number_of_replicas: int = settings.ELASTICSEARCH_NUMBER_OF_REPLICAS,
+    refresh_interval: str = settings.ELASTICSEARCH_REFRESH_INTERVAL,
+    keep_versions: int = settings.ELASTICSEARCH_KEEP_INDEX_VERSIONS,
+) -> str:
+    """Build the next ``<alias>_v<n>`` index and atomically point ``alias`` at it.
+
+    The new index is loaded by ``load(index_name)``, which returns
+    (succeeded, failed) like bulk_index, with refresh disabled and no
+    replicas, which makes bulk loading much cheaper. If any document
+    failed to load, the new index is deleted and the alias left as it
+    was. Replicas and
+    refresh are restored and the index is refreshed before the swap, and
+    the swap waits for replicas to be allocated, so searches never see an
+    empty or under-replicated index. While it loads, the index carries the
+    ``<alias>_building`` alias so get_write_indices() sends live updates to
+    it too. The ``keep_versions`` most recent previous versions are kept
+    for rollback; older ones are deleted.
+    """
+    building_alias = alias + BUILDING_ALIAS_SUFFIX
+    # Left behind by a rebuild that died before it could clean up
+    for stale in await get_alias_indices(building_alias):
+        await es_client.indices.delete(index=stale, ignore=[404])
+
+    versions = await get_index_versions(alias)
+    index = versioned_index_name(alias, max(versions.values(), default=0) + 1)
+    await es_client.indices.create(
+        index=index,
+        body={
+            "settings": {
+                **(index_settings or {}),
+                "number_of_replicas": 0,
+                "refresh_interval": "-1",
+            },
+            "mappings": mappings,
+            "aliases": {building_alias: {}},
+        },
+    )
+    logger.info(
+        "Index rebuild started",
+        extra={
+            "index": index,
+            "alias": alias,
+        },
+    )
+
+    try:
+        await asyncio.sleep(WRITE_INDICES_TTL)
+        succeeded, failed = await load(index)
+        if failed:
+            raise SearchException(f"{failed} of {succeeded + failed} documents failed to load into {index}")
+
+        await es_client.indices.put_settings(
+            index=index,
+            body={
+                "index": {
+                    "number_of_replicas": number_of_replicas,
+                    "refresh_interval": refresh_interval,
+                },
+            },
+        )
+        await es_client.indices.refresh(index=index)
+        health = await es_client.cluster.health(
+            index=index,
+            wait_for_status="green",
+            timeout=settings.ELASTICSEARCH_HEALTH_TIMEOUT,
+        )
+        if health.get("timed_out"):
+            logger.warning(
+                "Rebuilt index not fully replicated before alias swap",
+                extra={
+                    "index": index,
+                    "status": health.get("status"),
+                },
+            )
+
+        previous = await get_alias_indices(alias)
+        actions = [{"remove": {"index": name, "alias": alias}} for name in previous]
+        if not previous and await es_client.indices.exists(index=alias):
+            # A legacy concrete index holds the name; drop it in the same step
+            actions.append({"remove_index": {"index": alias}})
+        actions += [
+            {"add": {"index": index, "alias": alias}},
+            {"remove": {"index": index, "alias": building_alias}},
+        ]
+        await es_client.indices.update_aliases(body={"actions": actions})
+    except Exception as e:
+        logger.error(
+            "Index rebuild failed",
+            extra={
+                "index": index,
+                "alias": alias,
+                "error": str(e),
+            },
+        )
+        await es_client.indices.delete(index=index, ignore=[404])
+        raise
+
+    _write_indices.delete(alias)
+    logger.info(
+        "Index alias swapped",
+        extra={
+            "index": index,
+            "alias": alias,
+            "previous": previous,
+        },
+    )
+
+    # Keep the newest previous versions for rollback, drop the rest
+    older = sorted(versions, key=versions.get, reverse=True)
+    for name in older[keep_versions:]:
+        await delete_index(name)
+    return index
+
+
 async def index_document(index: str, id: str, document: Dict[str, Any]) -> bool:
     """Index a document in Elasticsearch."""
     try:
@@ -120,6 +333,130 @@ async def get_document(index: str, id: str) -> Optional[Dict[str, Any]]:
         raise
 
 
+@dataclass
+class SearchPage:
+    """One page of search hits with the total, aggregations and the cursor to the next page."""
+
+    items: List[Dict[str, Any]]
+    total: int
+    aggregations: Dict[str, Any] = field(default_factory=dict)
+    next_cursor: Optional[str] = None
+
+
+def _encode_cursor(pit_id: Optional[str], search_after: List[Any]) -> str:
+    data: Dict[str, Any] = {"after": search_after}
+    if pit_id is not None:
+        data["pit"] = pit_id
+    data = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[str], List[Any]]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        pit_id, search_after = data.get("pit"), data["after"]
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+        raise BadRequestException("Invalid search cursor")
+    if not isinstance(search_after, list) or not (pit_id is None or isinstance(pit_id, str)):
+        raise BadRequestException("Invalid search cursor")
+    return pit_id, search_after
+
+
+async def _close_point_in_time(pit_id: str) -> None:
+    try:
+        await es_client.close_point_in_time(body={"id": pit_id})
+    except Exception as e:
+        # It expires on its own after keep_alive
+        logger.warning(
+            "Failed to close point in time",
+            extra={
+                "error": str(e),
+            },
+        )
+
+
+async def search_page(
+    index: str,
+    query: Dict[str, Any],
+    size: int = 10,
+    from_: int = 0,
+    cursor: Optional[str] = None,
+    paginate: bool = False,
+    point_in_time: bool = False,
+    track_total_hits: bool = True,
+    keep_alive: str = settings.ELASTICSEARCH_PIT_KEEP_ALIVE,
+) -> SearchPage:
+    """Search documents, keeping the total and aggregations of the response.
+
+    With ``paginate``, a page that may be followed by more hits carries a
+    ``next_cursor``: the sort values of its last hit. Passing that cursor
+    back, with the same query, fetches the next page with
+    ``search_after``, which costs the same at any depth, unlike ``from_``.
+    The query's sort must then end in a unique field, so no two hits tie.
+
+    Pages reflect the index as it is when each is fetched. Only with
+    ``point_in_time`` does the first page open a point in time that the
+    cursor pins every following page to; it is closed once the last page
+    is served.
+    """
+    body = dict(query)
+    body["track_total_hits"] = track_total_hits
+    pit_id = None
+    if cursor is not None:
+        paginate = True
+        pit_id, body["search_after"] = _decode_cursor(cursor)
+    elif paginate and point_in_time:
+        pit_id = (await es_client.open_point_in_time(index=index, keep_alive=keep_alive))["id"]
+    if paginate:
+        body.setdefault("sort", ["_score"])
+
+    try:
+        if pit_id is not None:
+            # The point in time adds a unique tiebreaker to the sort
+            body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+            response = await es_client.search(body=body, size=size)
+        elif cursor is not None:
+            response = await es_client.search(index=index, body=body, size=size)
+        else:
+            response = await es_client.search(index=index, body=body, size=size, from_=from_)
+    except NotFoundError:
+        if pit_id is not None and cursor is not None:
+            raise BadRequestException("Search cursor has expired")
+        raise
+    except RequestError:
+        if cursor is not None:
+            # search_after values that do not fit this query's sort
+            raise BadRequestException("Invalid search cursor")
+        raise
+    except Exception as e:
+        logger.error(
+            "Failed to search documents",
+            extra={
+                "index": index,
+                "error": str(e),
+            },
+        )
+        if pit_id is not None and cursor is None:
+            await _close_point_in_time(pit_id)
+        raise
+
+    hits = response["hits"]["hits"]
+    next_cursor = None
+    if pit_id is not None:
+        pit_id = response.get("pit_id", pit_id)
+    if paginate and len(hits) == size:
+        next_cursor = _encode_cursor(pit_id, hits[-1]["sort"])
+    elif pit_id is not None:
+        await _close_point_in_time(pit_id)
+
+    return SearchPage(
+        items=[hit["_source"] for hit in hits],
+        total=response["hits"]["total"]["value"] if track_total_hits else len(hits),
+        aggregations=response.get("aggregations", {}),
+        next_cursor=next_cursor,
+    )
+
+
 async def search_documents(
     index: str,
     query: Dict[str, Any],
@@ -127,17 +464,46 @@ async def search_documents(
     from_: int = 0,
 ) -> List[Dict[str, Any]]:
     """Search documents in Elasticsearch."""
+    page = await search_page(index, query, size=size, from_=from_, track_total_hits=False)
+    return page.items
+
+
+async def suggest_documents(
+    index: str,
+    field: str,
+    prefix: str,
+    size: int = 10,
+    source: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Completion suggestions for ``prefix`` from a completion ``field``.
+
+    Each option is the matched ``text`` plus the document's ``_source``
+    (limited to ``source`` fields if given).
+    """
     try:
         response = await es_client.search(
             index=index,
-            body=query,
-            size=size,
-            from_=from_,
+            body={
+                "_source": source if source is not None else True,
+                "suggest": {
+                    "suggestions": {
+                        "prefix": prefix,
+                        "completion": {
+                            "field": field,
+                            "size": size,
+                            "skip_duplicates": True,
+                        },
+                    },
+                },
+            },
         )
-        return [hit["_source"] for hit in response["hits"]["hits"]]
+        return [
+            {"text": option["text"], **option.get("_source", {})}
+            for option in response["suggest"]["suggestions"][0]["options"]
+        ]
     except Exception as e:
         logger.error(
-            "Failed to search documents",
+            "Failed to get suggestions",
             extra={
                 "index": index,
                 "error": str(e),
@@ -175,6 +541,212 @@ async def delete_document(index: str, id: str) -> bool:
         raise
 
 
+@dataclass
+class BulkItemError:
+    """A bulk item Elasticsearch rejected, or that could not be sent."""
+
+    id: Optional[str]
+    status: Any
+    error: Any
+
+
+@dataclass
+class BulkReport:
+    """Outcome of one bulk request, after its retries."""
+
+    batch: int
+    total: int
+    succeeded: int = 0
+    # Versioned items the index already held a newer version of
+    conflicts: int = 0
+    retries: int = 0
+    took: float = 0.0
+    errors: List[BulkItemError] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+
+# (document id, NDJSON lines, encoded size, externally versioned)
+_BulkItem = Tuple[Optional[str], str, int, bool]
+
+
+def _serialize_action(index: str, action: Dict[str, Any]) -> _BulkItem:
+    """Turn a ``{"_op_type", "_index", "_id", "_source"}`` action into bulk NDJSON lines.
+
+    An action with a ``_version`` is written with ``version_type=external``,
+    so Elasticsearch keeps whichever write carries the highest version.
+    """
+    op_type = action.get("_op_type", "index")
+    meta = {"_index": action.get("_index", index)}
+    if action.get("_id") is not None:
+        meta["_id"] = str(action["_id"])
+    versioned = action.get("_version") is not None
+    if versioned:
+        meta["version"] = action["_version"]
+        meta["version_type"] = "external"
+    lines = json.dumps({op_type: meta}, default=str) + "\n"
+    if op_type != "delete":
+        lines += json.dumps(action["_source"], default=str) + "\n"
+    return meta.get("_id"), lines, len(lines.encode("utf-8")), versioned
+
+
+async def _chunk_actions(
+    index: str,
+    actions: AsyncIterable[Dict[str, Any]],
+    chunk_size: int,
+    max_chunk_bytes: int,
+) -> AsyncIterator[List[_BulkItem]]:
+    chunk: List[_BulkItem] = []
+    chunk_bytes = 0
+    async for action in actions:
+        item = _serialize_action(index, action)
+        if chunk and (len(chunk) >= chunk_size or chunk_bytes + item[2] > max_chunk_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(item)
+        chunk_bytes += item[2]
+    if chunk:
+        yield chunk
+
+
+async def _send_chunk(
+    batch: int,
+    chunk: List[_BulkItem],
+    max_retries: int,
+    initial_backoff: float,
+    max_backoff: float,
+) -> BulkReport:
+    """Send one chunk, resending the items rejected with 429 until ``max_retries`` runs out."""
+    report = BulkReport(batch=batch, total=len(chunk))
+    started = time.perf_counter()
+    pending = chunk
+    attempt = 0
+    while pending:
+        retry: List[_BulkItem] = []
+        try:
+            response = await es_client.bulk(body="".join(item[1] for item in pending))
+        except TransportError as e:
+            if e.status_code == 429 and attempt < max_retries:
+                retry = pending
+            else:
+                report.errors.extend(
+                    BulkItemError(id=item[0], status=e.status_code, error=str(e)) for item in pending
+                )
+        else:
+            for item, result in zip(pending, response["items"]):
+                # Each result is keyed by its op type: {"index": {...}}
+                result = next(iter(result.values()))
+                status = result.get("status")
+                if status == 429 and attempt < max_retries:
+                    retry.append(item)
+                elif status == 409 and item[3]:
+                    # A newer version is already indexed; this write is obsolete
+                    report.conflicts += 1
+                elif "error" in result:
+                    report.errors.append(
+                        BulkItemError(id=result.get("_id", item[0]), status=status, error=result["error"])
+                    )
+                else:
+                    report.succeeded += 1
+
+        if retry:
+            await asyncio.sleep(min(max_backoff, initial_backoff * 2 ** attempt))
+            attempt += 1
+            report.retries += 1
+        pending = retry
+
+    report.took = time.perf_counter() - started
+    return report
+
+
+async def streaming_bulk(
+    index: str,
+    actions: AsyncIterable[Dict[str, Any]],
+    chunk_size: int = settings.ELASTICSEARCH_BULK_CHUNK_SIZE,
+    max_chunk_bytes: int = settings.ELASTICSEARCH_BULK_MAX_CHUNK_BYTES,
+    max_concurrency: int = settings.ELASTICSEARCH_BULK_MAX_CONCURRENCY,
+    max_retries: int = settings.ELASTICSEARCH_BULK_MAX_RETRIES,
+    initial_backoff: float = settings.ELASTICSEARCH_BULK_INITIAL_BACKOFF,
+    max_backoff: float = settings.ELASTICSEARCH_BULK_MAX_BACKOFF,
+) -> AsyncIterator[BulkReport]:
+    """Send actions with the bulk API, yielding a report per request as it completes.
+
+    Actions are consumed lazily and grouped into chunks of at most
+    ``chunk_size`` items or ``max_chunk_bytes`` bytes. At most
+    ``max_concurrency`` requests are in flight; the action stream is not
+    read further until one of them finishes, so memory stays bounded.
+    """
+    in_flight: Set[asyncio.Task] = set()
+    batch = 0
+    try:
+        async for chunk in _chunk_actions(index, actions, chunk_size, max_chunk_bytes):
+            if len(in_flight) >= max_concurrency:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            batch += 1
+            in_flight.add(
+                asyncio.create_task(
+                    _send_chunk(batch, chunk, max_retries, initial_backoff, max_backoff)
+                )
+            )
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+async def bulk_index(
+    index: str,
+    actions: AsyncIterable[Dict[str, Any]],
+    **kwargs: Any,
+) -> Tuple[int, int]:
+    """Bulk index a stream of actions, logging each batch; returns (succeeded, failed)."""
+    succeeded = failed = 0
+    started = time.perf_counter()
+    async for report in streaming_bulk(index, actions, **kwargs):
+        succeeded += report.succeeded
+        failed += report.failed
+        if report.errors:
+            logger.warning(
+                "Bulk batch had failures",
+                extra={
+                    "index": index,
+                    "batch": report.batch,
+                    "total": report.total,
+                    "failed": report.failed,
+                    "retries": report.retries,
+                    "errors": [vars(error) for error in report.errors[:10]],
+                },
+            )
+        else:
+            logger.debug(
+                "Bulk batch indexed",
+                extra={
+                    "index": index,
+                    "batch": report.batch,
+                    "total": report.total,
+                    "retries": report.retries,
+                    "took": report.took,
+                },
+            )
+    logger.info(
+        "Bulk indexing finished",
+        extra={
+            "index": index,
+            "succeeded": succeeded,
+            "failed": failed,
+            "took": time.perf_counter() - started,
+        },
+    )
+    return succeeded, failed
+
+
 async def close_connection() -> None:
     """Close Elasticsearch connection."""
     await es_client.close() 
\ No newline at end of file
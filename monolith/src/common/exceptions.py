@@ -1,3 +1,4 @@
+import math
 from typing import Any, Dict, Optional
 
 from fastapi import HTTPException, status
@@ -78,10 +79,11 @@ def __init__(self, detail: str = "Validation error") -> None:
 class RateLimitException(BaseAPIException):
     """Exception for rate limiting."""
 
-    def __init__(self, detail: str = "Rate limit exceeded") -> None:
+    def __init__(self, detail: str = "Rate limit exceeded", retry_after: Optional[float] = None) -> None:
         super().__init__(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))} if retry_after is not None else None,
         )
 
 
@@ -98,10 +100,11 @@ def __init__(self, detail: str = "Internal server error") -> None:
 class ServiceUnavailableException(BaseAPIException):
     """Exception for service unavailable."""
 
-    def __init__(self, detail: str = "Service unavailable") -> None:
+    def __init__(self, detail: str = "Service unavailable", retry_after: Optional[int] = None) -> None:
         super().__init__(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=detail,
+            headers={"Retry-After": str(retry_after)} if retry_after is not None else None,
         )
 
 
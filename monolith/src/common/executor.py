@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from .config import get_settings
+from .exceptions import ServiceUnavailableException
+from .logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class BoundedExecutor:
+    """Thread pool for CPU-heavy calls with a bounded queue and back-pressure.
+
+    Work that would wait behind more than ``max_queue`` other calls is
+    rejected with a 503 instead of piling up, so a burst on one endpoint
+    sheds load rather than stalling the whole pod. Only use it for work that
+    releases the GIL (bcrypt, argon2, compression), otherwise threads do not
+    add throughput.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` on the pool, raising ServiceUnavailableException when saturated."""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                rejected = True
+            else:
+                self._pending += 1
+                rejected = False
+        if rejected:
+            logger.warning(
+                "Executor saturated",
+                extra={
+                    "executor": self.name,
+                    "pending": self._pending,
+                },
+            )
+            raise ServiceUnavailableException("Server busy, try again shortly", retry_after=1)
+
+        submitted = time.monotonic()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._timed, submitted, func, *args
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _timed(self, submitted: float, func: Callable[..., Any], *args: Any) -> Any:
+        started = time.monotonic()
+        with self._lock:
+            self._running += 1
+            self._wait_seconds += started - submitted
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._run_seconds += time.monotonic() - started
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of queue depth, throughput and latency counters."""
+        with self._lock:
+            return {
+                "executor": self.name,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": self._wait_seconds / self._completed * 1000 if self._completed else 0.0,
+                "avg_run_ms": self._run_seconds / self._completed * 1000 if self._completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+# Password hashing and verification; bcrypt releases the GIL while hashing
+password_executor = BoundedExecutor(
+    "password-hashing",
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    max_queue=settings.PASSWORD_HASHING_QUEUE_SIZE,
+)
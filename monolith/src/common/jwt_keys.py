@@ -0,0 +1,180 @@
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+from .cache import LRUCache
+from .config import get_settings
+from .logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+
+# How often an unknown kid may trigger a reload of the key directory
+_RELOAD_MIN_INTERVAL = 30.0
+
+
+class KeyRing:
+    """Signing and verification keys for JWTs, selected by ``kid``.
+
+    Keys live in ``JWT_KEYS_DIR``: ``<kid>.key`` holds a PEM private key
+    that can sign, ``<kid>.pub`` a PEM public key that can only verify.
+    Rotation is adding a new key, pointing ``JWT_ACTIVE_KID`` at it, and
+    removing the old one once every token it signed has expired.
+    With HS256 the single ``JWT_SECRET_KEY`` is used under kid ``default``.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = settings.JWT_ALGORITHM,
+        keys_dir: Optional[str] = settings.JWT_KEYS_DIR,
+        active_kid: Optional[str] = settings.JWT_ACTIVE_KID,
+        secret_key: Optional[str] = settings.JWT_SECRET_KEY,
+    ):
+        self.algorithm = algorithm
+        self.keys_dir = keys_dir
+        self.active_kid = active_kid
+        self.secret_key = secret_key
+        self._private_keys: Dict[str, Any] = {}
+        self._public_keys: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._loaded_at = 0.0
+        self._reloading = False
+        self.load()
+
+    def load(self) -> None:
+        """(Re)load keys from the key directory."""
+        if self.algorithm not in ASYMMETRIC_ALGORITHMS:
+            if not self.secret_key:
+                raise ValueError(f"{self.algorithm} requires JWT_SECRET_KEY")
+            self._private_keys = {"default": self.secret_key}
+            self._public_keys = {"default": self.secret_key}
+            return
+
+        private_keys, public_keys = {}, {}
+        for path in sorted(Path(self.keys_dir).glob("*.key")):
+            key = serialization.load_pem_private_key(path.read_bytes(), password=None)
+            private_keys[path.stem] = key
+            public_keys[path.stem] = key.public_key()
+        for path in sorted(Path(self.keys_dir).glob("*.pub")):
+            public_keys.setdefault(path.stem, serialization.load_pem_public_key(path.read_bytes()))
+        if not private_keys:
+            raise ValueError(f"No JWT signing keys found in {self.keys_dir}")
+        if self.active_kid is not None and self.active_kid not in private_keys:
+            raise ValueError(f"Active JWT key {self.active_kid} has no private key")
+
+        with self._lock:
+            self._private_keys = private_keys
+            self._public_keys = public_keys
+            self._loaded_at = time.monotonic()
+        logger.info(
+            "JWT keys loaded",
+            extra={
+                "signing": sorted(private_keys),
+                "verifying": sorted(public_keys),
+            },
+        )
+
+    def _reload_in_background(self) -> None:
+        """Start one background reload, at most every ``_RELOAD_MIN_INTERVAL`` seconds."""
+        with self._lock:
+            if self._reloading or time.monotonic() - self._loaded_at <= _RELOAD_MIN_INTERVAL:
+                return
+            self._reloading = True
+        threading.Thread(target=self._reload, name="jwt-key-reload", daemon=True).start()
+
+    def _reload(self) -> None:
+        try:
+            self.load()
+        except Exception:
+            # Keep verifying with the keys we have
+            logger.exception("Failed to reload JWT keys", extra={"keys_dir": self.keys_dir})
+        finally:
+            with self._lock:
+                self._loaded_at = time.monotonic()
+                self._reloading = False
+
+    def signing_key(self) -> Tuple[str, Any]:
+        """The kid and key new tokens are signed with."""
+        kid = self.active_kid or max(self._private_keys)
+        return kid, self._private_keys[kid]
+
+    def verification_key(self, kid: Optional[str]) -> Any:
+        if self.algorithm not in ASYMMETRIC_ALGORITHMS:
+            return self.secret_key
+        key = self._public_keys.get(kid)
+        if key is None:
+            # The key may have been rotated in since we loaded. Reading the
+            # directory would block the event loop, so pick it up in the
+            # background and reject this token.
+            self._reload_in_background()
+            raise jwt.InvalidKeyError(f"Unknown key id: {kid}")
+        return key
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Public keys as a JSON Web Key Set, for services that verify our tokens."""
+        keys = []
+        for kid, key in sorted(self._public_keys.items()):
+            if isinstance(key, rsa.RSAPublicKey):
+                jwk = json.loads(RSAAlgorithm.to_jwk(key))
+            elif isinstance(key, ed25519.Ed25519PublicKey):
+                jwk = json.loads(OKPAlgorithm.to_jwk(key))
+            else:
+                continue
+            jwk.update({"kid": kid, "use": "sig", "alg": self.algorithm})
+            keys.append(jwk)
+        return {"keys": keys}
+
+
+_key_ring: Optional[KeyRing] = None
+# Payloads of tokens whose signature this pod already checked, keyed by token hash
+_verified_tokens = LRUCache(maxsize=settings.JWT_VERIFIED_CACHE_SIZE)
+
+
+def get_key_ring() -> KeyRing:
+    global _key_ring
+    if _key_ring is None:
+        _key_ring = KeyRing()
+    return _key_ring
+
+
+def encode_token(payload: Dict[str, Any]) -> str:
+    """Sign a JWT with the active key, naming it in the ``kid`` header."""
+    key_ring = get_key_ring()
+    kid, key = key_ring.signing_key()
+    return jwt.encode(payload=payload, key=key, algorithm=key_ring.algorithm, headers={"kid": kid})
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """Verify a JWT and return its claims, raising jwt.PyJWTError if invalid.
+
+    A token's signature is verified once per pod; later calls are served
+    from a bounded LRU until the token expires.
+    """
+    token_hash = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _verified_tokens.get(token_hash)
+    if payload is not None:
+        if payload.get("exp", float("inf")) > time.time():
+            return dict(payload)
+        _verified_tokens.delete(token_hash)
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    key_ring = get_key_ring()
+    kid = jwt.get_unverified_header(token).get("kid")
+    payload = jwt.decode(
+        token,
+        key=key_ring.verification_key(kid),
+        algorithms=[key_ring.algorithm],
+    )
+    ttl = payload["exp"] - time.time() if "exp" in payload else settings.JWT_VERIFIED_CACHE_MAX_TTL
+    _verified_tokens.set(token_hash, payload, ttl=min(ttl, settings.JWT_VERIFIED_CACHE_MAX_TTL))
+    return dict(payload)
@@ -1,31 +1,85 @@
-from typing import Any, Dict, Optional
+import asyncio
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from confluent_kafka import Consumer, Producer
+from confluent_kafka import Consumer, Message, Producer, TopicPartition
 from pydantic import BaseModel
 
 from .config import get_settings
+from .exceptions import MessageQueueException
 from .logger import get_logger
+from .serializers import (
+    CONTENT_TYPE_HEADER,
+    EventSerializer,
+    get_event_serializer,
+    get_serializer_for_content_type,
+)
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+DeliveryCallback = Callable[[Any, Any], None]
+
+# How often a produce blocked on a full local queue retries
+_QUEUE_FULL_RETRY_INTERVAL = 0.05
+
 
 class KafkaProducer:
-    def __init__(self):
+    """Long-lived, batching producer.
+
+    Messages are only queued by ``produce``; librdkafka batches them in the
+    background according to ``linger.ms``/``batch.size`` and a poll thread
+    serves delivery reports, so producing never waits on the broker. If the
+    local queue is full, ``produce`` waits on the event loop for up to
+    ``KAFKA_QUEUE_FULL_TIMEOUT`` while the poll thread drains it.
+    """
+
+    def __init__(self, serializer: Optional[EventSerializer] = None):
+        self.serializer = serializer or get_event_serializer()
         self.producer = Producer({
             'bootstrap.servers': settings.KAFKA_BOOTSTRAP_SERVERS,
+            'linger.ms': settings.KAFKA_LINGER_MS,
+            'batch.size': settings.KAFKA_BATCH_SIZE,
+            'compression.type': settings.KAFKA_COMPRESSION_TYPE,
+            'acks': settings.KAFKA_ACKS,
+            'enable.idempotence': True,
+            'queue.buffering.max.messages': settings.KAFKA_QUEUE_MAX_MESSAGES,
         })
+        self._running = threading.Event()
+        self._running.set()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop,
+            name="kafka-producer-poll",
+            daemon=True,
+        )
+        self._poll_thread.start()
 
-    def produce(self, topic: str, key: str, value: Dict[str, Any]) -> None:
-        """Produce message to Kafka topic."""
+    def _poll_loop(self) -> None:
+        """Serve delivery callbacks until the producer is closed."""
+        while self._running.is_set():
+            self.producer.poll(0.1)
+
+    async def produce(
+        self,
+        topic: str,
+        key: Optional[str],
+        value: Dict[str, Any],
+        on_delivery: Optional[DeliveryCallback] = None,
+    ) -> None:
+        """Queue message for delivery to Kafka topic."""
         try:
-            self.producer.produce(
-                topic=f"{settings.KAFKA_TOPIC_PREFIX}.{topic}",
-                key=key,
-                value=str(value),
-                callback=self._delivery_report,
-            )
-            self.producer.flush()
+            kwargs = {
+                "topic": f"{settings.KAFKA_TOPIC_PREFIX}.{topic}",
+                "key": key,
+                "value": self.serializer.serialize(value),
+                "headers": [(CONTENT_TYPE_HEADER, self.serializer.content_type)],
+                "callback": self._make_callback(on_delivery),
+            }
+            await self._enqueue(**kwargs)
         except Exception as e:
             logger.error(
                 "Failed to produce message",
@@ -37,6 +91,61 @@ def produce(self, topic: str, key: str, value: Dict[str, Any]) -> None:
             )
             raise
 
+    async def produce_raw(
+        self,
+        topic: str,
+        key: Optional[bytes],
+        value: bytes,
+        headers: Optional[List[Tuple[str, Any]]] = None,
+    ) -> None:
+        """Queue already-encoded bytes to a fully qualified topic, e.g. a dead-letter topic."""
+        await self._enqueue(
+            topic=topic,
+            key=key,
+            value=value,
+            headers=headers,
+            callback=self._delivery_report,
+        )
+
+    async def _enqueue(self, **kwargs: Any) -> None:
+        deadline = time.monotonic() + settings.KAFKA_QUEUE_FULL_TIMEOUT
+        while True:
+            try:
+                self.producer.produce(**kwargs)
+                return
+            except BufferError:
+                # Local queue is full; the poll thread frees room as batches are delivered
+                if time.monotonic() >= deadline:
+                    raise
+                await asyncio.sleep(_QUEUE_FULL_RETRY_INTERVAL)
+
+    def flush(self, timeout: float) -> int:
+        """Wait for queued messages to be delivered, returning how many remain."""
+        return self.producer.flush(timeout)
+
+    def close(self, timeout: float = settings.KAFKA_FLUSH_TIMEOUT) -> None:
+        """Flush outstanding messages and stop the poll thread."""
+        remaining = self.flush(timeout)
+        self._running.clear()
+        self._poll_thread.join()
+        if remaining:
+            logger.error(
+                "Messages not delivered before shutdown",
+                extra={
+                    "remaining": remaining,
+                },
+            )
+
+    def _make_callback(self, on_delivery: Optional[DeliveryCallback]) -> DeliveryCallback:
+        if on_delivery is None:
+            return self._delivery_report
+
+        def callback(err, msg):
+            self._delivery_report(err, msg)
+            on_delivery(err, msg)
+
+        return callback
+
     @staticmethod
     def _delivery_report(err, msg):
         """Handle delivery report."""
@@ -59,16 +168,32 @@ def _delivery_report(err, msg):
 
 
 class KafkaConsumer:
-    def __init__(self, group_id: str):
+    def __init__(self, group_id: str, enable_auto_commit: bool = True):
         self.consumer = Consumer({
             'bootstrap.servers': settings.KAFKA_BOOTSTRAP_SERVERS,
             'group.id': group_id,
             'auto.offset.reset': 'earliest',
+            'enable.auto.commit': enable_auto_commit,
         })
 
     def subscribe(self, topics: list[str]) -> None:
-        """Subscribe to Kafka topics."""
-        self.consumer.subscribe([f"{settings.KAFKA_TOPIC_PREFIX}.{topic}" for topic in topics])
+        """Subscribe to Kafka topics; ``*`` matches any suffix, e.g. ``course.*``."""
+        self.consumer.subscribe([self._topic_name(topic) for topic in topics])
+
+    @staticmethod
+    def _topic_name(topic: str) -> str:
+        name = f"{settings.KAFKA_TOPIC_PREFIX}.{topic}"
+        if "*" in topic:
+            # librdkafka treats subscriptions starting with ^ as regular expressions.
+            # Anchored on the topic prefix, so dead-letter topics (dead_letter_topic)
+            # never match and a consumer cannot re-read its own dead letters.
+            return "^" + re.escape(name).replace(r"\*", ".*") + "$"
+        return name
+
+    @staticmethod
+    def dead_letter_topic(topic: str) -> str:
+        """Dead-letter topic for a full topic name."""
+        return f"{settings.KAFKA_DEAD_LETTER_PREFIX}.{topic}"
 
     def consume(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
         """Consume message from Kafka topic."""
@@ -84,11 +209,7 @@ def consume(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
                     },
                 )
                 return None
-            return {
-                "topic": msg.topic(),
-                "key": msg.key().decode('utf-8'),
-                "value": msg.value().decode('utf-8'),
-            }
+            return self.decode(msg)
         except Exception as e:
             logger.error(
                 "Failed to consume message",
@@ -98,6 +219,68 @@ def consume(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
             )
             raise
 
+    def consume_batch(self, num_messages: int = 500, timeout: float = 1.0) -> List[Message]:
+        """Poll up to ``num_messages`` raw messages, logging and skipping errors."""
+        try:
+            messages = self.consumer.consume(num_messages=num_messages, timeout=timeout)
+        except Exception as e:
+            logger.error(
+                "Failed to consume messages",
+                extra={
+                    "error": str(e),
+                },
+            )
+            raise
+
+        batch = []
+        for msg in messages:
+            if msg.error():
+                logger.error(
+                    "Consumer error",
+                    extra={
+                        "error": msg.error(),
+                    },
+                )
+                continue
+            batch.append(msg)
+        return batch
+
+    def commit(self, messages: List[Message]) -> None:
+        """Synchronously commit the offsets following each partition's last message."""
+        offsets = {}
+        for msg in messages:
+            tp = (msg.topic(), msg.partition())
+            offsets[tp] = max(offsets.get(tp, -1), msg.offset())
+        if offsets:
+            self.consumer.commit(
+                offsets=[TopicPartition(topic, partition, offset + 1) for (topic, partition), offset in offsets.items()],
+                asynchronous=False,
+            )
+
+    def rewind(self, messages: List[Message]) -> None:
+        """Seek each partition back to its first message so the batch is redelivered."""
+        offsets = {}
+        for msg in messages:
+            tp = (msg.topic(), msg.partition())
+            offsets[tp] = min(offsets.get(tp, msg.offset()), msg.offset())
+        for (topic, partition), offset in offsets.items():
+            self.consumer.seek(TopicPartition(topic, partition, offset))
+
+    @staticmethod
+    def decode(msg) -> Dict[str, Any]:
+        """Decode a message using the serializer named by its content-type header."""
+        headers = dict(msg.headers() or [])
+        content_type = headers.get(CONTENT_TYPE_HEADER)
+        if isinstance(content_type, bytes):
+            content_type = content_type.decode('utf-8')
+        serializer = get_serializer_for_content_type(content_type)
+        key = msg.key()
+        return {
+            "topic": msg.topic(),
+            "key": key.decode('utf-8') if key is not None else None,
+            "value": serializer.deserialize(msg.value()),
+        }
+
     def close(self) -> None:
         """Close consumer."""
         self.consumer.close()
@@ -108,4 +291,80 @@ class Event(BaseModel):
     event_type: str
     event_id: str
     timestamp: str
-    data: Dict[str, Any] 
\ No newline at end of file
+    data: Dict[str, Any]
+
+
+_producer: Optional[KafkaProducer] = None
+_producer_lock = threading.Lock()
+
+
+def get_producer() -> KafkaProducer:
+    """Get the process-wide Kafka producer, creating it on first use."""
+    global _producer
+    if _producer is None:
+        with _producer_lock:
+            if _producer is None:
+                _producer = KafkaProducer()
+    return _producer
+
+
+async def close_producer() -> None:
+    """Flush and close the process-wide Kafka producer, if one was created."""
+    global _producer
+    if _producer is None:
+        return
+    producer, _producer = _producer, None
+    await asyncio.get_running_loop().run_in_executor(None, producer.close)
+
+
+def get_event_key(event_type: str, data: Dict[str, Any]) -> Optional[str]:
+    """Key events by the id of the aggregate they describe, e.g. ``course_id``."""
+    aggregate = event_type.split(".", 1)[0]
+    key = data.get(f"{aggregate}_id")
+    return str(key) if key is not None else None
+
+
+async def produce_event(
+    event_type: str,
+    data: Dict[str, Any],
+    key: Optional[str] = None,
+    wait_for_delivery: bool = False,
+) -> Event:
+    """Publish a domain event.
+
+    The event is only queued on the shared producer unless
+    ``wait_for_delivery`` is set, in which case this waits for the broker
+    acknowledgement without blocking the event loop.
+    """
+    event = Event(
+        event_type=event_type,
+        event_id=str(uuid.uuid4()),
+        timestamp=datetime.utcnow().isoformat(),
+        data=data,
+    )
+    key = key or get_event_key(event_type, data)
+    producer = get_producer()
+
+    if not wait_for_delivery:
+        await producer.produce(event_type, key, event.dict())
+        return event
+
+    loop = asyncio.get_running_loop()
+    delivered = loop.create_future()
+
+    def resolve(err) -> None:
+        if delivered.done():
+            return
+        if err is not None:
+            delivered.set_exception(MessageQueueException(f"Event delivery failed: {err}"))
+        else:
+            delivered.set_result(None)
+
+    await producer.produce(
+        event_type,
+        key,
+        event.dict(),
+        on_delivery=lambda err, msg: loop.call_soon_threadsafe(resolve, err),
+    )
+    await delivered
+    return event
@@ -1,15 +1,180 @@
-from typing import Optional
+import asyncio
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
+import httpx
+import jwt
+import orjson
 from authlib.integrations.starlette_client import OAuth
 from fastapi import HTTPException, Request
 from starlette.config import Config
 
 from .config import get_settings
 from .logger import get_logger
+from .redis import get_async_binary_redis
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Fetches a JSON document, returning it with the response's Cache-Control header
+Fetcher = Callable[[str], Awaitable[Tuple[Dict[str, Any], Optional[str]]]]
+
+
+async def http_fetcher(url: str) -> Tuple[Dict[str, Any], Optional[str]]:
+    async with httpx.AsyncClient(timeout=settings.OIDC_HTTP_TIMEOUT) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.json(), response.headers.get("cache-control")
+
+
+def _max_age(cache_control: Optional[str]) -> float:
+    """TTL from a Cache-Control header, within the configured bounds."""
+    ttl = settings.OIDC_METADATA_DEFAULT_TTL
+    for directive in (cache_control or "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() in ("no-cache", "no-store"):
+            ttl = settings.OIDC_METADATA_MIN_TTL
+        elif name.lower() == "max-age" and value.isdigit():
+            ttl = int(value)
+    return max(settings.OIDC_METADATA_MIN_TTL, ttl)
+
+
+class OIDCProvider:
+    """Discovery document and JWKS of an identity provider, cached locally.
+
+    Both documents are fetched once (at startup or on first use) and then
+    refreshed in the background shortly before their Cache-Control max-age
+    runs out, keeping the stale copy if the provider is unreachable. Tokens
+    are verified against the cached keys, so the provider is never on the
+    request path; an unknown ``kid`` triggers at most one early JWKS refresh
+    per minimum TTL, to pick up key rotation.
+    """
+
+    def __init__(self, issuer: str, client_id: str, fetcher: Optional[Fetcher] = None):
+        self.issuer = issuer.rstrip("/")
+        self.client_id = client_id
+        self.fetcher = fetcher or http_fetcher
+        self.metadata: Dict[str, Any] = {}
+        self.jwks: Dict[str, Any] = {}
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._metadata_expires_at = 0.0
+        self._jwks_expires_at = 0.0
+        self._jwks_fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+
+    async def load(self) -> None:
+        """Fetch whichever document is missing or expired."""
+        async with self._lock:
+            now = time.monotonic()
+            if now >= self._metadata_expires_at:
+                metadata, cache_control = await self.fetcher(
+                    f"{self.issuer}/.well-known/openid-configuration"
+                )
+                self.metadata = metadata
+                self._metadata_expires_at = now + _max_age(cache_control)
+            if now >= self._jwks_expires_at:
+                await self._load_jwks()
+
+    async def _load_jwks(self) -> None:
+        jwks, cache_control = await self.fetcher(self.metadata["jwks_uri"])
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[jwk.get("kid")] = jwt.PyJWK(jwk)
+            except jwt.PyJWTError:
+                continue
+        now = time.monotonic()
+        # Updated in place: the registered authlib client holds this same dict
+        self.jwks.clear()
+        self.jwks.update(jwks)
+        self._keys = keys
+        self._jwks_fetched_at = now
+        self._jwks_expires_at = now + _max_age(cache_control)
+
+    async def ensure_loaded(self) -> None:
+        if not self.metadata or not self._keys:
+            await self.load()
+
+    def _jwks_refresh_due(self, kid: Optional[str]) -> bool:
+        return (
+            kid not in self._keys
+            and time.monotonic() - self._jwks_fetched_at > settings.OIDC_METADATA_MIN_TTL
+        )
+
+    async def _signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        await self.ensure_loaded()
+        key = self._keys.get(kid)
+        if key is None and self._jwks_refresh_due(kid):
+            async with self._lock:
+                # Another request may have refreshed while we waited
+                if self._jwks_refresh_due(kid):
+                    await self._load_jwks()
+            key = self._keys.get(kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f"Unknown signing key: {kid}")
+        return key
+
+    async def verify_token(
+        self,
+        token: str,
+        audience: Optional[str] = None,
+        nonce: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Verify an ID or JWT access token locally and return its claims."""
+        header = jwt.get_unverified_header(token)
+        key = await self._signing_key(header.get("kid"))
+        claims = jwt.decode(
+            token,
+            key=key.key,
+            algorithms=[key.algorithm_name],
+            audience=audience or self.client_id,
+            issuer=self.metadata.get("issuer", self.issuer),
+            leeway=settings.OIDC_CLOCK_SKEW,
+        )
+        if nonce is not None and claims.get("nonce") != nonce:
+            raise jwt.InvalidTokenError("Nonce mismatch")
+        return claims
+
+    async def verify_id_token(self, id_token: str, nonce: Optional[str] = None) -> Dict[str, Any]:
+        return await self.verify_token(id_token, nonce=nonce)
+
+    async def run(self) -> None:
+        """Refresh the cached documents ahead of expiry until stopped."""
+        retry_delay = 1.0
+        while not self._stopped.is_set():
+            try:
+                await self.load()
+                retry_delay = 1.0
+                expires_at = min(self._metadata_expires_at, self._jwks_expires_at)
+                # Refresh once 80% of the lifetime has passed
+                delay = max(1.0, (expires_at - time.monotonic()) * 0.8)
+                self._metadata_expires_at = min(self._metadata_expires_at, time.monotonic() + delay)
+                self._jwks_expires_at = min(self._jwks_expires_at, time.monotonic() + delay)
+            except Exception as e:
+                logger.warning(
+                    "Failed to refresh OIDC provider metadata",
+                    extra={
+                        "issuer": self.issuer,
+                        "error": str(e),
+                    },
+                )
+                delay = retry_delay
+                retry_delay = min(retry_delay * 2, settings.OIDC_METADATA_MIN_TTL)
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+provider = OIDCProvider(settings.OIDC_ISSUER, settings.OIDC_CLIENT_ID)
+
 # Create OAuth config
 oauth_config = Config(
     environ={
@@ -21,11 +186,90 @@
 
 # Create OAuth client
 oauth = OAuth(oauth_config)
-oauth.register(
-    name="oidc",
-    server_metadata_url=f"{settings.OIDC_ISSUER}/.well-known/openid-configuration",
-    client_kwargs={"scope": "openid email profile"},
-)
+
+
+async def get_oauth_client():
+    """The OIDC OAuth client, registered with the cached provider metadata."""
+    if "oidc" not in oauth._registry:
+        await provider.ensure_loaded()
+        # Metadata and keys come from the provider cache, so authlib never fetches them
+        metadata = provider.metadata
+        oauth.register(
+            name="oidc",
+            client_id=settings.OIDC_CLIENT_ID,
+            client_secret=settings.OIDC_CLIENT_SECRET,
+            authorize_url=metadata["authorization_endpoint"],
+            access_token_url=metadata["token_endpoint"],
+            client_kwargs={"scope": "openid email profile"},
+            issuer=metadata.get("issuer", provider.issuer),
+            jwks_uri=metadata["jwks_uri"],
+            jwks=provider.jwks,
+            userinfo_endpoint=metadata.get("userinfo_endpoint"),
+            id_token_signing_alg_values_supported=metadata.get(
+                "id_token_signing_alg_values_supported", ["RS256"]
+            ),
+        )
+    return oauth.create_client("oidc")
+
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def start_oidc_provider() -> None:
+    """Load provider metadata and keep it fresh in the background."""
+    global _refresh_task
+    if _refresh_task is not None:
+        return
+    try:
+        await provider.load()
+    except Exception as e:
+        # Retried by the refresh loop and on first use
+        logger.warning(
+            "Failed to load OIDC provider metadata",
+            extra={
+                "issuer": provider.issuer,
+                "error": str(e),
+            },
+        )
+    _refresh_task = asyncio.create_task(provider.run())
+
+
+async def stop_oidc_provider() -> None:
+    global _refresh_task
+    if _refresh_task is None:
+        return
+    provider.stop()
+    await _refresh_task
+    _refresh_task = None
+
+
+# Claims kept in the session cookie, which is signed but not encrypted
+SESSION_USER_CLAIMS = ("sub", "email", "name")
+
+
+def _token_key(sid: str) -> str:
+    return f"oidc:token:{sid}"
+
+
+async def _store_token(request: Request, token: Dict[str, Any]) -> None:
+    """Keep the token set in Redis; the session only holds a random handle and the expiry."""
+    sid = request.session.get("oidc_sid") or secrets.token_urlsafe(32)
+    token = {key: value for key, value in token.items() if key != "userinfo"}
+    await get_async_binary_redis().set(
+        _token_key(sid),
+        orjson.dumps(token),
+        ex=settings.OIDC_SESSION_TTL,
+    )
+    request.session["oidc_sid"] = sid
+    request.session["token_expires_at"] = token.get("expires_at")
+
+
+async def _load_token(request: Request) -> Optional[Dict[str, Any]]:
+    sid = request.session.get("oidc_sid")
+    if not sid:
+        return None
+    payload = await get_async_binary_redis().get(_token_key(sid))
+    return orjson.loads(payload) if payload else None
 
 
 async def get_oidc_user(request: Request) -> Optional[dict]:
@@ -60,7 +304,8 @@ async def login_oidc(request: Request) -> str:
     """Initiate OIDC login flow."""
     try:
         redirect_uri = request.url_for("auth_callback")
-        return await oauth.oidc.authorize_redirect(request, redirect_uri)
+        client = await get_oauth_client()
+        return await client.authorize_redirect(request, redirect_uri)
     except Exception as e:
         logger.error(
             "Failed to initiate OIDC login",
@@ -74,8 +319,14 @@ async def login_oidc(request: Request) -> str:
 async def callback_oidc(request: Request) -> dict:
     """Handle OIDC callback."""
     try:
-        token = await oauth.oidc.authorize_access_token(request)
-        user = await oauth.oidc.parse_id_token(request, token)
+        client = await get_oauth_client()
+        token = await client.authorize_access_token(request)
+        # authlib checks the ID token and nonce against the cached JWKS
+        claims = token.get("userinfo")
+        if claims is None:
+            claims = await provider.verify_id_token(token["id_token"])
+        user = {key: claims[key] for key in SESSION_USER_CLAIMS if key in claims}
+        await _store_token(request, token)
         request.session["user"] = user
         return user
     except Exception as e:
@@ -91,6 +342,10 @@ async def callback_oidc(request: Request) -> dict:
 async def logout_oidc(request: Request) -> None:
     """Logout from OIDC."""
     try:
+        sid = request.session.pop("oidc_sid", None)
+        if sid:
+            await get_async_binary_redis().delete(_token_key(sid))
+        request.session.pop("token_expires_at", None)
         request.session.pop("user", None)
     except Exception as e:
         logger.error(
@@ -105,7 +360,7 @@ async def logout_oidc(request: Request) -> None:
 async def get_access_token(request: Request) -> Optional[str]:
     """Get the OIDC access token."""
     try:
-        token = request.session.get("token")
+        token = await _load_token(request)
         if not token:
             return None
         return token["access_token"]
@@ -122,14 +377,17 @@ async def get_access_token(request: Request) -> Optional[str]:
 async def refresh_access_token(request: Request) -> Optional[str]:
     """Refresh the OIDC access token."""
     try:
-        token = request.session.get("token")
+        token = await _load_token(request)
         if not token or "refresh_token" not in token:
             return None
-        new_token = await oauth.oidc.refresh_token(
-            request,
-            token["refresh_token"],
+        client = await get_oauth_client()
+        new_token = await client.fetch_access_token(
+            refresh_token=token["refresh_token"],
+            grant_type="refresh_token",
         )
-        request.session["token"] = new_token
+        # Providers that do not rotate refresh tokens omit it from the response
+        new_token.setdefault("refresh_token", token["refresh_token"])
+        await _store_token(request, new_token)
         return new_token["access_token"]
     except Exception as e:
         logger.error(
@@ -138,4 +396,4 @@ async def refresh_access_token(request: Request) -> Optional[str]:
                 "error": str(e),
             },
         )
-        raise 
\ No newline at end of file
+        raise
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from .oidc import OIDCProvider
+
+
+class StubIdentityProvider:
+    """In-process identity provider for tests and local development.
+
+    Serves a discovery document and JWKS through ``fetch``, which plugs
+    into OIDCProvider as its fetcher, and issues tokens signed with its own
+    keys::
+
+        idp = StubIdentityProvider()
+        provider = idp.provider()
+        claims = await provider.verify_id_token(idp.issue_token("user-1"))
+    """
+
+    def __init__(
+        self,
+        issuer: str = "https://idp.test",
+        client_id: str = "test-client",
+        max_age: int = 3600,
+        latency: float = 0.0,
+    ):
+        self.issuer = issuer
+        self.client_id = client_id
+        self.max_age = max_age
+        # Simulated network delay per document fetch
+        self.latency = latency
+        self.fetches = 0
+        self._keys: Dict[str, rsa.RSAPrivateKey] = {}
+        self.kid = ""
+        self.rotate_key()
+
+    def rotate_key(self) -> str:
+        """Start signing with a new key; the old one stays published."""
+        self.kid = uuid4().hex
+        self._keys[self.kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        return self.kid
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            "issuer": self.issuer,
+            "authorization_endpoint": f"{self.issuer}/authorize",
+            "token_endpoint": f"{self.issuer}/token",
+            "userinfo_endpoint": f"{self.issuer}/userinfo",
+            "jwks_uri": f"{self.issuer}/jwks",
+            "id_token_signing_alg_values_supported": ["RS256"],
+        }
+
+    def jwks(self) -> Dict[str, Any]:
+        keys = []
+        for kid, key in self._keys.items():
+            jwk = json.loads(RSAAlgorithm.to_jwk(key.public_key()))
+            jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+            keys.append(jwk)
+        return {"keys": keys}
+
+    async def fetch(self, url: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        self.fetches += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        cache_control = f"public, max-age={self.max_age}"
+        if url == f"{self.issuer}/.well-known/openid-configuration":
+            return self.metadata(), cache_control
+        if url == f"{self.issuer}/jwks":
+            return self.jwks(), cache_control
+        raise LookupError(f"Stub identity provider has no document at {url}")
+
+    def issue_token(
+        self,
+        subject: str,
+        audience: Optional[str] = None,
+        nonce: Optional[str] = None,
+        expires_in: int = 300,
+        **claims: Any,
+    ) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": self.issuer,
+            "sub": subject,
+            "aud": audience or self.client_id,
+            "iat": now,
+            "exp": now + expires_in,
+            **claims,
+        }
+        if nonce is not None:
+            payload["nonce"] = nonce
+        return jwt.encode(payload, self._keys[self.kid], algorithm="RS256", headers={"kid": self.kid})
+
+    def provider(self) -> OIDCProvider:
+        return OIDCProvider(self.issuer, self.client_id, fetcher=self.fetch)
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import BigInteger, Column, DateTime, String, delete, func, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import get_settings
+from .database import AsyncSessionLocal, Base, use_primary
+from .exceptions import MessageQueueException
+from .kafka import Event, get_event_key, get_producer
+from .logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Advisory lock held by whichever relay is draining the outbox
+OUTBOX_RELAY_LOCK_ID = 0x6F7574626F78
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+
+    # The sequence defines publish order
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    event_id = Column(PGUUID(as_uuid=True), unique=True, nullable=False, default=uuid4)
+    event_type = Column(String, nullable=False)
+    aggregate_id = Column(String)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+def stage_event(
+    session: AsyncSession,
+    event_type: str,
+    data: Dict[str, Any],
+    key: Optional[str] = None,
+) -> OutboxEvent:
+    """Add a domain event to the outbox, to be committed with the caller's transaction."""
+    event = OutboxEvent(
+        event_id=uuid4(),
+        event_type=event_type,
+        aggregate_id=key or get_event_key(event_type, data),
+        payload=data,
+        created_at=datetime.utcnow(),
+    )
+    session.add(event)
+    return event
+
+
+class OutboxRelay:
+    """Drains the outbox table to Kafka in batches.
+
+    Events are produced in outbox order keyed by aggregate id, so each
+    aggregate's events land on one partition in commit order. A transaction
+    level advisory lock makes sure only one relay drains at a time when
+    several pods run one. Delivery is at-least-once: a batch that fails
+    midway is retried as a whole, so consumers should dedupe on event_id.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._stopped = asyncio.Event()
+
+    async def run(self) -> None:
+        """Relay batches until stopped, idling between polls when caught up."""
+        while not self._stopped.is_set():
+            try:
+                relayed = await self.relay_batch()
+            except Exception as e:
+                logger.error(
+                    "Failed to relay outbox events",
+                    extra={
+                        "error": str(e),
+                    },
+                )
+                relayed = 0
+            if relayed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stop(self) -> None:
+        """Ask the relay loop to exit after the current batch."""
+        self._stopped.set()
+
+    async def relay_batch(self) -> int:
+        """Publish and remove one batch of outbox events, returning how many were relayed."""
+        with use_primary():
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    locked = await session.scalar(
+                        select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK_ID))
+                    )
+                    if not locked:
+                        return 0
+
+                    result = await session.execute(
+                        select(OutboxEvent)
+                        .order_by(OutboxEvent.id)
+                        .limit(self.batch_size)
+                    )
+                    events = result.scalars().all()
+                    if not events:
+                        return 0
+
+                    await self._publish(events)
+                    await session.execute(
+                        delete(OutboxEvent).where(OutboxEvent.id.in_([event.id for event in events]))
+                    )
+        return len(events)
+
+    async def _publish(self, events: List[OutboxEvent]) -> None:
+        producer = get_producer()
+        errors = []
+
+        def on_delivery(err, msg):
+            if err is not None:
+                errors.append(err)
+
+        for event in events:
+            await producer.produce(
+                event.event_type,
+                event.aggregate_id,
+                Event(
+                    event_type=event.event_type,
+                    event_id=str(event.event_id),
+                    timestamp=event.created_at.isoformat(),
+                    data=event.payload,
+                ).dict(),
+                on_delivery=on_delivery,
+            )
+
+        remaining = await asyncio.get_running_loop().run_in_executor(
+            None, producer.flush, settings.KAFKA_FLUSH_TIMEOUT
+        )
+        if remaining or errors:
+            raise MessageQueueException(
+                f"Outbox batch not delivered: {remaining} pending, {len(errors)} failed"
+            )
+        logger.debug(
+            "Outbox events relayed",
+            extra={
+                "count": len(events),
+            },
+        )
+
+
+_relay: Optional[OutboxRelay] = None
+_relay_task: Optional[asyncio.Task] = None
+
+
+def start_outbox_relay() -> None:
+    """Start the outbox relay as a background task of the running loop."""
+    global _relay, _relay_task
+    if _relay_task is not None:
+        return
+    _relay = OutboxRelay()
+    _relay_task = asyncio.create_task(_relay.run())
+
+
+async def stop_outbox_relay() -> None:
+    """Stop the background outbox relay and wait for its current batch."""
+    global _relay, _relay_task
+    if _relay is None or _relay_task is None:
+        return
+    _relay.stop()
+    await _relay_task
+    _relay, _relay_task = None, None
+
+
+if __name__ == "__main__":
+    asyncio.run(OutboxRelay().run())
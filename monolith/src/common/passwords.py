@@ -0,0 +1,168 @@
+import math
+import time
+from functools import lru_cache
+
+import bcrypt
+
+from .config import get_settings
+from .logger import get_logger
+
+try:
+    from argon2 import PasswordHasher as Argon2Hasher
+    from argon2 import extract_parameters
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi is optional
+    Argon2Hasher = None
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+BCRYPT = "bcrypt"
+ARGON2ID = "argon2id"
+
+# bcrypt's valid work factors; below 10 is too weak for production hashes
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+
+
+def _time_ms(func, *args) -> float:
+    started = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - started) * 1000
+
+
+def calibrate_bcrypt_rounds(target_ms: float, samples: int = 3) -> int:
+    """Pick the bcrypt work factor whose hash time on this CPU is closest to ``target_ms``.
+
+    Each extra round doubles the cost, so one cheap measurement is enough to
+    extrapolate.
+    """
+    probe_rounds = 8
+    salt = bcrypt.gensalt(rounds=probe_rounds)
+    probe_ms = min(_time_ms(bcrypt.hashpw, b"calibration", salt) for _ in range(samples))
+    rounds = probe_rounds + round(math.log2(target_ms / max(probe_ms, 0.01)))
+    return max(BCRYPT_MIN_ROUNDS, min(BCRYPT_MAX_ROUNDS, rounds))
+
+
+def calibrate_argon2_time_cost(
+    target_ms: float,
+    memory_cost: int,
+    parallelism: int,
+    max_time_cost: int = 20,
+) -> int:
+    """Pick the argon2id time cost (iterations) that stays within ``target_ms`` on this CPU."""
+    if Argon2Hasher is None:
+        raise RuntimeError("argon2-cffi is not installed")
+    time_cost = 1
+    while time_cost < max_time_cost:
+        hasher = Argon2Hasher(
+            time_cost=time_cost + 1, memory_cost=memory_cost, parallelism=parallelism
+        )
+        if _time_ms(hasher.hash, "calibration") > target_ms:
+            break
+        time_cost += 1
+    return time_cost
+
+
+class PasswordHasher:
+    """Hashes new passwords with the configured scheme and cost, and verifies any known one.
+
+    Verification accepts both bcrypt and argon2id hashes so the fleet can
+    move between schemes or costs; ``needs_rehash`` tells callers when a
+    stored hash should be replaced after a successful login. Costs only
+    ever go up: a hash stronger than the configured cost is kept.
+    """
+
+    def __init__(
+        self,
+        scheme: str = BCRYPT,
+        bcrypt_rounds: int = 12,
+        argon2_time_cost: int = 3,
+        argon2_memory_cost: int = 65536,
+        argon2_parallelism: int = 1,
+    ):
+        if scheme not in (BCRYPT, ARGON2ID):
+            raise ValueError(f"Unknown password hash scheme: {scheme}")
+        if scheme == ARGON2ID and Argon2Hasher is None:
+            raise ValueError("argon2id password hashing requires argon2-cffi")
+        self.scheme = scheme
+        self.bcrypt_rounds = bcrypt_rounds
+        self._argon2 = None
+        if Argon2Hasher is not None:
+            self._argon2 = Argon2Hasher(
+                time_cost=argon2_time_cost,
+                memory_cost=argon2_memory_cost,
+                parallelism=argon2_parallelism,
+            )
+
+    def hash(self, password: str) -> str:
+        if self.scheme == ARGON2ID:
+            return self._argon2.hash(password)
+        salt = bcrypt.gensalt(rounds=self.bcrypt_rounds)
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+    def verify(self, password: str, hashed: str) -> bool:
+        if hashed.startswith("$argon2"):
+            if self._argon2 is None:
+                raise ValueError("argon2 hash found but argon2-cffi is not installed")
+            try:
+                return self._argon2.verify(hashed, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        try:
+            return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+        except ValueError:
+            return False
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Whether a stored hash uses another scheme or a lower cost than new hashes would."""
+        if self.scheme == ARGON2ID:
+            if not hashed.startswith("$argon2id$"):
+                return True
+            try:
+                params = extract_parameters(hashed)
+            except InvalidHashError:
+                return True
+            return (
+                params.time_cost < self._argon2.time_cost
+                or params.memory_cost < self._argon2.memory_cost
+            )
+        if not hashed.startswith("$2"):
+            return True
+        try:
+            return int(hashed.split("$")[2]) < self.bcrypt_rounds
+        except (IndexError, ValueError):
+            return True
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    """Build the hasher from settings; costs are pinned fleet-wide, see ``_main``."""
+    return PasswordHasher(
+        scheme=settings.PASSWORD_HASH_SCHEME,
+        bcrypt_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        argon2_time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+        argon2_memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+        argon2_parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+    )
+
+
+def _main() -> None:
+    """Print the costs that hit PASSWORD_HASH_TARGET_MS on this machine.
+
+    Run it once on the production instance type (``python -m
+    src.common.passwords``) and pin the result in the settings, so every
+    pod hashes with the same cost.
+    """
+    print(f"PASSWORD_BCRYPT_ROUNDS={calibrate_bcrypt_rounds(settings.PASSWORD_HASH_TARGET_MS)}")
+    if Argon2Hasher is not None:
+        time_cost = calibrate_argon2_time_cost(
+            settings.PASSWORD_HASH_TARGET_MS,
+            settings.PASSWORD_ARGON2_MEMORY_COST,
+            settings.PASSWORD_ARGON2_PARALLELISM,
+        )
+        print(f"PASSWORD_ARGON2_TIME_COST={time_cost}")
+
+
+if __name__ == "__main__":
+    _main()
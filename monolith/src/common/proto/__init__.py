@@ -0,0 +1,5 @@
+"""
+Generated protobuf modules for Kafka event payloads.
+
+Regenerate with ``scripts/generate_protos.sh`` after editing ``protobuf/*.proto``.
+"""
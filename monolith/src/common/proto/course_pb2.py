@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: course.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0c\x63ourse.proto\x12\telearning\x1a\x1fgoogle/protobuf/timestamp.proto\"\xf5\x01\n\x06\x43ourse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x15\n\rinstructor_id\x18\x04 \x01(\t\x12\r\n\x05level\x18\x05 \x01(\t\x12\x10\n\x08\x64uration\x18\x06 \x01(\x05\x12\r\n\x05price\x18\x07 \x01(\x05\x12\x14\n\x0cis_published\x18\x08 \x01(\x08\x12.\n\ncreated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xba\x01\n\x06Module\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\r\n\x05order\x18\x05 \x01(\x05\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xdd\x01\n\x06Lesson\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tmodule_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x05 \x01(\t\x12\r\n\x05order\x18\x06 \x01(\x05\x12\x10\n\x08\x64uration\x18\x07 \x01(\x05\x12.\n\ncreated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xea\x01\n\x12\x43ourseCreatedEvent\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x15\n\rinstructor_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05level\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x15\n\x08\x64uration\x18\x06 \x01(\x05H\x02\x88\x01\x01\x12\x12\n\x05price\x18\x07 \x01(\x05H\x03\x88\x01\x01\x12\x11\n\ttimestamp\x18\x08 \x01(\tB\x0e\n\x0c_descriptionB\x08\n\x06_levelB\x0b\n\t_durationB\x08\n\x06_price\"\xa5\x02\n\x12\x43ourseUpdatedEvent\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x15\n\rinstructor_id\x18\x02 \x01(\t\x12\x12\n\x05title\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05level\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x15\n\x08\x64uration\x18\x06 \x01(\x05H\x03\x88\x01\x01\x12\x12\n\x05price\x18\x07 \x01(\x05H\x04\x88\x01\x01\x12\x19\n\x0cis_published\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x11\n\ttimestamp\x18\t \x01(\tB\x08\n\x06_titleB\x0e\n\x0c_descriptionB\x08\n\x06_levelB\x0b\n\t_durationB\x08\n\x06_priceB\x0f\n\r_is_published\"Q\n\x12\x43ourseDeletedEvent\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\x15\n\rinstructor_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"\x95\x01\n\x12ModuleCreatedEvent\x12\x11\n\tmodule_id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x00\x88\x01\x01\x12\r\n\x05order\x18\x05 \x01(\x05\x12\x11\n\ttimestamp\x18\x06 \x01(\tB\x0e\n\x0c_description\"\xb3\x01\n\x12ModuleUpdatedEvent\x12\x11\n\tmodule_id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\x12\n\x05title\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05order\x18\x05 \x01(\x05H\x02\x88\x01\x01\x12\x11\n\ttimestamp\x18\x06 \x01(\tB\x08\n\x06_titleB\x0e\n\x0c_descriptionB\x08\n\x06_order\"M\n\x12ModuleDeletedEvent\x12\x11\n\tmodule_id\x18\x01 \x01(\t\x12\x11\n\tcourse_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"\xa0\x02\n\x12LessonCreatedEvent\x12\x11\n\tlesson_id\x18\x01 \x01(\t\x12\x11\n\tmodule_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x00\x88\x01\x01\x12\r\n\x05order\x18\x06 \x01(\x05\x12\x15\n\x08\x64uration\x18\x07 \x01(\x05H\x01\x88\x01\x01\x12\x11\n\ttimestamp\x18\x08 \x01(\t\x12\x19\n\x0c\x63ontent_hash\x18\t \x01(\tH\x02\x88\x01\x01\x12\x19\n\x0c\x63ontent_size\x18\n \x01(\x03H\x03\x88\x01\x01\x42\x0e\n\x0c_descriptionB\x0b\n\t_durationB\x0f\n\r_content_hashB\x0f\n\r_content_sizeJ\x04\x08\x05\x10\x06R\x07\x63ontent\"\xbe\x02\n\x12LessonUpdatedEvent\x12\x11\n\tlesson_id\x18\x01 \x01(\t\x12\x11\n\tmodule_id\x18\x02 \x01(\t\x12\x12\n\x05title\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05order\x18\x06 \x01(\x05H\x02\x88\x01\x01\x12\x15\n\x08\x64uration\x18\x07 \x01(\x05H\x03\x88\x01\x01\x12\x11\n\ttimestamp\x18\x08 \x01(\t\x12\x19\n\x0c\x63ontent_hash\x18\t \x01(\tH\x04\x88\x01\x01\x12\x19\n\x0c\x63ontent_size\x18\n \x01(\x03H\x05\x88\x01\x01\x42\x08\n\x06_titleB\x0e\n\x0c_descriptionB\x08\n\x06_orderB\x0b\n\t_durationB\x0f\n\r_content_hashB\x0f\n\r_content_sizeJ\x04\x08\x05\x10\x06R\x07\x63ontent\"M\n\x12LessonDeletedEvent\x12\x11\n\tlesson_id\x18\x01 \x01(\t\x12\x11\n\tmodule_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\tB(Z&github.com/your-org/elearning/protobufb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'course_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  _globals['DESCRIPTOR']._options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z&github.com/your-org/elearning/protobuf'
+  _globals['_COURSE']._serialized_start=61
+  _globals['_COURSE']._serialized_end=306
+  _globals['_MODULE']._serialized_start=309
+  _globals['_MODULE']._serialized_end=495
+  _globals['_LESSON']._serialized_start=498
+  _globals['_LESSON']._serialized_end=719
+  _globals['_COURSECREATEDEVENT']._serialized_start=722
+  _globals['_COURSECREATEDEVENT']._serialized_end=956
+  _globals['_COURSEUPDATEDEVENT']._serialized_start=959
+  _globals['_COURSEUPDATEDEVENT']._serialized_end=1252
+  _globals['_COURSEDELETEDEVENT']._serialized_start=1254
+  _globals['_COURSEDELETEDEVENT']._serialized_end=1335
+  _globals['_MODULECREATEDEVENT']._serialized_start=1338
+  _globals['_MODULECREATEDEVENT']._serialized_end=1487
+  _globals['_MODULEUPDATEDEVENT']._serialized_start=1490
+  _globals['_MODULEUPDATEDEVENT']._serialized_end=1669
+  _globals['_MODULEDELETEDEVENT']._serialized_start=1671
+  _globals['_MODULEDELETEDEVENT']._serialized_end=1748
+  _globals['_LESSONCREATEDEVENT']._serialized_start=1751
+  _globals['_LESSONCREATEDEVENT']._serialized_end=2039
+  _globals['_LESSONUPDATEDEVENT']._serialized_start=2042
+  _globals['_LESSONUPDATEDEVENT']._serialized_end=2360
+  _globals['_LESSONDELETEDEVENT']._serialized_start=2362
+  _globals['_LESSONDELETEDEVENT']._serialized_end=2439
+# @@protoc_insertion_point(module_scope)
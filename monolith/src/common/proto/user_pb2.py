@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: user.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nuser.proto\x12\telearning\x1a\x1fgoogle/protobuf/timestamp.proto\"\xd0\x01\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x12\n\nfirst_name\x18\x03 \x01(\t\x12\x11\n\tlast_name\x18\x04 \x01(\t\x12\x11\n\tis_active\x18\x05 \x01(\x08\x12\x13\n\x0bis_verified\x18\x06 \x01(\x08\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xf2\x01\n\x0bUserProfile\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x0b\n\x03\x62io\x18\x03 \x01(\t\x12\x12\n\navatar_url\x18\x04 \x01(\t\x12\x11\n\tjob_title\x18\x05 \x01(\t\x12\x0f\n\x07\x63ompany\x18\x06 \x01(\t\x12\x10\n\x08location\x18\x07 \x01(\t\x12\x0f\n\x07website\x18\x08 \x01(\t\x12.\n\ncreated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x93\x01\n\x10UserCreatedEvent\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x17\n\nfirst_name\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tlast_name\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\ttimestamp\x18\x05 \x01(\tB\r\n\x0b_first_nameB\x0c\n\n_last_name\"\xaa\x01\n\x10UserUpdatedEvent\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x17\n\nfirst_name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tlast_name\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tis_active\x18\x04 \x01(\x08H\x02\x88\x01\x01\x12\x11\n\ttimestamp\x18\x05 \x01(\tB\r\n\x0b_first_nameB\x0c\n\n_last_nameB\x0c\n\n_is_active\"6\n\x10UserDeletedEvent\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x8d\x02\n\x17UserProfileCreatedEvent\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x03\x62io\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\navatar_url\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tjob_title\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x14\n\x07\x63ompany\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x15\n\x08location\x18\x06 \x01(\tH\x04\x88\x01\x01\x12\x14\n\x07website\x18\x07 \x01(\tH\x05\x88\x01\x01\x12\x11\n\ttimestamp\x18\x08 \x01(\tB\x06\n\x04_bioB\r\n\x0b_avatar_urlB\x0c\n\n_job_titleB\n\n\x08_companyB\x0b\n\t_locationB\n\n\x08_website\"\x8d\x02\n\x17UserProfileUpdatedEvent\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x03\x62io\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\navatar_url\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tjob_title\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x14\n\x07\x63ompany\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x15\n\x08location\x18\x06 \x01(\tH\x04\x88\x01\x01\x12\x14\n\x07website\x18\x07 \x01(\tH\x05\x88\x01\x01\x12\x11\n\ttimestamp\x18\x08 \x01(\tB\x06\n\x04_bioB\r\n\x0b_avatar_urlB\x0c\n\n_job_titleB\n\n\x08_companyB\x0b\n\t_locationB\n\n\x08_website\"[\n\x11\x43reateUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x12\n\nfirst_name\x18\x03 \x01(\t\x12\x11\n\tlast_name\x18\x04 \x01(\t\"3\n\x12\x43reateUserResponse\x12\x1d\n\x04user\x18\x01 \x01(\x0b\x32\x0f.elearning.User\"\x1c\n\x0eGetUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\"0\n\x0fGetUserResponse\x12\x1d\n\x04user\x18\x01 \x01(\x0b\x32\x0f.elearning.User\"Y\n\x11UpdateUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\x11\n\tis_active\x18\x04 \x01(\x08\"3\n\x12UpdateUserResponse\x12\x1d\n\x04user\x18\x01 \x01(\x0b\x32\x0f.elearning.User\"\x1f\n\x11\x44\x65leteUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\"%\n\x12\x44\x65leteUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x32\xb0\x02\n\x0bUserService\x12I\n\nCreateUser\x12\x1c.elearning.CreateUserRequest\x1a\x1d.elearning.CreateUserResponse\x12@\n\x07GetUser\x12\x19.elearning.GetUserRequest\x1a\x1a.elearning.GetUserResponse\x12I\n\nUpdateUser\x12\x1c.elearning.UpdateUserRequest\x1a\x1d.elearning.UpdateUserResponse\x12I\n\nDeleteUser\x12\x1c.elearning.DeleteUserRequest\x1a\x1d.elearning.DeleteUserResponseB(Z&github.com/your-org/elearning/protobufb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'user_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  _globals['DESCRIPTOR']._options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z&github.com/your-org/elearning/protobuf'
+  _globals['_USER']._serialized_start=59
+  _globals['_USER']._serialized_end=267
+  _globals['_USERPROFILE']._serialized_start=270
+  _globals['_USERPROFILE']._serialized_end=512
+  _globals['_USERCREATEDEVENT']._serialized_start=515
+  _globals['_USERCREATEDEVENT']._serialized_end=662
+  _globals['_USERUPDATEDEVENT']._serialized_start=665
+  _globals['_USERUPDATEDEVENT']._serialized_end=835
+  _globals['_USERDELETEDEVENT']._serialized_start=837
+  _globals['_USERDELETEDEVENT']._serialized_end=891
+  _globals['_USERPROFILECREATEDEVENT']._serialized_start=894
+  _globals['_USERPROFILECREATEDEVENT']._serialized_end=1163
+  _globals['_USERPROFILEUPDATEDEVENT']._serialized_start=1166
+  _globals['_USERPROFILEUPDATEDEVENT']._serialized_end=1435
+  _globals['_CREATEUSERREQUEST']._serialized_start=1437
+  _globals['_CREATEUSERREQUEST']._serialized_end=1528
+  _globals['_CREATEUSERRESPONSE']._serialized_start=1530
+  _globals['_CREATEUSERRESPONSE']._serialized_end=1581
+  _globals['_GETUSERREQUEST']._serialized_start=1583
+  _globals['_GETUSERREQUEST']._serialized_end=1611
+  _globals['_GETUSERRESPONSE']._serialized_start=1613
+  _globals['_GETUSERRESPONSE']._serialized_end=1661
+  _globals['_UPDATEUSERREQUEST']._serialized_start=1663
+  _globals['_UPDATEUSERREQUEST']._serialized_end=1752
+  _globals['_UPDATEUSERRESPONSE']._serialized_start=1754
+  _globals['_UPDATEUSERRESPONSE']._serialized_end=1805
+  _globals['_DELETEUSERREQUEST']._serialized_start=1807
+  _globals['_DELETEUSERREQUEST']._serialized_end=1838
+  _globals['_DELETEUSERRESPONSE']._serialized_start=1840
+  _globals['_DELETEUSERRESPONSE']._serialized_end=1877
+  _globals['_USERSERVICE']._serialized_start=1880
+  _globals['_USERSERVICE']._serialized_end=2184
+# @@protoc_insertion_point(module_scope)
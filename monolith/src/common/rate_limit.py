@@ -0,0 +1,266 @@
+import fnmatch
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import jwt
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from .cache import LRUCache
+from .config import get_settings
+from .exceptions import RateLimitException
+from .jwt_keys import decode_token
+from .logger import get_logger
+from .redis import get_async_redis
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+TOKEN_BUCKET = "token_bucket"
+SLIDING_WINDOW = "sliding_window"
+
+PRINCIPAL_IP = "ip"
+PRINCIPAL_USER = "user"
+PRINCIPAL_API_KEY = "api_key"
+
+# Refill the bucket for the elapsed time, then try to take ``cost`` tokens.
+# Uses the Redis clock so pods with skewed clocks share one timeline.
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = clock[1] * 1000 + math.floor(clock[2] / 1000)
+
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) / rate)
+end
+redis.call("HSET", KEYS[1], "tokens", tokens, "ts", now)
+redis.call("PEXPIRE", KEYS[1], math.ceil(capacity / rate))
+return {allowed, retry_after}
+"""
+
+# Sliding window counter: the previous window's count is weighted by how much
+# of it still overlaps the sliding window.
+_SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = clock[1] * 1000 + math.floor(clock[2] / 1000)
+
+local current = math.floor(now / window)
+local elapsed = now - current * window
+local previous = tonumber(redis.call("HGET", KEYS[1], current - 1) or "0")
+local count = tonumber(redis.call("HGET", KEYS[1], current) or "0")
+local weighted = previous * (window - elapsed) / window + count
+
+if weighted + cost > limit then
+    local retry_after = window - elapsed
+    if previous > 0 and count + cost <= limit then
+        retry_after = math.ceil((weighted + cost - limit) * window / previous)
+    end
+    return {0, retry_after}
+end
+redis.call("HINCRBY", KEYS[1], current, cost)
+redis.call("HDEL", KEYS[1], current - 2)
+redis.call("PEXPIRE", KEYS[1], window * 2)
+return {1, 0}
+"""
+
+
+@dataclass
+class RateLimitRule:
+    """Limit requests matching ``path`` (a glob) and ``methods`` to ``limit`` per ``period`` seconds."""
+
+    name: str
+    path: str
+    limit: int
+    period: float
+    methods: List[str] = field(default_factory=list)
+    principal: str = PRINCIPAL_IP
+    algorithm: str = TOKEN_BUCKET
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods and method not in self.methods:
+            return False
+        return fnmatch.fnmatchcase(path, self.path)
+
+
+class _LocalBucket:
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+
+class RateLimiter:
+    """Distributed rate limiter with an in-process pre-filter.
+
+    Redis holds the authoritative count. Each pod first checks whether the
+    key was recently rejected and whether its own traffic alone already
+    exceeds the limit; either way the request is refused without a Redis
+    round trip, since one pod's share can never exceed the cluster total.
+    If Redis is unreachable the limiter fails open on the local check only.
+    """
+
+    def __init__(self, prefix: str = settings.RATE_LIMIT_KEY_PREFIX, local_maxsize: int = 100000):
+        self.prefix = prefix
+        self._blocked = LRUCache(maxsize=local_maxsize)
+        self._buckets = LRUCache(maxsize=local_maxsize)
+        self._lock = threading.Lock()
+        self._scripts = {}
+
+    def _script(self, algorithm: str):
+        if algorithm not in self._scripts:
+            source = _TOKEN_BUCKET_SCRIPT if algorithm == TOKEN_BUCKET else _SLIDING_WINDOW_SCRIPT
+            self._scripts[algorithm] = get_async_redis().register_script(source)
+        return self._scripts[algorithm]
+
+    async def hit(self, rule: RateLimitRule, principal: str, cost: int = 1) -> Tuple[bool, float]:
+        """Count a request, returning whether it is allowed and the seconds to wait if not."""
+        key = f"{self.prefix}:{rule.name}:{principal}"
+
+        blocked_until = self._blocked.get(key)
+        now = time.monotonic()
+        if blocked_until is not None and blocked_until > now:
+            return False, blocked_until - now
+
+        allowed, retry_after = self._take_local(key, rule, cost, now)
+        if not allowed:
+            return False, retry_after
+
+        try:
+            if rule.algorithm == TOKEN_BUCKET:
+                args = [rule.limit, rule.limit / (rule.period * 1000), cost]
+            else:
+                args = [rule.limit, int(rule.period * 1000), cost]
+            allowed, retry_after_ms = await self._script(rule.algorithm)(keys=[key], args=args)
+        except Exception as e:
+            logger.warning(
+                "Rate limit check failed",
+                extra={
+                    "rule": rule.name,
+                    "error": str(e),
+                },
+            )
+            return True, 0.0
+
+        if allowed:
+            return True, 0.0
+        retry_after = retry_after_ms / 1000
+        self._blocked.set(key, now + retry_after, ttl=retry_after)
+        return False, retry_after
+
+    def _take_local(self, key: str, rule: RateLimitRule, cost: int, now: float) -> Tuple[bool, float]:
+        rate = rule.limit / rule.period
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = _LocalBucket(rule.limit, now)
+                self._buckets.set(key, bucket, ttl=rule.period)
+            bucket.tokens = min(rule.limit, bucket.tokens + (now - bucket.updated_at) * rate)
+            bucket.updated_at = now
+            if bucket.tokens < cost:
+                return False, (cost - bucket.tokens) / rate
+            bucket.tokens -= cost
+            return True, 0.0
+
+
+def get_principal(request: Request, kind: str) -> str:
+    """Identify who a request counts against; falls back to the client IP."""
+    if kind == PRINCIPAL_API_KEY:
+        api_key = request.headers.get(settings.RATE_LIMIT_API_KEY_HEADER)
+        if api_key:
+            return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:32]
+    elif kind == PRINCIPAL_USER:
+        user_id = _get_user_id(request)
+        if user_id:
+            return f"user:{user_id}"
+    return f"ip:{_get_client_ip(request)}"
+
+
+def _get_client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _get_user_id(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        # Verified, so nobody can drain another user's allowance
+        payload = decode_token(token)
+    except jwt.PyJWTError:
+        return None
+    except Exception:
+        # A misconfigured key ring must not turn every request into a 500
+        logger.exception("Failed to verify token for rate limiting")
+        return None
+    return payload.get("sub")
+
+
+# Applied in order; every matching rule is enforced
+DEFAULT_RATE_LIMIT_RULES = [
+    RateLimitRule(
+        name="login",
+        path=f"{settings.API_V1_STR}/auth/login",
+        methods=["POST"],
+        limit=settings.RATE_LIMIT_LOGIN_PER_MINUTE,
+        period=60,
+        algorithm=SLIDING_WINDOW,
+    ),
+    RateLimitRule(
+        name="register",
+        path=f"{settings.API_V1_STR}/auth/register",
+        methods=["POST"],
+        limit=settings.RATE_LIMIT_REGISTER_PER_HOUR,
+        period=3600,
+        algorithm=SLIDING_WINDOW,
+    ),
+    RateLimitRule(
+        name="api",
+        path=f"{settings.API_V1_STR}/*",
+        limit=settings.RATE_LIMIT_DEFAULT_PER_MINUTE,
+        period=60,
+        principal=PRINCIPAL_USER,
+    ),
+]
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """Reject requests over their rules' limits with 429 and Retry-After."""
+
+    def __init__(self, app, rules: Optional[List[RateLimitRule]] = None, limiter: Optional[RateLimiter] = None):
+        super().__init__(app)
+        self.rules = rules if rules is not None else DEFAULT_RATE_LIMIT_RULES
+        self.limiter = limiter or RateLimiter()
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        for rule in self.rules:
+            if not rule.matches(request.method, request.url.path):
+                continue
+            allowed, retry_after = await self.limiter.hit(rule, get_principal(request, rule.principal))
+            if not allowed:
+                exc = RateLimitException(retry_after=retry_after)
+                return JSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+        return await call_next(request)
@@ -1,20 +1,37 @@
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
 import redis
+import redis.asyncio as aioredis
 from redis import Redis
 
 from .config import get_settings
 
 settings = get_settings()
 
+
+def _pool_kwargs(decode_responses: bool) -> dict:
+    return dict(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD,
+        db=settings.REDIS_DB,
+        decode_responses=decode_responses,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+
+
 # Create Redis connection pool
-redis_pool = redis.ConnectionPool(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    password=settings.REDIS_PASSWORD,
-    db=settings.REDIS_DB,
-    decode_responses=True,
-)
+redis_pool = redis.ConnectionPool(**_pool_kwargs(decode_responses=True))
+
+# Connection pool returning raw bytes, for serialized cache payloads
+redis_binary_pool = redis.ConnectionPool(**_pool_kwargs(decode_responses=False))
+
+# Async connection pools, for use from request handlers
+async_redis_pool = aioredis.ConnectionPool(**_pool_kwargs(decode_responses=True))
+async_redis_binary_pool = aioredis.ConnectionPool(**_pool_kwargs(decode_responses=False))
 
 
 def get_redis() -> Redis:
@@ -22,6 +39,21 @@ def get_redis() -> Redis:
     return redis.Redis(connection_pool=redis_pool)
 
 
+def get_binary_redis() -> Redis:
+    """Get Redis client that does not decode responses."""
+    return redis.Redis(connection_pool=redis_binary_pool)
+
+
+def get_async_redis() -> aioredis.Redis:
+    """Get async Redis client."""
+    return aioredis.Redis(connection_pool=async_redis_pool)
+
+
+def get_async_binary_redis() -> aioredis.Redis:
+    """Get async Redis client that does not decode responses."""
+    return aioredis.Redis(connection_pool=async_redis_binary_pool)
+
+
 def get_cached_value(key: str) -> Optional[str]:
     """Get value from Redis cache."""
     redis_client = get_redis()
@@ -37,4 +69,58 @@ def set_cached_value(key: str, value: str, expire: int = 3600) -> bool:
 def delete_cached_value(key: str) -> bool:
     """Delete value from Redis cache."""
     redis_client = get_redis()
-    return redis_client.delete(key) > 0 
\ No newline at end of file
+    return redis_client.delete(key) > 0
+
+
+async def async_get_cached_value(key: str) -> Optional[str]:
+    """Get value from Redis cache without blocking the event loop."""
+    return await get_async_redis().get(key)
+
+
+async def async_set_cached_value(key: str, value: str, expire: int = 3600) -> bool:
+    """Set value in Redis cache without blocking the event loop."""
+    return await get_async_redis().set(key, value, ex=expire)
+
+
+async def async_delete_cached_value(key: str) -> bool:
+    """Delete value from Redis cache without blocking the event loop."""
+    return await get_async_redis().delete(key) > 0
+
+
+async def mget(keys: List[str]) -> List[Optional[str]]:
+    """Get several values in one round trip."""
+    if not keys:
+        return []
+    return await get_async_redis().mget(keys)
+
+
+async def mset(mapping: Dict[str, str], expire: int = 3600) -> None:
+    """Set several values with a shared expiry in one pipelined round trip."""
+    if not mapping:
+        return
+    async with get_async_redis().pipeline(transaction=False) as pipe:
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=expire)
+        await pipe.execute()
+
+
+async def delete_many(keys: Iterable[str]) -> int:
+    """Delete several keys in one round trip, returning how many existed."""
+    keys = list(keys)
+    if not keys:
+        return 0
+    return await get_async_redis().delete(*keys)
+
+
+async def ping() -> bool:
+    """Check that Redis is reachable."""
+    try:
+        return await get_async_redis().ping()
+    except redis.RedisError:
+        return False
+
+
+async def close_redis() -> None:
+    """Close the async connection pools."""
+    await async_redis_pool.disconnect()
+    await async_redis_binary_pool.disconnect()
@@ -140,6 +140,135 @@ class EmailVerification(BaseModel):
     token: str
 
 
+class CourseBase(BaseSchema):
+    """Course schema."""
+
+    title: str
+    description: Optional[str] = None
+    instructor_id: UUID
+    level: Optional[str] = None
+    duration: Optional[int] = None
+    price: Optional[int] = None
+    is_published: bool = False
+
+
+class CourseCreate(BaseModel):
+    """Course creation schema."""
+
+    title: str
+    description: Optional[str] = None
+    level: Optional[str] = None
+    duration: Optional[int] = None
+    price: Optional[int] = None
+
+
+class CourseUpdate(BaseModel):
+    """Course update schema."""
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    level: Optional[str] = None
+    duration: Optional[int] = None
+    price: Optional[int] = None
+    is_published: Optional[bool] = None
+
+
+class ModuleBase(BaseSchema):
+    """Module schema."""
+
+    course_id: UUID
+    title: str
+    description: Optional[str] = None
+    order: int
+
+
+class ModuleCreate(BaseModel):
+    """Module creation schema."""
+
+    title: str
+    description: Optional[str] = None
+    order: int
+
+
+class ModuleUpdate(BaseModel):
+    """Module update schema."""
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    order: Optional[int] = None
+
+
+class LessonBase(BaseSchema):
+    """Lesson schema."""
+
+    module_id: UUID
+    title: str
+    description: Optional[str] = None
+    content: Optional[str] = None
+    content_hash: Optional[str] = None
+    content_size: Optional[int] = None
+    order: int
+    duration: Optional[int] = None
+
+
+class LessonSummary(BaseSchema):
+    """Lesson schema for listings, without the content body."""
+
+    module_id: UUID
+    title: str
+    description: Optional[str] = None
+    content_hash: Optional[str] = None
+    content_size: Optional[int] = None
+    order: int
+    duration: Optional[int] = None
+
+
+class LessonCreate(BaseModel):
+    """Lesson creation schema."""
+
+    title: str
+    description: Optional[str] = None
+    content: Optional[str] = None
+    order: int
+    duration: Optional[int] = None
+
+
+class LessonUpdate(BaseModel):
+    """Lesson update schema."""
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    content: Optional[str] = None
+    order: Optional[int] = None
+    duration: Optional[int] = None
+
+
+class LessonOutline(BaseModel):
+    """Lesson entry of a course outline, without its content."""
+
+    id: UUID
+    title: str
+    description: Optional[str] = None
+    order: int
+    duration: Optional[int] = None
+
+
+class ModuleOutline(BaseModel):
+    """Module entry of a course outline."""
+
+    id: UUID
+    title: str
+    description: Optional[str] = None
+    order: int
+    lessons: List[LessonOutline] = []
+
+
+class CourseOutline(CourseBase):
+    """Course with its modules and lessons."""
+
+    modules: List[ModuleOutline] = []
+
+
 class SearchQuery(BaseModel):
     """Search query schema."""
 
@@ -159,6 +288,17 @@ class SearchResponse(BaseModel):
     size: int
     pages: int
     aggregations: Optional[Dict[str, Any]] = None
+    # Opaque search_after cursor for the next page, if there may be one
+    next_cursor: Optional[str] = None
+
+
+class CourseSuggestion(BaseModel):
+    """Course autocomplete entry."""
+
+    id: UUID
+    title: str
+    instructor_name: Optional[str] = None
+    text: str  # the title or instructor name that matched
 
 
 class Event(BaseModel):
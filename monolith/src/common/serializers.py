@@ -0,0 +1,152 @@
+import importlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, Type
+
+import orjson
+from google.protobuf import json_format
+
+from .config import get_settings
+
+settings = get_settings()
+
+CONTENT_TYPE_HEADER = "content-type"
+JSON_CONTENT_TYPE = "application/json"
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+
+# Event type -> (generated module, message name) for the protobuf serializer
+PROTOBUF_EVENT_MESSAGES: Dict[str, Tuple[str, str]] = {
+    "user.created": ("user_pb2", "UserCreatedEvent"),
+    "user.updated": ("user_pb2", "UserUpdatedEvent"),
+    "user.deleted": ("user_pb2", "UserDeletedEvent"),
+    "user.profile.created": ("user_pb2", "UserProfileCreatedEvent"),
+    "user.profile.updated": ("user_pb2", "UserProfileUpdatedEvent"),
+    "course.created": ("course_pb2", "CourseCreatedEvent"),
+    "course.updated": ("course_pb2", "CourseUpdatedEvent"),
+    "course.deleted": ("course_pb2", "CourseDeletedEvent"),
+    "module.created": ("course_pb2", "ModuleCreatedEvent"),
+    "module.updated": ("course_pb2", "ModuleUpdatedEvent"),
+    "module.deleted": ("course_pb2", "ModuleDeletedEvent"),
+    "lesson.created": ("course_pb2", "LessonCreatedEvent"),
+    "lesson.updated": ("course_pb2", "LessonUpdatedEvent"),
+    "lesson.deleted": ("course_pb2", "LessonDeletedEvent"),
+}
+
+
+class EventSerializer(ABC):
+    """Encodes event envelopes (event_type, event_id, timestamp, data) to bytes."""
+
+    content_type: str
+
+    @abstractmethod
+    def serialize(self, event: Dict[str, Any]) -> bytes:
+        """Encode an event envelope."""
+
+    @abstractmethod
+    def deserialize(self, payload: bytes) -> Dict[str, Any]:
+        """Decode an event envelope."""
+
+
+class JsonEventSerializer(EventSerializer):
+    """Serialize events as JSON using orjson."""
+
+    content_type = JSON_CONTENT_TYPE
+
+    def serialize(self, event: Dict[str, Any]) -> bytes:
+        return orjson.dumps(event)
+
+    def deserialize(self, payload: bytes) -> Dict[str, Any]:
+        return orjson.loads(payload)
+
+
+class ProtobufEventSerializer(EventSerializer):
+    """Serialize events with the messages generated from ``protobuf/*.proto``."""
+
+    content_type = PROTOBUF_CONTENT_TYPE
+
+    def __init__(self):
+        self._envelope_cls = self._load_message("events_pb2", "EventEnvelope")
+        self._message_classes: Dict[str, Type[Any]] = {}
+
+    def serialize(self, event: Dict[str, Any]) -> bytes:
+        message_cls = self._message_class(event["event_type"])
+        data = {name: value for name, value in event["data"].items() if value is not None}
+        try:
+            # Unknown fields raise rather than being dropped from the event
+            message = json_format.ParseDict(data, message_cls())
+        except json_format.ParseError as e:
+            raise ValueError(f"Event {event['event_type']} does not match {message_cls.__name__}: {e}") from e
+        envelope = self._envelope_cls(
+            event_type=event["event_type"],
+            event_id=event["event_id"],
+            timestamp=event["timestamp"],
+            data=message.SerializeToString(),
+        )
+        return envelope.SerializeToString()
+
+    def deserialize(self, payload: bytes) -> Dict[str, Any]:
+        envelope = self._envelope_cls.FromString(payload)
+        message = self._message_class(envelope.event_type).FromString(envelope.data)
+        return {
+            "event_type": envelope.event_type,
+            "event_id": envelope.event_id,
+            "timestamp": envelope.timestamp,
+            "data": self._message_to_dict(message),
+        }
+
+    def _message_class(self, event_type: str) -> Type[Any]:
+        message_cls = self._message_classes.get(event_type)
+        if message_cls is None:
+            if event_type not in PROTOBUF_EVENT_MESSAGES:
+                raise ValueError(f"No protobuf message registered for event type {event_type}")
+            message_cls = self._load_message(*PROTOBUF_EVENT_MESSAGES[event_type])
+            self._message_classes[event_type] = message_cls
+        return message_cls
+
+    @staticmethod
+    def _load_message(module_name: str, message_name: str) -> Type[Any]:
+        module = importlib.import_module(f"{__package__}.proto.{module_name}")
+        return getattr(module, message_name)
+
+    @staticmethod
+    def _message_to_dict(message: Any) -> Dict[str, Any]:
+        """Convert a flat event message to a dict, mapping unset optional fields to None."""
+        data = {}
+        for field in message.DESCRIPTOR.fields:
+            try:
+                present = message.HasField(field.name)
+            except ValueError:
+                # Plain proto3 scalars have no presence; their value is always meaningful
+                present = True
+            data[field.name] = getattr(message, field.name) if present else None
+        return data
+
+
+_SERIALIZER_CLASSES: Dict[str, Type[EventSerializer]] = {
+    "json": JsonEventSerializer,
+    "protobuf": ProtobufEventSerializer,
+}
+_CONTENT_TYPES: Dict[str, str] = {
+    JSON_CONTENT_TYPE: "json",
+    PROTOBUF_CONTENT_TYPE: "protobuf",
+}
+_serializers: Dict[str, EventSerializer] = {}
+
+
+def get_event_serializer(name: Optional[str] = None) -> EventSerializer:
+    """Get a serializer by name, defaulting to ``KAFKA_EVENT_SERIALIZER``."""
+    name = name or settings.KAFKA_EVENT_SERIALIZER
+    if name not in _serializers:
+        if name not in _SERIALIZER_CLASSES:
+            raise ValueError(f"Unknown event serializer {name}")
+        _serializers[name] = _SERIALIZER_CLASSES[name]()
+    return _serializers[name]
+
+
+def get_serializer_for_content_type(content_type: Optional[str]) -> EventSerializer:
+    """Get the serializer matching a message's content-type header (JSON if absent)."""
+    if not content_type:
+        return get_event_serializer("json")
+    name = _CONTENT_TYPES.get(content_type.split(";", 1)[0].strip())
+    if name is None:
+        raise ValueError(f"Unsupported event content type {content_type}")
+    return get_event_serializer(name)
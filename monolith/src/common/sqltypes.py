@@ -0,0 +1,44 @@
+import zlib
+from typing import Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+# First byte of a stored value says how the rest is encoded
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class CompressedText(TypeDecorator):
+    """Text stored zlib-compressed in a binary column.
+
+    Values shorter than ``min_size`` bytes are stored as-is, since
+    compressing them costs more CPU than it saves space.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, min_size: int = 512, level: int = 6):
+        super().__init__()
+        self.min_size = min_size
+        self.level = level
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        data = value.encode("utf-8")
+        if len(data) < self.min_size:
+            return _RAW + data
+        return _ZLIB + zlib.compress(data, self.level)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Column not migrated to bytea yet (db/migrations/0001)
+            return value
+        value = bytes(value)
+        if value[:1] == _ZLIB:
+            return zlib.decompress(value[1:]).decode("utf-8")
+        return value[1:].decode("utf-8")
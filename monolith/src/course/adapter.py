@@ -5,7 +5,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..common.database import get_session
-from ..common.schemas import CourseBase, ModuleBase, LessonBase
+from ..common.schemas import (
+    CourseBase,
+    CourseOutline,
+    ModuleBase,
+    ModuleOutline,
+    LessonBase,
+    LessonOutline,
+    LessonSummary,
+)
 from .model import Course, Module, Lesson
 from .service import CourseService
 
@@ -48,8 +56,50 @@ def to_lesson_schema(lesson: Lesson) -> LessonBase:
         title=lesson.title,
         description=lesson.description,
         content=lesson.content,
+        content_hash=lesson.content_hash,
+        content_size=lesson.content_size,
         order=lesson.order,
         duration=lesson.duration,
         created_at=lesson.created_at,
         updated_at=lesson.updated_at,
-    ) 
\ No newline at end of file
+    )
+
+
+def to_lesson_summary_schema(lesson: Lesson) -> LessonSummary:
+    return LessonSummary(
+        id=lesson.id,
+        module_id=lesson.module_id,
+        title=lesson.title,
+        description=lesson.description,
+        content_hash=lesson.content_hash,
+        content_size=lesson.content_size,
+        order=lesson.order,
+        duration=lesson.duration,
+        created_at=lesson.created_at,
+        updated_at=lesson.updated_at,
+    )
+
+
+def to_course_outline_schema(course: Course) -> CourseOutline:
+    return CourseOutline(
+        **to_course_schema(course).dict(),
+        modules=[
+            ModuleOutline(
+                id=module.id,
+                title=module.title,
+                description=module.description,
+                order=module.order,
+                lessons=[
+                    LessonOutline(
+                        id=lesson.id,
+                        title=lesson.title,
+                        description=lesson.description,
+                        order=lesson.order,
+                        duration=lesson.duration,
+                    )
+                    for lesson in module.lessons
+                ],
+            )
+            for module in course.modules
+        ],
+    )
\ No newline at end of file
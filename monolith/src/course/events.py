@@ -3,7 +3,9 @@
 from typing import Optional
 from uuid import UUID
 
-from ..common.kafka import produce_event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..common.outbox import stage_event
 
 
 @dataclass
@@ -17,8 +19,9 @@ class CourseCreatedEvent:
     price: Optional[int]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "course.created",
             {
                 "course_id": str(self.course_id),
@@ -45,8 +48,9 @@ class CourseUpdatedEvent:
     is_published: Optional[bool]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "course.updated",
             {
                 "course_id": str(self.course_id),
@@ -68,8 +72,9 @@ class CourseDeletedEvent:
     instructor_id: UUID
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "course.deleted",
             {
                 "course_id": str(self.course_id),
@@ -88,8 +93,9 @@ class ModuleCreatedEvent:
     order: int
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "module.created",
             {
                 "module_id": str(self.module_id),
@@ -111,8 +117,9 @@ class ModuleUpdatedEvent:
     order: Optional[int]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "module.updated",
             {
                 "module_id": str(self.module_id),
@@ -131,8 +138,9 @@ class ModuleDeletedEvent:
     course_id: UUID
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "module.deleted",
             {
                 "module_id": str(self.module_id),
@@ -148,20 +156,23 @@ class LessonCreatedEvent:
     module_id: UUID
     title: str
     description: Optional[str]
-    content: Optional[str]
+    content_hash: Optional[str]
+    content_size: Optional[int]
     order: int
     duration: Optional[int]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "lesson.created",
             {
                 "lesson_id": str(self.lesson_id),
                 "module_id": str(self.module_id),
                 "title": self.title,
                 "description": self.description,
-                "content": self.content,
+                "content_hash": self.content_hash,
+                "content_size": self.content_size,
                 "order": self.order,
                 "duration": self.duration,
                 "timestamp": self.timestamp.isoformat(),
@@ -175,20 +186,23 @@ class LessonUpdatedEvent:
     module_id: UUID
     title: Optional[str]
     description: Optional[str]
-    content: Optional[str]
+    content_hash: Optional[str]
+    content_size: Optional[int]
     order: Optional[int]
     duration: Optional[int]
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "lesson.updated",
             {
                 "lesson_id": str(self.lesson_id),
                 "module_id": str(self.module_id),
                 "title": self.title,
                 "description": self.description,
-                "content": self.content,
+                "content_hash": self.content_hash,
+                "content_size": self.content_size,
                 "order": self.order,
                 "duration": self.duration,
                 "timestamp": self.timestamp.isoformat(),
@@ -202,8 +216,9 @@ class LessonDeletedEvent:
     module_id: UUID
     timestamp: datetime = datetime.utcnow()
 
-    async def publish(self):
-        await produce_event(
+    def stage(self, session: AsyncSession) -> None:
+        stage_event(
+            session,
             "lesson.deleted",
             {
                 "lesson_id": str(self.lesson_id),
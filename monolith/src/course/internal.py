@@ -6,30 +6,23 @@
 from ..common.schemas import (
     CourseBase,
     CourseCreate,
+    CourseOutline,
     CourseUpdate,
     ModuleBase,
     ModuleCreate,
     ModuleUpdate,
     LessonBase,
     LessonCreate,
+    LessonSummary,
     LessonUpdate,
 )
 from .adapter import (
     get_course_service,
+    to_course_outline_schema,
     to_course_schema,
     to_module_schema,
     to_lesson_schema,
-)
-from .events import (
-    CourseCreatedEvent,
-    CourseUpdatedEvent,
-    CourseDeletedEvent,
-    ModuleCreatedEvent,
-    ModuleUpdatedEvent,
-    ModuleDeletedEvent,
-    LessonCreatedEvent,
-    LessonUpdatedEvent,
-    LessonDeletedEvent,
+    to_lesson_summary_schema,
 )
 from .service import CourseService
 
@@ -43,16 +36,6 @@ async def create_course(
     course_service: CourseService = Depends(get_course_service),
 ):
     course = await course_service.create_course(instructor_id, course_data)
-    event = CourseCreatedEvent(
-        course_id=course.id,
-        instructor_id=course.instructor_id,
-        title=course.title,
-        description=course.description,
-        level=course.level,
-        duration=course.duration,
-        price=course.price,
-    )
-    await event.publish()
     return to_course_schema(course)
 
 
@@ -65,6 +48,15 @@ async def get_course(
     return to_course_schema(course)
 
 
+@router.get("/{course_id}/outline", response_model=CourseOutline)
+async def get_course_outline(
+    course_id: UUID,
+    course_service: CourseService = Depends(get_course_service),
+):
+    course = await course_service.get_course_outline(course_id)
+    return to_course_outline_schema(course)
+
+
 @router.get("/instructor/{instructor_id}", response_model=List[CourseBase])
 async def get_instructor_courses(
     instructor_id: UUID,
@@ -82,17 +74,6 @@ async def update_course(
     course_service: CourseService = Depends(get_course_service),
 ):
     course = await course_service.update_course(course_id, instructor_id, course_data)
-    event = CourseUpdatedEvent(
-        course_id=course.id,
-        instructor_id=course.instructor_id,
-        title=course.title,
-        description=course.description,
-        level=course.level,
-        duration=course.duration,
-        price=course.price,
-        is_published=course.is_published,
-    )
-    await event.publish()
     return to_course_schema(course)
 
 
@@ -103,8 +84,6 @@ async def delete_course(
     course_service: CourseService = Depends(get_course_service),
 ):
     await course_service.delete_course(course_id, instructor_id)
-    event = CourseDeletedEvent(course_id=course_id, instructor_id=instructor_id)
-    await event.publish()
 
 
 @router.post("/{course_id}/modules", response_model=ModuleBase, status_code=status.HTTP_201_CREATED)
@@ -115,14 +94,6 @@ async def create_module(
     course_service: CourseService = Depends(get_course_service),
 ):
     module = await course_service.create_module(course_id, instructor_id, module_data)
-    event = ModuleCreatedEvent(
-        module_id=module.id,
-        course_id=module.course_id,
-        title=module.title,
-        description=module.description,
-        order=module.order,
-    )
-    await event.publish()
     return to_module_schema(module)
 
 
@@ -143,14 +114,6 @@ async def update_module(
     course_service: CourseService = Depends(get_course_service),
 ):
     module = await course_service.update_module(module_id, instructor_id, module_data)
-    event = ModuleUpdatedEvent(
-        module_id=module.id,
-        course_id=module.course_id,
-        title=module.title,
-        description=module.description,
-        order=module.order,
-    )
-    await event.publish()
     return to_module_schema(module)
 
 
@@ -160,10 +123,7 @@ async def delete_module(
     instructor_id: UUID,
     course_service: CourseService = Depends(get_course_service),
 ):
-    module = await course_service.get_module(module_id)
     await course_service.delete_module(module_id, instructor_id)
-    event = ModuleDeletedEvent(module_id=module_id, course_id=module.course_id)
-    await event.publish()
 
 
 @router.post("/modules/{module_id}/lessons", response_model=LessonBase, status_code=status.HTTP_201_CREATED)
@@ -174,26 +134,16 @@ async def create_lesson(
     course_service: CourseService = Depends(get_course_service),
 ):
     lesson = await course_service.create_lesson(module_id, instructor_id, lesson_data)
-    event = LessonCreatedEvent(
-        lesson_id=lesson.id,
-        module_id=lesson.module_id,
-        title=lesson.title,
-        description=lesson.description,
-        content=lesson.content,
-        order=lesson.order,
-        duration=lesson.duration,
-    )
-    await event.publish()
     return to_lesson_schema(lesson)
 
 
-@router.get("/modules/{module_id}/lessons", response_model=List[LessonBase])
+@router.get("/modules/{module_id}/lessons", response_model=List[LessonSummary])
 async def get_module_lessons(
     module_id: UUID,
     course_service: CourseService = Depends(get_course_service),
 ):
     lessons = await course_service.get_module_lessons(module_id)
-    return [to_lesson_schema(lesson) for lesson in lessons]
+    return [to_lesson_summary_schema(lesson) for lesson in lessons]
 
 
 @router.put("/lessons/{lesson_id}", response_model=LessonBase)
@@ -204,16 +154,6 @@ async def update_lesson(
     course_service: CourseService = Depends(get_course_service),
 ):
     lesson = await course_service.update_lesson(lesson_id, instructor_id, lesson_data)
-    event = LessonUpdatedEvent(
-        lesson_id=lesson.id,
-        module_id=lesson.module_id,
-        title=lesson.title,
-        description=lesson.description,
-        content=lesson.content,
-        order=lesson.order,
-        duration=lesson.duration,
-    )
-    await event.publish()
     return to_lesson_schema(lesson)
 
 
@@ -223,7 +163,4 @@ async def delete_lesson(
     instructor_id: UUID,
     course_service: CourseService = Depends(get_course_service),
 ):
-    lesson = await course_service.get_lesson(lesson_id)
-    await course_service.delete_lesson(lesson_id, instructor_id)
-    event = LessonDeletedEvent(lesson_id=lesson_id, module_id=lesson.module_id)
-    await event.publish() 
\ No newline at end of file
+    await course_service.delete_lesson(lesson_id, instructor_id) 
\ No newline at end of file
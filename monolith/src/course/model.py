@@ -1,12 +1,14 @@
+import hashlib
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from ..common.database import Base
+from ..common.sqltypes import CompressedText
 
 
 class Course(Base):
@@ -24,8 +26,9 @@ class Course(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    instructor = relationship("User", back_populates="courses")
-    modules = relationship("Module", back_populates="course", cascade="all, delete-orphan")
+    modules = relationship(
+        "Module", back_populates="course", cascade="all, delete-orphan", order_by="Module.order"
+    )
 
 
 class Module(Base):
@@ -41,7 +44,9 @@ class Module(Base):
 
     # Relationships
     course = relationship("Course", back_populates="modules")
-    lessons = relationship("Lesson", back_populates="module", cascade="all, delete-orphan")
+    lessons = relationship(
+        "Lesson", back_populates="module", cascade="all, delete-orphan", order_by="Lesson.order"
+    )
 
 
 class Lesson(Base):
@@ -51,7 +56,10 @@ class Lesson(Base):
     module_id = Column(PGUUID(as_uuid=True), ForeignKey("modules.id"), nullable=False)
     title = Column(String, nullable=False)
     description = Column(Text)
-    content = Column(Text)
+    # Loaded only on request (undefer), and accessing it unloaded raises instead of lazy-loading
+    content = deferred(Column(CompressedText), raiseload=True)
+    content_hash = Column(String(64))  # sha256 of the uncompressed content
+    content_size = Column(Integer)  # uncompressed size in bytes
     order = Column(Integer, nullable=False)
     duration = Column(Integer)  # in minutes
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -59,5 +67,14 @@ class Lesson(Base):
 
     # Relationships
     module = relationship("Module", back_populates="lessons")
-    video_assets = relationship("VideoAsset", back_populates="lesson", cascade="all, delete-orphan")
-    assessments = relationship("Assessment", back_populates="lesson", cascade="all, delete-orphan") 
\ No newline at end of file
+
+    def set_content(self, content: Optional[str]) -> None:
+        """Set the content along with its hash and size."""
+        self.content = content
+        if content is None:
+            self.content_hash = None
+            self.content_size = None
+        else:
+            data = content.encode("utf-8")
+            self.content_hash = hashlib.sha256(data).hexdigest()
+            self.content_size = len(data) 
\ No newline at end of file
@@ -1,11 +1,22 @@
-from typing import List, Optional
+from typing import AsyncIterator, Collection, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import String, column, table
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload, selectinload, undefer
 
 from .model import Course, Module, Lesson
 
+# Owned by the auth module; a bare table keeps its user model out of this import graph
+users = table(
+    "users",
+    column("id", PGUUID(as_uuid=True)),
+    column("first_name", String),
+    column("last_name", String),
+)
+
 
 class CourseRepository:
     def __init__(self, session: AsyncSession):
@@ -23,6 +34,67 @@ async def get_by_id(self, course_id: UUID) -> Optional[Course]:
         )
         return result.scalar_one_or_none()
 
+    async def get_outline(self, course_id: UUID) -> Optional[Course]:
+        """Load a course with its modules and lessons in one query, without lesson content."""
+        result = await self.session.execute(
+            select(Course)
+            .where(Course.id == course_id)
+            .options(
+                joinedload(Course.modules)
+                .joinedload(Module.lessons)
+                .defer(Lesson.content)
+            )
+        )
+        return result.unique().scalar_one_or_none()
+
+    async def get_owner(self, course_id: UUID) -> Optional[UUID]:
+        """Instructor id of a course, without loading it."""
+        result = await self.session.execute(
+            select(Course.instructor_id).where(Course.id == course_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_many_with_lessons(self, course_ids: Collection[UUID]) -> List[Course]:
+        """Courses with their modules and lessons (without content); missing ids are skipped."""
+        result = await self.session.execute(
+            select(Course)
+            .where(Course.id.in_(course_ids))
+            .options(selectinload(Course.modules).selectinload(Module.lessons))
+        )
+        return result.scalars().all()
+
+    async def iter_with_lessons(self, batch_size: int = 500) -> AsyncIterator[List[Course]]:
+        """Stream every course with its modules and lessons (without content), a page at a time.
+
+        Pages are keyed on id rather than offset, and each page is expunged
+        before the next is loaded so the session does not grow with the table.
+        """
+        last_id = None
+        while True:
+            query = (
+                select(Course)
+                .order_by(Course.id)
+                .limit(batch_size)
+                .options(selectinload(Course.modules).selectinload(Module.lessons))
+            )
+            if last_id is not None:
+                query = query.where(Course.id > last_id)
+            courses = (await self.session.execute(query)).scalars().all()
+            if not courses:
+                return
+            yield courses
+            last_id = courses[-1].id
+            self.session.expunge_all()
+
+    async def get_instructor_names(self, instructor_ids: Collection[UUID]) -> Dict[UUID, str]:
+        result = await self.session.execute(
+            select(users.c.id, users.c.first_name, users.c.last_name).where(users.c.id.in_(instructor_ids))
+        )
+        return {
+            user_id: " ".join(name for name in (first_name, last_name) if name)
+            for user_id, first_name, last_name in result
+        }
+
     async def get_by_instructor(self, instructor_id: UUID) -> List[Course]:
         result = await self.session.execute(
             select(Course).where(Course.instructor_id == instructor_id)
@@ -55,6 +127,31 @@ async def get_by_id(self, module_id: UUID) -> Optional[Module]:
         )
         return result.scalar_one_or_none()
 
+    async def get_owner(self, module_id: UUID) -> Optional[UUID]:
+        """Instructor id of a module's course, without loading either."""
+        result = await self.session.execute(
+            select(Course.instructor_id)
+            .join(Module, Module.course_id == Course.id)
+            .where(Module.id == module_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_with_owner(self, module_id: UUID) -> Optional[Tuple[Module, UUID]]:
+        """A module and its course's instructor id, in one query."""
+        result = await self.session.execute(
+            select(Module, Course.instructor_id)
+            .join(Course, Module.course_id == Course.id)
+            .where(Module.id == module_id)
+        )
+        return result.one_or_none()
+
+    async def get_course_ids(self, module_ids: Collection[UUID]) -> Dict[UUID, UUID]:
+        """Course id of each module that still exists."""
+        result = await self.session.execute(
+            select(Module.id, Module.course_id).where(Module.id.in_(module_ids))
+        )
+        return dict(result.all())
+
     async def get_by_course(self, course_id: UUID) -> List[Module]:
         result = await self.session.execute(
             select(Module)
@@ -73,6 +170,11 @@ async def delete(self, module: Module) -> None:
         await self.session.commit()
 
 
+# Refreshing by name includes the deferred content column. Read from the
+# table so importing this module does not force mapper configuration.
+_LESSON_ATTRIBUTES = [column.key for column in Lesson.__table__.columns]
+
+
 class LessonRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -80,15 +182,27 @@ def __init__(self, session: AsyncSession):
     async def create(self, lesson: Lesson) -> Lesson:
         self.session.add(lesson)
         await self.session.commit()
-        await self.session.refresh(lesson)
+        await self.session.refresh(lesson, _LESSON_ATTRIBUTES)
         return lesson
 
     async def get_by_id(self, lesson_id: UUID) -> Optional[Lesson]:
         result = await self.session.execute(
-            select(Lesson).where(Lesson.id == lesson_id)
+            select(Lesson)
+            .where(Lesson.id == lesson_id)
+            .options(undefer(Lesson.content))
         )
         return result.scalar_one_or_none()
 
+    async def get_with_owner(self, lesson_id: UUID) -> Optional[Tuple[Lesson, UUID]]:
+        """A lesson and its course's instructor id, in one query."""
+        result = await self.session.execute(
+            select(Lesson, Course.instructor_id)
+            .join(Module, Lesson.module_id == Module.id)
+            .join(Course, Module.course_id == Course.id)
+            .where(Lesson.id == lesson_id)
+        )
+        return result.one_or_none()
+
     async def get_by_module(self, module_id: UUID) -> List[Lesson]:
         result = await self.session.execute(
             select(Lesson)
@@ -99,7 +213,7 @@ async def get_by_module(self, module_id: UUID) -> List[Lesson]:
 
     async def update(self, lesson: Lesson) -> Lesson:
         await self.session.commit()
-        await self.session.refresh(lesson)
+        await self.session.refresh(lesson, _LESSON_ATTRIBUTES)
         return lesson
 
     async def delete(self, lesson: Lesson) -> None:
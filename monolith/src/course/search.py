@@ -0,0 +1,468 @@
+import asyncio
+import math
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from ..common.cache import LRUCache
+from ..common.config import get_settings
+from ..common.database import AsyncSessionLocal
+from ..common.elasticsearch import (
+    bulk_index,
+    close_connection,
+    ensure_versioned_index,
+    get_write_indices,
+    rebuild_index,
+    search_documents,
+    search_page,
+    streaming_bulk,
+    suggest_documents,
+)
+from ..common.exceptions import SearchException
+from ..common.logger import get_logger
+from ..common.schemas import SearchResponse
+from .model import Course
+from .repository import CourseRepository, ModuleRepository
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Alias searches and writes go through; the index behind it is courses_v<n>
+COURSES_INDEX = "courses"
+
+COURSE_INDEX_SETTINGS = {
+    "number_of_shards": 1,
+}
+
+COURSE_MAPPINGS = {
+    "dynamic": "strict",
+    "properties": {
+        "id": {"type": "keyword"},
+        "title": {"type": "text", "fields": {"keyword": {"type": "keyword"}}},
+        "description": {"type": "text"},
+        "instructor_id": {"type": "keyword"},
+        "instructor_name": {"type": "text"},
+        # Autocomplete over titles and instructor names; only set for published courses
+        "suggest": {"type": "completion"},
+        "level": {"type": "keyword"},
+        "duration": {"type": "integer"},
+        "price": {"type": "integer"},
+        "is_published": {"type": "boolean"},
+        "created_at": {"type": "date"},
+        "updated_at": {"type": "date"},
+        "module_count": {"type": "integer"},
+        "lesson_count": {"type": "integer"},
+        "modules": {
+            "properties": {
+                "id": {"type": "keyword"},
+                "title": {"type": "text"},
+                "description": {"type": "text"},
+            },
+        },
+        "lessons": {
+            "properties": {
+                "id": {"type": "keyword"},
+                "title": {"type": "text"},
+                "description": {"type": "text"},
+            },
+        },
+    },
+}
+
+
+def course_document(course: Course, instructor_name: Optional[str] = None) -> Dict[str, Any]:
+    """Search document for a course with its modules and lessons loaded."""
+    lessons = [lesson for module in course.modules for lesson in module.lessons]
+    suggest = [course.title]
+    if instructor_name:
+        suggest.append(instructor_name)
+    return {
+        "id": str(course.id),
+        "title": course.title,
+        "description": course.description,
+        "instructor_id": str(course.instructor_id),
+        "instructor_name": instructor_name,
+        "level": course.level,
+        "duration": course.duration,
+        "price": course.price,
+        "is_published": course.is_published,
+        "suggest": suggest if course.is_published else [],
+        "created_at": course.created_at.isoformat() if course.created_at else None,
+        "updated_at": course.updated_at.isoformat() if course.updated_at else None,
+        "module_count": len(course.modules),
+        "lesson_count": len(lessons),
+        "modules": [
+            {"id": str(module.id), "title": module.title, "description": module.description}
+            for module in course.modules
+        ],
+        "lessons": [
+            {"id": str(lesson.id), "title": lesson.title, "description": lesson.description}
+            for lesson in lessons
+        ],
+    }
+
+
+def _read_version() -> int:
+    """Document version for course data read from the primary after this call.
+
+    Course documents are written with external versioning, so of two
+    writes of the same course the one that read the database later wins,
+    whatever order they reach the index in. Pods' clocks are assumed to
+    agree to well within the time between two changes to one course.
+    """
+    return time.time_ns() // 1_000_000
+
+
+async def _course_actions(
+    repo: CourseRepository,
+    courses: List[Course],
+    version: int,
+) -> List[Dict[str, Any]]:
+    names = await repo.get_instructor_names({course.instructor_id for course in courses})
+    return [
+        {
+            "_id": str(course.id),
+            "_version": version,
+            "_source": course_document(course, names.get(course.instructor_id)),
+        }
+        for course in courses
+    ]
+
+
+async def iter_course_actions(batch_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+    """Bulk index actions for every course, streamed from the database.
+
+    Every action carries the version stamped when the stream started, so
+    a course the projection rewrites while the stream is running keeps the
+    projection's newer document.
+    """
+    version = _read_version()
+    async with AsyncSessionLocal() as session:
+        # A lagging replica could return data older than the version
+        session.sync_session.info["force_primary"] = True
+        repo = CourseRepository(session)
+        async for courses in repo.iter_with_lessons(batch_size):
+            for action in await _course_actions(repo, courses, version):
+                yield action
+
+
+async def reindex_courses(index: str = COURSES_INDEX, **kwargs: Any) -> Tuple[int, int]:
+    """Index every course into ``index``; returns (succeeded, failed)."""
+    return await bulk_index(index, iter_course_actions(), **kwargs)
+
+
+# (key, from, to) in the document's units; from is inclusive, to exclusive
+PRICE_BANDS = [  # cents
+    ("free", None, 1),
+    ("under_20", 1, 2000),
+    ("20_to_50", 2000, 5000),
+    ("50_to_100", 5000, 10000),
+    ("over_100", 10000, None),
+]
+DURATION_BANDS = [  # minutes
+    ("under_1h", None, 60),
+    ("1_to_3h", 60, 180),
+    ("3_to_10h", 180, 600),
+    ("over_10h", 600, None),
+]
+
+
+def _range_facet(field: str, bands: List[Tuple[str, Optional[int], Optional[int]]]) -> Dict[str, Any]:
+    ranges = []
+    for key, start, end in bands:
+        band: Dict[str, Any] = {"key": key}
+        if start is not None:
+            band["from"] = start
+        if end is not None:
+            band["to"] = end
+        ranges.append(band)
+    return {"range": {"field": field, "ranges": ranges}}
+
+
+COURSE_FACETS = {
+    "level": {"terms": {"field": "level"}},
+    "price_band": _range_facet("price", PRICE_BANDS),
+    "duration_band": _range_facet("duration", DURATION_BANDS),
+}
+
+
+def _course_query(
+    search: Optional[str],
+    level: Optional[str],
+) -> Dict[str, Any]:
+    filters: List[Dict[str, Any]] = [{"term": {"is_published": True}}]
+    if level:
+        filters.append({"term": {"level": level}})
+
+    query: Dict[str, Any] = {"query": {"bool": {"filter": filters}}}
+    if search:
+        query["query"]["bool"]["must"] = {
+            "multi_match": {
+                "query": search,
+                "fields": [
+                    "title^3",
+                    "instructor_name^2",
+                    "description",
+                    "modules.title",
+                    "lessons.title",
+                ],
+            },
+        }
+        query["sort"] = ["_score", {"created_at": "desc"}, {"id": "asc"}]
+    else:
+        # id breaks ties, so search_after cursors never skip or repeat a course
+        query["sort"] = [{"created_at": "desc"}, {"id": "asc"}]
+    return query
+
+
+async def search_courses(
+    search: Optional[str] = None,
+    level: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+) -> List[Dict[str, Any]]:
+    """Published courses matching the search text and filters, best match first."""
+    query = _course_query(search, level)
+    return await search_documents(COURSES_INDEX, query, size=limit, from_=skip)
+
+
+async def faceted_search_courses(
+    search: Optional[str] = None,
+    level: Optional[str] = None,
+    page: int = 1,
+    size: int = 10,
+    cursor: Optional[str] = None,
+) -> SearchResponse:
+    """Like search_courses, with the total, facet counts and a cursor to the next page.
+
+    Facets come with the first page only; following pages are fetched by
+    passing back ``next_cursor``, which pages with search_after instead
+    of an offset, so deep pages cost no more than the first. Passing
+    ``page`` without a cursor still pages by offset.
+    """
+    query = _course_query(search, level)
+    if cursor is None:
+        query["aggs"] = COURSE_FACETS
+    result = await search_page(
+        COURSES_INDEX,
+        query,
+        size=size,
+        from_=(page - 1) * size,
+        cursor=cursor,
+        paginate=True,
+    )
+    return SearchResponse(
+        items=result.items,
+        total=result.total,
+        page=page,
+        size=size,
+        pages=math.ceil(result.total / size) if size else 0,
+        aggregations={
+            name: [
+                {"key": bucket["key"], "count": bucket["doc_count"]}
+                for bucket in facet["buckets"]
+            ]
+            for name, facet in result.aggregations.items()
+        } or None,
+        next_cursor=result.next_cursor,
+    )
+
+
+# Longest prefix worth caching; longer ones are rare and unlikely to repeat
+SUGGEST_CACHE_MAX_PREFIX = 20
+
+_suggestions = LRUCache(
+    maxsize=settings.SEARCH_SUGGEST_CACHE_SIZE,
+    ttl=settings.SEARCH_SUGGEST_CACHE_TTL,
+)
+
+
+async def suggest_courses(prefix: str, size: int = 8) -> List[Dict[str, Any]]:
+    """Published courses whose title or instructor name starts with ``prefix``.
+
+    Results are cached per pod by normalized prefix for a short TTL, so
+    the popular short prefixes that most keystrokes hit never reach
+    Elasticsearch.
+    """
+    prefix = " ".join(prefix.lower().split())
+    if not prefix:
+        return []
+    key = (prefix, size)
+    cacheable = len(prefix) <= SUGGEST_CACHE_MAX_PREFIX
+    if cacheable:
+        suggestions = _suggestions.get(key)
+        if suggestions is not None:
+            return suggestions
+
+    suggestions = await suggest_documents(
+        COURSES_INDEX,
+        "suggest",
+        prefix,
+        size=size,
+        source=["id", "title", "instructor_name"],
+    )
+    if cacheable:
+        _suggestions.set(key, suggestions)
+    return suggestions
+
+
+async def _iterate(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+class CourseSearchProjection:
+    """Keeps the courses index in step with course, module and lesson events.
+
+    Handlers only mark a course (or, for lessons, a module) dirty. Once the
+    consumer has handled a whole batch, ``flush_pending`` reloads every
+    dirty course from the primary in one query and writes them in one bulk
+    request, so a burst of events about a course costs one document write
+    per batch. It runs before the batch's offsets are committed and a
+    failure rewinds the batch, so the consumer never commits an offset
+    ahead of the index.
+    """
+
+    def __init__(self, index: str = COURSES_INDEX):
+        self.index = index
+        self._courses: Set[UUID] = set()
+        self._modules: Set[UUID] = set()
+
+    def mark_course(self, course_id: UUID) -> None:
+        self._courses.add(course_id)
+
+    def mark_module(self, module_id: UUID) -> None:
+        """Mark the course of a module dirty; used by lesson events, which only carry the module."""
+        self._modules.add(module_id)
+
+    async def flush_pending(self) -> None:
+        """Reindex everything marked since the last flush."""
+        course_ids, module_ids = self._courses, self._modules
+        self._courses, self._modules = set(), set()
+        if course_ids or module_ids:
+            await self.flush(course_ids, module_ids)
+
+    async def flush(self, course_ids: Set[UUID], module_ids: Set[UUID]) -> None:
+        """Reindex the given courses and the courses of the given modules."""
+        version = _read_version()
+        async with AsyncSessionLocal() as session:
+            # Replicas may not have the write that produced the event yet
+            session.sync_session.info["force_primary"] = True
+            course_ids = set(course_ids)
+            if module_ids:
+                # Modules already deleted are covered by their own module.deleted event
+                course_ids.update((await ModuleRepository(session).get_course_ids(module_ids)).values())
+            repo = CourseRepository(session)
+            courses = await repo.get_many_with_lessons(course_ids)
+            actions = await _course_actions(repo, courses, version)
+
+        found = {course.id for course in courses}
+        actions += [
+            {"_op_type": "delete", "_id": str(course_id), "_version": version}
+            for course_id in course_ids - found
+        ]
+        if not actions:
+            return
+        for index in await get_write_indices(self.index):
+            async for report in streaming_bulk(index, _iterate(actions)):
+                if report.errors:
+                    logger.error(
+                        "Failed to project courses",
+                        extra={
+                            "index": index,
+                            "failed": report.failed,
+                            "errors": [vars(error) for error in report.errors[:10]],
+                        },
+                    )
+                    raise SearchException(f"Failed to index {report.failed} course documents into {index}")
+
+
+async def ensure_courses_index() -> Optional[str]:
+    """Create the first courses index version if there is none yet."""
+    return await ensure_versioned_index(COURSES_INDEX, COURSE_MAPPINGS, COURSE_INDEX_SETTINGS)
+
+
+async def _backfill_courses(index: str) -> None:
+    try:
+        succeeded, failed = await reindex_courses(index)
+    except asyncio.CancelledError:
+        logger.error(
+            "Courses index backfill interrupted; run python -m src.course.search to rebuild it",
+            extra={
+                "index": index,
+            },
+        )
+        raise
+    except Exception as e:
+        logger.error(
+            "Courses index backfill failed; run python -m src.course.search to rebuild it",
+            extra={
+                "index": index,
+                "error": str(e),
+            },
+        )
+        return
+    if failed:
+        logger.error(
+            "Courses index backfill incomplete; run python -m src.course.search to rebuild it",
+            extra={
+                "index": index,
+                "succeeded": succeeded,
+                "failed": failed,
+            },
+        )
+
+
+_backfill_task: Optional[asyncio.Task] = None
+
+
+async def start_courses_index() -> None:
+    """Create the courses index if there is none, and fill it from the database.
+
+    Course listing and search read only the index, so a new index is
+    backfilled in the background; only the pod that created it does so.
+    Projection writes that land meanwhile are versioned and win over the
+    backfill's. If the backfill does not finish, the index stays partial
+    until rebuilt with ``python -m src.course.search``.
+    """
+    global _backfill_task
+    index = await ensure_courses_index()
+    if index is not None and _backfill_task is None:
+        _backfill_task = asyncio.create_task(_backfill_courses(index))
+
+
+async def stop_courses_index() -> None:
+    global _backfill_task
+    if _backfill_task is None:
+        return
+    _backfill_task.cancel()
+    try:
+        await _backfill_task
+    except asyncio.CancelledError:
+        pass
+    _backfill_task = None
+
+
+async def rebuild_courses_index() -> str:
+    """Rebuild the courses index from the database and swap the alias to it.
+
+    Run after changing COURSE_MAPPINGS or COURSE_INDEX_SETTINGS:
+    ``python -m src.course.search``.
+    """
+    return await rebuild_index(
+        COURSES_INDEX,
+        COURSE_MAPPINGS,
+        reindex_courses,
+        index_settings=COURSE_INDEX_SETTINGS,
+    )
+
+
+async def _main() -> None:
+    try:
+        await rebuild_courses_index()
+    finally:
+        await close_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
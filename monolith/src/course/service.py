@@ -3,14 +3,36 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..common.cache import PickleCacheSerializer, cached, invalidate
 from ..common.exceptions import NotFoundException, UnauthorizedException
 from ..common.schemas import CourseCreate, CourseUpdate, ModuleCreate, ModuleUpdate, LessonCreate, LessonUpdate
+from .events import (
+    CourseCreatedEvent,
+    CourseUpdatedEvent,
+    CourseDeletedEvent,
+    ModuleCreatedEvent,
+    ModuleUpdatedEvent,
+    ModuleDeletedEvent,
+    LessonCreatedEvent,
+    LessonUpdatedEvent,
+    LessonDeletedEvent,
+)
 from .model import Course, Module, Lesson
 from .repository import CourseRepository, ModuleRepository, LessonRepository
 
+# Read-through cache keys, formatted from the cached method's arguments
+COURSE_CACHE_KEY = "course:{course_id}"
+COURSE_MODULES_CACHE_KEY = "course:{course_id}:modules"
+MODULE_LESSONS_CACHE_KEY = "module:{module_id}:lessons"
+INSTRUCTOR_COURSES_CACHE_KEY = "instructor:{instructor_id}:courses"
+COURSE_CACHE_TTL = 600
+# Course reads cache ORM instances, which only pickle can encode
+ORM_CACHE_SERIALIZER = PickleCacheSerializer()
+
 
 class CourseService:
     def __init__(self, session: AsyncSession):
+        self.session = session
         self.course_repo = CourseRepository(session)
         self.module_repo = ModuleRepository(session)
         self.lesson_repo = LessonRepository(session)
@@ -24,19 +46,44 @@ async def create_course(self, instructor_id: UUID, course_data: CourseCreate) ->
             duration=course_data.duration,
             price=course_data.price,
         )
-        return await self.course_repo.create(course)
+        self.session.add(course)
+        await self.session.flush()
+        CourseCreatedEvent(
+            course_id=course.id,
+            instructor_id=course.instructor_id,
+            title=course.title,
+            description=course.description,
+            level=course.level,
+            duration=course.duration,
+            price=course.price,
+        ).stage(self.session)
+        course = await self.course_repo.create(course)
+        await invalidate(INSTRUCTOR_COURSES_CACHE_KEY.format(instructor_id=instructor_id))
+        return course
 
+    @cached(key=COURSE_CACHE_KEY, ttl=COURSE_CACHE_TTL, serializer=ORM_CACHE_SERIALIZER)
     async def get_course(self, course_id: UUID) -> Course:
+        return await self._load_course(course_id)
+
+    async def _load_course(self, course_id: UUID) -> Course:
+        """Load a course attached to this session, bypassing the cache, for writes."""
         course = await self.course_repo.get_by_id(course_id)
         if not course:
             raise NotFoundException("Course not found")
         return course
 
+    async def get_course_outline(self, course_id: UUID) -> Course:
+        course = await self.course_repo.get_outline(course_id)
+        if not course:
+            raise NotFoundException("Course not found")
+        return course
+
+    @cached(key=INSTRUCTOR_COURSES_CACHE_KEY, ttl=COURSE_CACHE_TTL, serializer=ORM_CACHE_SERIALIZER)
     async def get_instructor_courses(self, instructor_id: UUID) -> List[Course]:
         return await self.course_repo.get_by_instructor(instructor_id)
 
     async def update_course(self, course_id: UUID, instructor_id: UUID, course_data: CourseUpdate) -> Course:
-        course = await self.get_course(course_id)
+        course = await self._load_course(course_id)
         if course.instructor_id != instructor_id:
             raise UnauthorizedException("Not authorized to update this course")
 
@@ -53,17 +100,40 @@ async def update_course(self, course_id: UUID, instructor_id: UUID, course_data:
         if course_data.is_published is not None:
             course.is_published = course_data.is_published
 
-        return await self.course_repo.update(course)
+        CourseUpdatedEvent(
+            course_id=course.id,
+            instructor_id=course.instructor_id,
+            title=course.title,
+            description=course.description,
+            level=course.level,
+            duration=course.duration,
+            price=course.price,
+            is_published=course.is_published,
+        ).stage(self.session)
+        course = await self.course_repo.update(course)
+        await invalidate(
+            COURSE_CACHE_KEY.format(course_id=course_id),
+            INSTRUCTOR_COURSES_CACHE_KEY.format(instructor_id=course.instructor_id),
+        )
+        return course
 
     async def delete_course(self, course_id: UUID, instructor_id: UUID) -> None:
-        course = await self.get_course(course_id)
+        course = await self._load_course(course_id)
         if course.instructor_id != instructor_id:
             raise UnauthorizedException("Not authorized to delete this course")
+        CourseDeletedEvent(course_id=course.id, instructor_id=course.instructor_id).stage(self.session)
         await self.course_repo.delete(course)
+        await invalidate(
+            COURSE_CACHE_KEY.format(course_id=course_id),
+            COURSE_MODULES_CACHE_KEY.format(course_id=course_id),
+            INSTRUCTOR_COURSES_CACHE_KEY.format(instructor_id=course.instructor_id),
+        )
 
     async def create_module(self, course_id: UUID, instructor_id: UUID, module_data: ModuleCreate) -> Module:
-        course = await self.get_course(course_id)
-        if course.instructor_id != instructor_id:
+        owner_id = await self.course_repo.get_owner(course_id)
+        if owner_id is None:
+            raise NotFoundException("Course not found")
+        if owner_id != instructor_id:
             raise UnauthorizedException("Not authorized to add modules to this course")
 
         module = Module(
@@ -72,7 +142,18 @@ async def create_module(self, course_id: UUID, instructor_id: UUID, module_data:
             description=module_data.description,
             order=module_data.order,
         )
-        return await self.module_repo.create(module)
+        self.session.add(module)
+        await self.session.flush()
+        ModuleCreatedEvent(
+            module_id=module.id,
+            course_id=module.course_id,
+            title=module.title,
+            description=module.description,
+            order=module.order,
+        ).stage(self.session)
+        module = await self.module_repo.create(module)
+        await invalidate(COURSE_MODULES_CACHE_KEY.format(course_id=course_id))
+        return module
 
     async def get_module(self, module_id: UUID) -> Module:
         module = await self.module_repo.get_by_id(module_id)
@@ -80,14 +161,22 @@ async def get_module(self, module_id: UUID) -> Module:
             raise NotFoundException("Module not found")
         return module
 
+    @cached(key=COURSE_MODULES_CACHE_KEY, ttl=COURSE_CACHE_TTL, serializer=ORM_CACHE_SERIALIZER)
     async def get_course_modules(self, course_id: UUID) -> List[Module]:
         return await self.module_repo.get_by_course(course_id)
 
+    async def _get_owned_module(self, module_id: UUID, instructor_id: UUID, action: str) -> Module:
+        """Load a module and check the instructor owns its course, in one query."""
+        row = await self.module_repo.get_with_owner(module_id)
+        if row is None:
+            raise NotFoundException("Module not found")
+        module, owner_id = row
+        if owner_id != instructor_id:
+            raise UnauthorizedException(f"Not authorized to {action} this module")
+        return module
+
     async def update_module(self, module_id: UUID, instructor_id: UUID, module_data: ModuleUpdate) -> Module:
-        module = await self.get_module(module_id)
-        course = await self.get_course(module.course_id)
-        if course.instructor_id != instructor_id:
-            raise UnauthorizedException("Not authorized to update this module")
+        module = await self._get_owned_module(module_id, instructor_id, "update")
 
         if module_data.title:
             module.title = module_data.title
@@ -96,30 +185,56 @@ async def update_module(self, module_id: UUID, instructor_id: UUID, module_data:
         if module_data.order:
             module.order = module_data.order
 
-        return await self.module_repo.update(module)
+        ModuleUpdatedEvent(
+            module_id=module.id,
+            course_id=module.course_id,
+            title=module.title,
+            description=module.description,
+            order=module.order,
+        ).stage(self.session)
+        module = await self.module_repo.update(module)
+        await invalidate(COURSE_MODULES_CACHE_KEY.format(course_id=module.course_id))
+        return module
 
     async def delete_module(self, module_id: UUID, instructor_id: UUID) -> None:
-        module = await self.get_module(module_id)
-        course = await self.get_course(module.course_id)
-        if course.instructor_id != instructor_id:
-            raise UnauthorizedException("Not authorized to delete this module")
+        module = await self._get_owned_module(module_id, instructor_id, "delete")
+        ModuleDeletedEvent(module_id=module.id, course_id=module.course_id).stage(self.session)
         await self.module_repo.delete(module)
+        await invalidate(
+            COURSE_MODULES_CACHE_KEY.format(course_id=module.course_id),
+            MODULE_LESSONS_CACHE_KEY.format(module_id=module_id),
+        )
 
     async def create_lesson(self, module_id: UUID, instructor_id: UUID, lesson_data: LessonCreate) -> Lesson:
-        module = await self.get_module(module_id)
-        course = await self.get_course(module.course_id)
-        if course.instructor_id != instructor_id:
+        owner_id = await self.module_repo.get_owner(module_id)
+        if owner_id is None:
+            raise NotFoundException("Module not found")
+        if owner_id != instructor_id:
             raise UnauthorizedException("Not authorized to add lessons to this module")
 
         lesson = Lesson(
             module_id=module_id,
             title=lesson_data.title,
             description=lesson_data.description,
-            content=lesson_data.content,
             order=lesson_data.order,
             duration=lesson_data.duration,
         )
-        return await self.lesson_repo.create(lesson)
+        lesson.set_content(lesson_data.content)
+        self.session.add(lesson)
+        await self.session.flush()
+        LessonCreatedEvent(
+            lesson_id=lesson.id,
+            module_id=lesson.module_id,
+            title=lesson.title,
+            description=lesson.description,
+            content_hash=lesson.content_hash,
+            content_size=lesson.content_size,
+            order=lesson.order,
+            duration=lesson.duration,
+        ).stage(self.session)
+        lesson = await self.lesson_repo.create(lesson)
+        await invalidate(MODULE_LESSONS_CACHE_KEY.format(module_id=module_id))
+        return lesson
 
     async def get_lesson(self, lesson_id: UUID) -> Lesson:
         lesson = await self.lesson_repo.get_by_id(lesson_id)
@@ -127,33 +242,50 @@ async def get_lesson(self, lesson_id: UUID) -> Lesson:
             raise NotFoundException("Lesson not found")
         return lesson
 
+    @cached(key=MODULE_LESSONS_CACHE_KEY, ttl=COURSE_CACHE_TTL, serializer=ORM_CACHE_SERIALIZER)
     async def get_module_lessons(self, module_id: UUID) -> List[Lesson]:
         return await self.lesson_repo.get_by_module(module_id)
 
+    async def _get_owned_lesson(self, lesson_id: UUID, instructor_id: UUID, action: str) -> Lesson:
+        """Load a lesson and check the instructor owns its course, in one query."""
+        row = await self.lesson_repo.get_with_owner(lesson_id)
+        if row is None:
+            raise NotFoundException("Lesson not found")
+        lesson, owner_id = row
+        if owner_id != instructor_id:
+            raise UnauthorizedException(f"Not authorized to {action} this lesson")
+        return lesson
+
     async def update_lesson(self, lesson_id: UUID, instructor_id: UUID, lesson_data: LessonUpdate) -> Lesson:
-        lesson = await self.get_lesson(lesson_id)
-        module = await self.get_module(lesson.module_id)
-        course = await self.get_course(module.course_id)
-        if course.instructor_id != instructor_id:
-            raise UnauthorizedException("Not authorized to update this lesson")
+        lesson = await self._get_owned_lesson(lesson_id, instructor_id, "update")
 
         if lesson_data.title:
             lesson.title = lesson_data.title
         if lesson_data.description:
             lesson.description = lesson_data.description
         if lesson_data.content:
-            lesson.content = lesson_data.content
+            lesson.set_content(lesson_data.content)
         if lesson_data.order:
             lesson.order = lesson_data.order
         if lesson_data.duration:
             lesson.duration = lesson_data.duration
 
-        return await self.lesson_repo.update(lesson)
+        LessonUpdatedEvent(
+            lesson_id=lesson.id,
+            module_id=lesson.module_id,
+            title=lesson.title,
+            description=lesson.description,
+            content_hash=lesson.content_hash,
+            content_size=lesson.content_size,
+            order=lesson.order,
+            duration=lesson.duration,
+        ).stage(self.session)
+        lesson = await self.lesson_repo.update(lesson)
+        await invalidate(MODULE_LESSONS_CACHE_KEY.format(module_id=lesson.module_id))
+        return lesson
 
     async def delete_lesson(self, lesson_id: UUID, instructor_id: UUID) -> None:
-        lesson = await self.get_lesson(lesson_id)
-        module = await self.get_module(lesson.module_id)
-        course = await self.get_course(module.course_id)
-        if course.instructor_id != instructor_id:
-            raise UnauthorizedException("Not authorized to delete this lesson")
-        await self.lesson_repo.delete(lesson) 
\ No newline at end of file
+        lesson = await self._get_owned_lesson(lesson_id, instructor_id, "delete")
+        LessonDeletedEvent(lesson_id=lesson.id, module_id=lesson.module_id).stage(self.session)
+        await self.lesson_repo.delete(lesson)
+        await invalidate(MODULE_LESSONS_CACHE_KEY.format(module_id=lesson.module_id)) 
\ No newline at end of file
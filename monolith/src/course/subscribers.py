@@ -0,0 +1,62 @@
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from ..common.cache import invalidate
+from ..common.consumers import EventConsumer
+from .search import CourseSearchProjection
+from .service import (
+    COURSE_CACHE_KEY,
+    COURSE_MODULES_CACHE_KEY,
+    INSTRUCTOR_COURSES_CACHE_KEY,
+    MODULE_LESSONS_CACHE_KEY,
+)
+
+
+def register_cache_invalidation(consumer: EventConsumer) -> None:
+    """Evict cached course reads affected by course, module and lesson events.
+
+    Covers writes that did not go through this process's CourseService, so
+    catalog entries can keep long TTLs without going stale.
+    """
+
+    @consumer.handler("course.*")
+    async def invalidate_course(event: Dict[str, Any]) -> None:
+        data = event["data"]
+        keys = [INSTRUCTOR_COURSES_CACHE_KEY.format(instructor_id=data["instructor_id"])]
+        if event["event_type"] != "course.created":
+            keys.append(COURSE_CACHE_KEY.format(course_id=data["course_id"]))
+        if event["event_type"] == "course.deleted":
+            keys.append(COURSE_MODULES_CACHE_KEY.format(course_id=data["course_id"]))
+        await invalidate(*keys)
+
+    @consumer.handler("module.*")
+    async def invalidate_module(event: Dict[str, Any]) -> None:
+        data = event["data"]
+        keys = [COURSE_MODULES_CACHE_KEY.format(course_id=data["course_id"])]
+        if event["event_type"] == "module.deleted":
+            keys.append(MODULE_LESSONS_CACHE_KEY.format(module_id=data["module_id"]))
+        await invalidate(*keys)
+
+    @consumer.handler("lesson.*")
+    async def invalidate_lesson(event: Dict[str, Any]) -> None:
+        await invalidate(MODULE_LESSONS_CACHE_KEY.format(module_id=event["data"]["module_id"]))
+
+
+def register_search_projection(
+    consumer: EventConsumer,
+    projection: Optional[CourseSearchProjection] = None,
+) -> CourseSearchProjection:
+    """Keep the course search index current from course, module and lesson events."""
+    projection = projection or CourseSearchProjection()
+
+    @consumer.handler("course.*", "module.*")
+    async def project_course(event: Dict[str, Any]) -> None:
+        projection.mark_course(UUID(event["data"]["course_id"]))
+
+    @consumer.handler("lesson.*")
+    async def project_lesson(event: Dict[str, Any]) -> None:
+        projection.mark_module(UUID(event["data"]["module_id"]))
+
+    consumer.after_batch(projection.flush_pending)
+
+    return projection
\ No newline at end of file
@@ -0,0 +1,25 @@
+-- Move lessons.content to the bytea format of common/sqltypes.CompressedText
+-- and backfill content_hash/content_size.
+--
+-- Existing bodies are rewritten with the "raw" header (one 0x00 byte followed
+-- by the UTF-8 text), which CompressedText reads as-is; each one is compressed
+-- the next time the lesson's content is saved. The type change rewrites the
+-- table under an ACCESS EXCLUSIVE lock, so run it in a maintenance window.
+
+BEGIN;
+
+ALTER TABLE lessons
+    ALTER COLUMN content TYPE bytea
+        USING CASE
+            WHEN content IS NULL THEN NULL
+            ELSE '\x00'::bytea || convert_to(content, 'UTF8')
+        END,
+    ADD COLUMN content_hash varchar(64),
+    ADD COLUMN content_size integer;
+
+UPDATE lessons
+SET content_hash = encode(sha256(substring(content FROM 2)), 'hex'),
+    content_size = octet_length(content) - 1
+WHERE content IS NOT NULL;
+
+COMMIT;
@@ -9,7 +9,22 @@
 
 from src.common.config import settings
 from src.common.logger import configure_logging
-from src.common.database import get_db
+from src.common.database import DatabaseRoutingMiddleware, close_engine
+from src.common.rate_limit import RateLimitMiddleware
+from src.common.oidc import start_oidc_provider, stop_oidc_provider
+from src.common.kafka import close_producer
+from src.common.redis import close_redis
+from src.common.elasticsearch import close_connection as close_elasticsearch
+from src.common.executor import password_executor
+from src.common.jwt_keys import get_key_ring
+from src.modules.auth.persistence.token_revocation import start_revocation_sync, stop_revocation_sync
+from src.common.outbox import start_outbox_relay, stop_outbox_relay
+from src.common.cache import start_cache_invalidation_listener, stop_cache_invalidation_listener
+from src.common.consumers import EventConsumer, start_consumer, stop_consumers
+from src.modules.auth.subscribers import register_cache_invalidation as register_user_cache_invalidation
+from src.course.subscribers import register_cache_invalidation as register_course_cache_invalidation
+from src.course.subscribers import register_search_projection
+from src.course.search import start_courses_index, stop_courses_index
 from src.api.v1.routers import (
     auth,
     identity,
@@ -50,11 +65,18 @@
     allow_headers=["*"],
 )
 
+# Route reads to replicas, sticking to the primary after a client's writes
+app.add_middleware(DatabaseRoutingMiddleware)
+
+# Reject over-limit clients before any other work is done for them
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 # Include API router
 @app.get("/api/health", tags=["Health"])
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "ok"}
+    """Health check endpoint, with the password hashing pool's load"""
+    return {"status": "ok", "executors": [password_executor.stats()]}
 
 # API v1 routers
 app.include_router(auth.router, prefix="/api/v1", tags=["Authentication"])
@@ -76,10 +98,38 @@ async def health_check():
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting up the application")
+    # Refuse to start without usable JWT keys rather than failing every login
+    get_key_ring()
+    if settings.OUTBOX_RELAY_ENABLED:
+        start_outbox_relay()
+    start_cache_invalidation_listener()
+    start_revocation_sync()
+    await start_oidc_provider()
+    await start_courses_index()
+    if settings.CACHE_INVALIDATION_ENABLED:
+        cache_invalidation_consumer = EventConsumer(settings.CACHE_INVALIDATION_GROUP_ID)
+        register_course_cache_invalidation(cache_invalidation_consumer)
+        register_user_cache_invalidation(cache_invalidation_consumer)
+        start_consumer(cache_invalidation_consumer)
+    if settings.SEARCH_PROJECTION_ENABLED:
+        search_projection_consumer = EventConsumer(settings.SEARCH_PROJECTION_GROUP_ID)
+        register_search_projection(search_projection_consumer)
+        start_consumer(search_projection_consumer)
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down the application")
+    await stop_consumers()
+    await stop_courses_index()
+    stop_cache_invalidation_listener()
+    await stop_revocation_sync()
+    await stop_oidc_provider()
+    await stop_outbox_relay()
+    await close_producer()
+    await close_engine()
+    await close_redis()
+    await close_elasticsearch()
+    password_executor.shutdown()
 
 if __name__ == "__main__":
     uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""
+Cache keys for auth reads; kept free of model imports so any module can share them
+"""
+
+# A user's record, evicted on every user and profile event
+USER_CACHE_KEY = "user:{user_id}"
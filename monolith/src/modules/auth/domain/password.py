@@ -2,9 +2,11 @@
 Password value object in the authentication domain
 """
 import re
-import bcrypt
 from dataclasses import dataclass
 
+from src.common.executor import password_executor
+from src.common.passwords import get_password_hasher
+
 @dataclass
 class Password:
     """
@@ -24,20 +26,35 @@ def __post_init__(self):
     @staticmethod
     def _hash_password(password: str) -> str:
         """
-        Hash a password using bcrypt
+        Hash a password with the configured scheme and cost
         """
-        password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password_bytes, salt)
-        return hashed.decode('utf-8')
+        return get_password_hasher().hash(password)
 
     def verify(self, hashed_password: str) -> bool:
         """
         Verify if the password matches the given hash
         """
-        password_bytes = self.value.encode('utf-8')
-        hashed_bytes = hashed_password.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+        return get_password_hasher().verify(self.value, hashed_password)
+
+    async def verify_async(self, hashed_password: str) -> bool:
+        """
+        Verify the password on the password hashing pool, off the event loop
+        """
+        return await password_executor.run(self.verify, hashed_password)
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        Check if a stored hash uses an outdated scheme or cost
+        """
+        return get_password_hasher().needs_rehash(hashed_password)
+
+    async def rehash_async(self) -> "Password":
+        """
+        Hash this password again with the current scheme and cost
+        """
+        hash_value = await password_executor.run(self._hash_password, self.value)
+        return Password(value=self.value, hash_value=hash_value)
 
     @classmethod
     def from_plain_text(cls, plain_text: str) -> "Password":
@@ -48,6 +65,16 @@ def from_plain_text(cls, plain_text: str) -> "Password":
             raise ValueError("Password does not meet security requirements")
         return cls(value=plain_text)
 
+    @classmethod
+    async def from_plain_text_async(cls, plain_text: str) -> "Password":
+        """
+        Like from_plain_text, but hashes on the password hashing pool
+        """
+        if not cls.is_valid(plain_text):
+            raise ValueError("Password does not meet security requirements")
+        hash_value = await password_executor.run(cls._hash_password, plain_text)
+        return cls(value=plain_text, hash_value=hash_value)
+
     @staticmethod
     def is_valid(password: str) -> bool:
         """
@@ -7,7 +7,10 @@
 import uuid
 import jwt
 
-from src.common.config import settings
+from src.common.config import get_settings
+from src.common.jwt_keys import decode_token as decode_jwt, encode_token
+
+settings = get_settings()
 
 @dataclass
 class Token:
@@ -54,26 +57,17 @@ def create_for_user(cls, user_id: str, email: str, role: str) -> "Token":
     @staticmethod
     def _create_jwt(payload: Dict[str, Any]) -> str:
         """
-        Create a JWT with the provided payload
+        Create a JWT with the provided payload, signed with the active key
         """
-        return jwt.encode(
-            payload=payload,
-            key=settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
+        return encode_token(payload)
 
     @staticmethod
     def decode_token(token: str) -> Dict[str, Any]:
         """
-        Decode and validate a JWT token
+        Decode and validate a JWT token; signatures are verified once per pod
         """
         try:
-            payload = jwt.decode(
-                token,
-                key=settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            return payload
+            return decode_jwt(token)
         except jwt.PyJWTError as e:
             raise ValueError(f"Invalid token: {str(e)}")
 
@@ -0,0 +1,137 @@
+"""
+Revocation store for JWTs, keyed by their jti claim
+"""
+import asyncio
+import time
+from typing import Optional
+
+from src.common.bloom import BloomFilter
+from src.common.config import get_settings
+from src.common.logger import get_logger
+from src.common.redis import get_async_redis
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+REVOKED_KEY = "auth:revoked:{jti}"
+# Sorted set of revoked jtis scored by token expiry, used to rebuild filters
+REVOKED_INDEX_KEY = "auth:revoked"
+REVOCATION_CHANNEL = "auth:revocations"
+
+
+class TokenRevocationStore:
+    """
+    Revoked jtis live in Redis until the token would have expired anyway.
+    Each pod keeps a Bloom filter of them, replicated over pub/sub, so the
+    common "not revoked" answer needs no Redis round trip; only filter hits
+    are confirmed against Redis. The filter is rebuilt periodically to drop
+    expired entries, and after any gap in the subscription.
+    """
+
+    def __init__(
+        self,
+        capacity: int = settings.TOKEN_REVOCATION_FILTER_CAPACITY,
+        rebuild_interval: float = settings.TOKEN_REVOCATION_REBUILD_INTERVAL,
+    ):
+        self.capacity = capacity
+        self.rebuild_interval = rebuild_interval
+        self._filter: Optional[BloomFilter] = None
+        self._stopped = asyncio.Event()
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke a token until its expiry (a unix timestamp)
+        """
+        now = time.time()
+        ttl = int(expires_at - now) + 1
+        if ttl <= 0:
+            return
+        async with get_async_redis().pipeline(transaction=True) as pipe:
+            pipe.set(REVOKED_KEY.format(jti=jti), 1, ex=ttl)
+            pipe.zadd(REVOKED_INDEX_KEY, {jti: expires_at})
+            pipe.zremrangebyscore(REVOKED_INDEX_KEY, "-inf", now)
+            pipe.publish(REVOCATION_CHANNEL, jti)
+            await pipe.execute()
+        if self._filter is not None:
+            self._filter.add(jti)
+
+    async def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token has been revoked
+        """
+        if self._filter is not None and not self._filter.might_contain(jti):
+            return False
+        return await get_async_redis().exists(REVOKED_KEY.format(jti=jti)) > 0
+
+    async def rebuild(self) -> None:
+        """
+        Replace the local filter with one built from the unexpired revocations
+        """
+        jtis = await get_async_redis().zrangebyscore(REVOKED_INDEX_KEY, time.time(), "+inf")
+        bloom = BloomFilter(max(self.capacity, len(jtis) * 2))
+        for jti in jtis:
+            bloom.add(jti)
+        self._filter = bloom
+
+    async def run(self) -> None:
+        """
+        Keep the local filter in sync until stopped
+        """
+        while not self._stopped.is_set():
+            pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+            try:
+                # Subscribe before rebuilding so no revocation falls in between
+                await pubsub.subscribe(REVOCATION_CHANNEL)
+                await self.rebuild()
+                rebuild_at = time.monotonic() + self.rebuild_interval
+                while not self._stopped.is_set():
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None and self._filter is not None:
+                        self._filter.add(message["data"])
+                    if time.monotonic() >= rebuild_at:
+                        await self.rebuild()
+                        rebuild_at = time.monotonic() + self.rebuild_interval
+            except Exception as e:
+                # Fall back to Redis for every check until resynced
+                self._filter = None
+                logger.warning(
+                    "Token revocation sync failed",
+                    extra={
+                        "error": str(e),
+                    },
+                )
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                await pubsub.close()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+revocation_store = TokenRevocationStore()
+_sync_task: Optional[asyncio.Task] = None
+
+
+def start_revocation_sync() -> None:
+    """
+    Start syncing the local revocation filter as a background task
+    """
+    global _sync_task
+    if _sync_task is not None:
+        return
+    _sync_task = asyncio.create_task(revocation_store.run())
+
+
+async def stop_revocation_sync() -> None:
+    """
+    Stop syncing the local revocation filter
+    """
+    global _sync_task
+    if _sync_task is None:
+        return
+    revocation_store.stop()
+    await _sync_task
+    _sync_task = None
@@ -2,8 +2,11 @@
 Repository for User persistence operations
 """
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.cache import invalidate
+from src.modules.auth.cache_keys import USER_CACHE_KEY
 from src.modules.auth.domain.user import User
 from src.modules.auth.models.user import UserModel
 
@@ -11,10 +14,10 @@ class UserRepository:
     """
     Repository for User entities in the database
     """
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create(self, user: User) -> UserModel:
+    async def create(self, user: User) -> UserModel:
         """
         Create a new user in the database
         """
@@ -29,33 +32,42 @@ def create(self, user: User) -> UserModel:
             last_login=user.last_login
         )
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
         return db_user
     
-    def get_by_id(self, user_id: str) -> Optional[UserModel]:
+    async def get_by_id(self, user_id: str) -> Optional[UserModel]:
         """
         Get a user by ID
         """
-        return self.db.query(UserModel).filter(UserModel.id == user_id).first()
+        result = await self.db.execute(
+            select(UserModel).where(UserModel.id == user_id)
+        )
+        return result.scalar_one_or_none()
     
-    def get_by_email(self, email: str) -> Optional[UserModel]:
+    async def get_by_email(self, email: str) -> Optional[UserModel]:
         """
         Get a user by email
         """
-        return self.db.query(UserModel).filter(UserModel.email == email).first()
+        result = await self.db.execute(
+            select(UserModel).where(UserModel.email == email)
+        )
+        return result.scalar_one_or_none()
     
-    def list_users(self, skip: int = 0, limit: int = 100) -> List[UserModel]:
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[UserModel]:
         """
         Get a list of users
         """
-        return self.db.query(UserModel).offset(skip).limit(limit).all()
+        result = await self.db.execute(
+            select(UserModel).offset(skip).limit(limit)
+        )
+        return result.scalars().all()
     
-    def update(self, user: User) -> UserModel:
+    async def update(self, user: User) -> UserModel:
         """
         Update a user in the database
         """
-        db_user = self.get_by_id(user.id)
+        db_user = await self.get_by_id(user.id)
         if not db_user:
             raise ValueError(f"User with ID {user.id} not found")
         
@@ -67,20 +79,22 @@ def update(self, user: User) -> UserModel:
         db_user.updated_at = user.updated_at
         db_user.last_login = user.last_login
         
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await invalidate(USER_CACHE_KEY.format(user_id=db_user.id))
+        await self.db.refresh(db_user)
         return db_user
     
-    def delete(self, user_id: str) -> None:
+    async def delete(self, user_id: str) -> None:
         """
         Delete a user from the database
         """
-        db_user = self.get_by_id(user_id)
+        db_user = await self.get_by_id(user_id)
         if not db_user:
             raise ValueError(f"User with ID {user_id} not found")
         
-        self.db.delete(db_user)
-        self.db.commit()
+        await self.db.delete(db_user)
+        await self.db.commit()
+        await invalidate(USER_CACHE_KEY.format(user_id=user_id))
 
     def to_domain(self, db_user: UserModel) -> User:
         """
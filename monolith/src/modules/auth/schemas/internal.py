@@ -52,8 +52,9 @@ class UserResponse(BaseModel):
     email: str
     name: Optional[str] = None
     role: str
-    created_at: datetime
-    updated_at: datetime
+    # Not carried by access token claims
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         orm_mode = True
@@ -1,19 +1,25 @@
 """
 Authentication service for user login and registration
 """
-from typing import Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.database import get_db
+from src.common.cache import JsonCacheSerializer, cached
+from src.common.config import get_settings
+from src.common.database import get_session
+from src.modules.auth.cache_keys import USER_CACHE_KEY
 from src.modules.auth.domain.user import User
 from src.modules.auth.domain.password import Password
 from src.modules.auth.domain.token import Token
+from src.modules.auth.persistence.token_revocation import revocation_store
 from src.modules.auth.persistence.user_repository import UserRepository
 from src.modules.auth.models.user import UserModel
 from src.modules.auth.schemas.internal import UserResponse
 
+settings = get_settings()
+
 # OAuth2 password bearer token scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
@@ -21,21 +27,21 @@ class AuthenticationService:
     """
     Service for handling user authentication, registration, and token management
     """
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.user_repository = UserRepository(db)
 
-    def register_user(self, user_data: dict) -> Tuple[UserResponse, str]:
+    async def register_user(self, user_data: dict) -> Tuple[UserResponse, str]:
         """
         Register a new user with email and password
         """
         # Check if email is already registered
-        if self.user_repository.get_by_email(user_data["email"]):
+        if await self.user_repository.get_by_email(user_data["email"]):
             raise ValueError("Email already registered")
 
         # Create password value object and validate it
         try:
-            password = Password.from_plain_text(user_data["password"])
+            password = await Password.from_plain_text_async(user_data["password"])
         except ValueError as e:
             raise ValueError(str(e))
 
@@ -47,7 +53,7 @@ def register_user(self, user_data: dict) -> Tuple[UserResponse, str]:
         )
 
         # Save user to database
-        db_user = self.user_repository.create(user)
+        db_user = await self.user_repository.create(user)
         
         # Generate token
         token = Token.create_for_user(
@@ -66,12 +72,12 @@ def register_user(self, user_data: dict) -> Tuple[UserResponse, str]:
             updated_at=db_user.updated_at
         ), token
 
-    def authenticate_user(self, email: str, password: str) -> Tuple[UserResponse, str]:
+    async def authenticate_user(self, email: str, password: str) -> Tuple[UserResponse, str]:
         """
         Authenticate a user with email and password
         """
         # Get user from database
-        db_user = self.user_repository.get_by_email(email)
+        db_user = await self.user_repository.get_by_email(email)
         if not db_user:
             raise ValueError("Invalid credentials")
 
@@ -79,14 +85,17 @@ def authenticate_user(self, email: str, password: str) -> Tuple[UserResponse, st
         if not db_user.is_active:
             raise ValueError("User account is inactive")
 
-        # Verify password
-        password_obj = Password(value=password)
-        if not password_obj.verify(db_user.password_hash):
+        # Verify password; passing the stored hash skips hashing the attempt
+        password_obj = Password(value=password, hash_value=db_user.password_hash)
+        if not await password_obj.verify_async(db_user.password_hash):
             raise ValueError("Invalid credentials")
 
-        # Record login
-        db_user.record_login()
-        self.user_repository.update(db_user)
+        # Record login, upgrading the stored hash if its scheme or cost is outdated
+        user = self.user_repository.to_domain(db_user)
+        user.record_login()
+        if Password.needs_rehash(db_user.password_hash):
+            user.update_password(await password_obj.rehash_async())
+        db_user = await self.user_repository.update(user)
 
         # Generate token
         token = Token.create_for_user(
@@ -105,7 +114,7 @@ def authenticate_user(self, email: str, password: str) -> Tuple[UserResponse, st
             updated_at=db_user.updated_at
         ), token
 
-    def refresh_token(self, refresh_token: str) -> Token:
+    async def refresh_token(self, refresh_token: str) -> Token:
         """
         Generate a new token pair from a valid refresh token
         """
@@ -116,40 +125,48 @@ def refresh_token(self, refresh_token: str) -> Token:
             # Check if it's a refresh token
             if payload.get("type") != "refresh":
                 raise ValueError("Invalid token type")
+
+            if await revocation_store.is_revoked(payload.get("jti", "")):
+                raise ValueError("Token has been revoked")
             
             # Get user from database
             user_id = payload.get("sub")
             if not user_id:
                 raise ValueError("Invalid token")
                 
-            db_user = self.user_repository.get_by_id(user_id)
+            db_user = await self.user_repository.get_by_id(user_id)
             if not db_user or not db_user.is_active:
                 raise ValueError("User not found or inactive")
             
-            # Generate new token pair
-            return Token.refresh(
+            # Generate new token pair, retiring the refresh token it replaces
+            token = Token.refresh(
                 refresh_token,
                 user_id=db_user.id,
                 email=db_user.email,
                 role=db_user.role
             )
+            await revocation_store.revoke(payload["jti"], payload["exp"])
+            return token
         except ValueError as e:
             raise ValueError(f"Token refresh failed: {str(e)}")
 
-    def invalidate_token(self, refresh_token: str) -> None:
+    async def invalidate_token(self, refresh_token: str) -> None:
         """
-        Invalidate a refresh token (for logout)
-        Note: In a production system, this would typically add the token to a blacklist
-        or use a token revocation strategy involving Redis or another fast data store
+        Invalidate a refresh token (for logout) by revoking its jti until it expires
         """
-        # Here we would typically add the token to a blacklist
-        # For the sake of simplicity, we're not implementing a full token blacklist system
-        pass
+        try:
+            payload = Token.decode_token(refresh_token)
+        except ValueError:
+            # Expired or invalid tokens cannot be used anyway
+            return
+
+        if payload.get("jti") and payload.get("exp"):
+            await revocation_store.revoke(payload["jti"], payload["exp"])
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ) -> UserResponse:
     """
     Get the current authenticated user from the access token
@@ -164,18 +181,48 @@ async def get_current_user(
         # Decode and validate token
         payload = Token.decode_token(token)
         user_id = payload.get("sub")
-        if user_id is None:
+        if user_id is None or payload.get("type") == "refresh":
             raise credentials_exception
     except ValueError:
         raise credentials_exception
-    
-    # Get user from database
-    user_repository = UserRepository(db)
-    user = user_repository.get_by_id(user_id)
-    if user is None:
+
+    if await revocation_store.is_revoked(payload.get("jti", "")):
         raise credentials_exception
-    
-    # Return user data
+
+    try:
+        if settings.AUTH_CURRENT_USER_SOURCE == "claims":
+            return _user_from_claims(payload)
+        if settings.AUTH_CURRENT_USER_SOURCE == "cache":
+            return await _get_cached_user(user_id, db)
+        return await _load_user(user_id, db)
+    except ValueError:
+        raise credentials_exception
+
+
+def _user_from_claims(payload: Dict[str, Any]) -> UserResponse:
+    """
+    Build the current user from verified access token claims, without a query.
+    Deactivation takes effect when the (short-lived) access token expires.
+    """
+    if not payload.get("email") or not payload.get("role"):
+        raise ValueError("Token is missing user claims")
+    return UserResponse(
+        id=payload["sub"],
+        email=payload["email"],
+        name=payload.get("name", ""),
+        role=payload["role"],
+    )
+
+
+async def _load_user(user_id: str, db: AsyncSession) -> UserResponse:
+    """
+    Load the current user from the database
+    """
+    user_repository = UserRepository(db)
+    user = await user_repository.get_by_id(user_id)
+    if user is None or not user.is_active:
+        raise ValueError("User not found or inactive")
+
     return UserResponse(
         id=user.id,
         email=user.email,
@@ -183,4 +230,16 @@ async def get_current_user(
         role=user.role,
         created_at=user.created_at,
         updated_at=user.updated_at
-    ) 
\ No newline at end of file
+    )
+
+
+@cached(
+    key=USER_CACHE_KEY,
+    ttl=settings.AUTH_USER_CACHE_TTL,
+    serializer=JsonCacheSerializer(UserResponse),
+)
+async def _get_cached_user(user_id: str, db: AsyncSession) -> UserResponse:
+    """
+    Load the current user through the two-tier cache; user events evict it
+    """
+    return await _load_user(user_id, db) 
\ No newline at end of file
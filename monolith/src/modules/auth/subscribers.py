@@ -0,0 +1,16 @@
+"""
+Event subscribers keeping auth reads in step with user events
+"""
+from typing import Any, Dict
+
+from src.common.cache import invalidate
+from src.common.consumers import EventConsumer
+from src.modules.auth.cache_keys import USER_CACHE_KEY
+
+
+def register_cache_invalidation(consumer: EventConsumer) -> None:
+    """Evict cached user reads on user and profile events."""
+
+    @consumer.handler("user.*")
+    async def invalidate_user(event: Dict[str, Any]) -> None:
+        await invalidate(USER_CACHE_KEY.format(user_id=event["data"]["user_id"]))
@@ -0,0 +1,20 @@
+import os
+
+# Settings are read at import time; unit tests never reach these services
+for name, value in {
+    "SECRET_KEY": "test-secret",
+    "POSTGRES_SERVER": "localhost",
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "POSTGRES_DB": "test",
+    "REDIS_HOST": "localhost",
+    "KAFKA_BOOTSTRAP_SERVERS": "localhost:9092",
+    "ELASTICSEARCH_HOST": "localhost",
+    "MINIO_ENDPOINT": "localhost:9000",
+    "MINIO_ACCESS_KEY": "test",
+    "MINIO_SECRET_KEY": "test",
+    "OIDC_ISSUER": "https://issuer.test",
+    "OIDC_CLIENT_ID": "test",
+    "OIDC_CLIENT_SECRET": "test",
+}.items():
+    os.environ.setdefault(name, value)
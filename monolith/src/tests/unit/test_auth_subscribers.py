@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.common.consumers import EventConsumer
+from src.modules.auth import subscribers
+
+
+async def test_user_events_evict_the_cached_user(monkeypatch):
+    evicted = []
+
+    async def invalidate(*keys):
+        evicted.extend(keys)
+
+    monkeypatch.setattr(subscribers, "invalidate", invalidate)
+    consumer = EventConsumer("test")
+    subscribers.register_cache_invalidation(consumer)
+
+    for handler in consumer._handlers_for("user.updated"):
+        await handler({"event_type": "user.updated", "data": {"user_id": "user-1"}})
+
+    assert evicted == ["user:user-1"]
+
+
+def test_subscriber_does_not_map_the_legacy_user_model():
+    # src.auth.model maps the users table a second time on the shared metadata
+    code = "import sys, src.modules.auth.subscribers; sys.exit('src.auth.model' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], env=dict(os.environ), cwd=Path(__file__).parents[3])
+
+    assert result.returncode == 0
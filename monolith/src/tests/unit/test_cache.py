@@ -0,0 +1,169 @@
+import asyncio
+
+import pytest
+
+from pydantic import BaseModel
+
+from src.common import cache as cache_module
+from src.common.cache import JsonCacheSerializer, PickleCacheSerializer, TwoTierCache
+
+
+class Profile(BaseModel):
+    id: str
+    name: str
+
+
+class FakeRedis:
+    """The subset of redis.asyncio the cache uses, kept in a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache_module, "get_async_binary_redis", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def two_tier(redis):
+    return TwoTierCache(prefix="test", early_expiry_beta=0)
+
+
+async def test_reads_return_independent_copies(two_tier):
+    await two_tier.set("key", {"tags": ["a"]})
+
+    first = await two_tier.get("key")
+    first["tags"].append("b")
+
+    assert await two_tier.get("key") == {"tags": ["a"]}
+
+
+async def test_get_or_load_loads_once_and_caches(two_tier):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return {"value": calls}
+
+    assert await two_tier.get_or_load("key", loader) == {"value": 1}
+    assert await two_tier.get_or_load("key", loader) == {"value": 1}
+    assert calls == 1
+
+
+async def test_waiters_share_the_leaders_error(two_tier):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def loader():
+        started.set()
+        await release.wait()
+        raise ValueError("database down")
+
+    leader = asyncio.create_task(two_tier.get_or_load("key", loader))
+    await started.wait()
+    follower = asyncio.create_task(two_tier.get_or_load("key", loader))
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(ValueError):
+        await leader
+    with pytest.raises(ValueError):
+        await follower
+    assert "key" not in two_tier._inflight
+
+
+async def test_cancelled_leader_does_not_fail_waiters(two_tier):
+    calls = 0
+    started = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(10)
+        return "value"
+
+    leader = asyncio.create_task(two_tier.get_or_load("key", loader))
+    await started.wait()
+    follower = asyncio.create_task(two_tier.get_or_load("key", loader))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await asyncio.wait_for(follower, 1) == "value"
+    assert calls == 2
+
+
+async def test_cancelled_waiter_does_not_cancel_the_load(two_tier):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def loader():
+        started.set()
+        await release.wait()
+        return "value"
+
+    leader = asyncio.create_task(two_tier.get_or_load("key", loader))
+    await started.wait()
+    follower = asyncio.create_task(two_tier.get_or_load("key", loader))
+    await asyncio.sleep(0)
+    follower.cancel()
+    release.set()
+
+    assert await leader == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+
+async def test_values_are_stored_as_json_by_default(two_tier, redis):
+    await two_tier.set("key", {"tags": ["a"]})
+
+    assert redis.data["test:key"].endswith(b'{"tags":["a"]}')
+
+
+async def test_pickled_entries_are_not_unpickled_by_default(two_tier, redis):
+    await two_tier.set("key", {"tags": ["a"]}, serializer=PickleCacheSerializer())
+    two_tier.local.clear()
+
+    with pytest.raises(ValueError):
+        await two_tier.get("key")
+
+
+async def test_cached_function_can_opt_into_a_serializer(two_tier):
+    @cache_module.cached(key="profile:{profile_id}", cache_instance=two_tier, serializer=PickleCacheSerializer())
+    async def get_profile(profile_id):
+        return {profile_id}
+
+    await get_profile("1")
+    two_tier.local.clear()
+
+    assert await get_profile("1") == {"1"}
+
+
+async def test_json_serializer_round_trips_a_model(two_tier):
+    serializer = JsonCacheSerializer(Profile)
+    await two_tier.set("key", Profile(id="1", name="Ada"), serializer=serializer)
+    two_tier.local.clear()
+
+    assert await two_tier.get("key", serializer=serializer) == Profile(id="1", name="Ada")
@@ -0,0 +1,45 @@
+import asyncio
+
+from src.common import consumers
+from src.common.consumers import EventConsumer
+
+
+class FlakyKafkaConsumer:
+    """Fails the first poll, then returns nothing until the test stops the consumer."""
+
+    def __init__(self, group_id, enable_auto_commit=True):
+        self.polls = 0
+        self.closed = False
+        instances.append(self)
+
+    def subscribe(self, topics):
+        pass
+
+    def consume_batch(self, num_messages, timeout):
+        self.polls += 1
+        if self.polls == 1:
+            raise RuntimeError("broker unavailable")
+        return []
+
+    def close(self):
+        self.closed = True
+
+
+instances = []
+
+
+async def test_poll_errors_do_not_stop_the_consumer(monkeypatch):
+    monkeypatch.setattr(consumers, "KafkaConsumer", FlakyKafkaConsumer)
+    consumer = EventConsumer("test", poll_timeout=0, retry_backoff=0)
+
+    @consumer.handler("course.*")
+    async def handle(event):
+        pass
+
+    task = asyncio.create_task(consumer.run())
+    while not instances or instances[-1].polls < 3:
+        await asyncio.sleep(0.01)
+    consumer.stop()
+    await asyncio.wait_for(task, 1)
+
+    assert instances[-1].closed
@@ -0,0 +1,37 @@
+import re
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.course.repository import CourseRepository
+
+
+class RecordingSession:
+    """Records the statement instead of running it."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return self
+
+    def unique(self):
+        return self
+
+    def scalar_one_or_none(self):
+        return None
+
+
+async def test_outline_loads_modules_and_lessons_in_order_without_content():
+    session = RecordingSession()
+
+    await CourseRepository(session).get_outline(uuid4())
+
+    [statement] = session.statements
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "JOIN modules" in sql
+    assert "JOIN lessons" in sql
+    assert sql.endswith('ORDER BY modules_1."order", lessons_1."order"')
+    assert "lessons_1.content_hash" in sql
+    assert not re.search(r"lessons_1\.content\b", sql)
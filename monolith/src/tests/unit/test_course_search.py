@@ -0,0 +1,66 @@
+import pytest
+
+from src.course import search
+from src.course.search import COURSE_FACETS, COURSE_MAPPINGS, _course_query
+
+
+def mapped(field):
+    properties = COURSE_MAPPINGS["properties"]
+    name, _, subfield = field.partition(".")
+    if subfield:
+        mapping = properties[name]
+        return subfield in mapping.get("properties", mapping.get("fields", {}))
+    return name in properties
+
+
+def test_facets_aggregate_mapped_fields():
+    for facet in COURSE_FACETS.values():
+        (aggregation,) = facet.values()
+        assert mapped(aggregation["field"])
+
+
+def test_filters_use_mapped_fields():
+    query = _course_query("python", "beginner")
+
+    for clause in query["query"]["bool"]["filter"]:
+        (field,) = clause["term"]
+        assert mapped(field)
+    for field in query["query"]["bool"]["must"]["multi_match"]["fields"]:
+        assert mapped(field.split("^")[0])
+
+
+@pytest.fixture
+def backfills(monkeypatch):
+    loaded = []
+
+    async def reindex_courses(index):
+        loaded.append(index)
+        return 3, 0
+
+    monkeypatch.setattr(search, "reindex_courses", reindex_courses)
+    yield loaded
+    search._backfill_task = None
+
+
+async def test_new_index_is_backfilled(monkeypatch, backfills):
+    async def ensure_versioned_index(alias, mappings, index_settings):
+        return "courses_v1"
+
+    monkeypatch.setattr(search, "ensure_versioned_index", ensure_versioned_index)
+
+    await search.start_courses_index()
+    await search._backfill_task
+
+    assert backfills == ["courses_v1"]
+
+
+async def test_existing_index_is_not_backfilled(monkeypatch, backfills):
+    async def ensure_versioned_index(alias, mappings, index_settings):
+        return None
+
+    monkeypatch.setattr(search, "ensure_versioned_index", ensure_versioned_index)
+
+    await search.start_courses_index()
+
+    assert search._backfill_task is None
+    assert backfills == []
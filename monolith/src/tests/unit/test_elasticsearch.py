@@ -0,0 +1,285 @@
+import base64
+import json
+
+import pytest
+from elasticsearch.exceptions import NotFoundError, RequestError, TransportError
+
+from src.common import elasticsearch
+from src.common.exceptions import BadRequestException, SearchException
+
+
+class FakeEsClient:
+    """Answers each bulk request with the next queued response (or raises it)."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.bodies = []
+
+        self.indices = FakeIndices()
+
+    async def bulk(self, body):
+        self.bodies.append(body)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        if callable(response):
+            return response(body)
+        return response
+
+
+class FakeIndices:
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+        self.alias_updates = []
+
+    async def get_alias(self, name):
+        return {}
+
+    async def get(self, index):
+        return {}
+
+    async def exists(self, index):
+        return False
+
+    async def create(self, index, body):
+        self.created.append(index)
+
+    async def delete(self, index, ignore=None):
+        self.deleted.append(index)
+
+    async def update_aliases(self, body):
+        self.alias_updates.append(body)
+
+
+def bulk_ids(body):
+    return [json.loads(line)["index"]["_id"] for line in body.splitlines()[::2]]
+
+
+def ok(body):
+    return {"items": [{"index": {"_id": id, "status": 201}} for id in bulk_ids(body)]}
+
+
+def item(id, status, error=None):
+    result = {"_id": id, "status": status}
+    if error is not None:
+        result["error"] = error
+    return {"index": result}
+
+
+async def actions(count):
+    for n in range(count):
+        yield {"_id": str(n), "_source": {"n": n}}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(elasticsearch.asyncio, "sleep", sleep)
+    return delays
+
+
+def chunk(count):
+    return [elasticsearch._serialize_action("courses", {"_id": str(n), "_source": {"n": n}}) for n in range(count)]
+
+
+async def test_only_items_rejected_with_429_are_resent(monkeypatch, sleeps):
+    client = FakeEsClient([
+        {"items": [item("0", 201), item("1", 429, "rejected"), item("2", 400, "mapper_parsing_exception")]},
+        ok,
+    ])
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    report = await elasticsearch._send_chunk(1, chunk(3), max_retries=3, initial_backoff=0.5, max_backoff=10)
+
+    assert bulk_ids(client.bodies[1]) == ["1"]
+    assert report.succeeded == 2
+    assert [(error.id, error.status) for error in report.errors] == [("2", 400)]
+    assert report.retries == 1
+    assert sleeps == [0.5]
+
+
+async def test_backoff_doubles_up_to_the_cap_and_gives_up_after_max_retries(monkeypatch, sleeps):
+    rejected = TransportError(429, "es_rejected_execution_exception", {})
+    client = FakeEsClient([rejected] * 4)
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    report = await elasticsearch._send_chunk(1, chunk(2), max_retries=3, initial_backoff=0.5, max_backoff=1.5)
+
+    assert len(client.bodies) == 4
+    assert sleeps == [0.5, 1.0, 1.5]
+    assert report.succeeded == 0
+    assert [(error.id, error.status) for error in report.errors] == [("0", 429), ("1", 429)]
+
+
+async def test_other_transport_errors_are_not_retried(monkeypatch, sleeps):
+    client = FakeEsClient([TransportError(500, "internal", {})])
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    report = await elasticsearch._send_chunk(1, chunk(2), max_retries=3, initial_backoff=0.5, max_backoff=10)
+
+    assert len(client.bodies) == 1
+    assert sleeps == []
+    assert report.failed == 2
+
+
+async def test_streaming_bulk_chunks_actions_and_reports_each_batch(monkeypatch, sleeps):
+    client = FakeEsClient([ok, ok, ok])
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    reports = [
+        report
+        async for report in elasticsearch.streaming_bulk("courses", actions(5), chunk_size=2, max_concurrency=2)
+    ]
+
+    assert sorted(report.batch for report in reports) == [1, 2, 3]
+    assert sum(report.succeeded for report in reports) == 5
+    assert sorted(id for body in client.bodies for id in bulk_ids(body)) == ["0", "1", "2", "3", "4"]
+    assert max(len(bulk_ids(body)) for body in client.bodies) == 2
+
+
+async def test_versioned_writes_lose_to_newer_versions_without_failing(monkeypatch, sleeps):
+    client = FakeEsClient([
+        {"items": [item("0", 201), item("1", 409, {"type": "version_conflict_engine_exception"})]},
+    ])
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+    actions = [
+        elasticsearch._serialize_action("courses", {"_id": str(n), "_version": 5, "_source": {"n": n}})
+        for n in range(2)
+    ]
+
+    report = await elasticsearch._send_chunk(1, actions, max_retries=3, initial_backoff=0.5, max_backoff=10)
+
+    meta = json.loads(client.bodies[0].splitlines()[0])["index"]
+    assert (meta["version"], meta["version_type"]) == (5, "external")
+    assert (report.succeeded, report.conflicts, report.failed) == (1, 1, 0)
+
+
+async def test_unversioned_conflicts_are_errors(monkeypatch, sleeps):
+    client = FakeEsClient([{"items": [item("0", 409, {"type": "version_conflict_engine_exception"})]}])
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    report = await elasticsearch._send_chunk(1, chunk(1), max_retries=3, initial_backoff=0.5, max_backoff=10)
+
+    assert (report.conflicts, report.failed) == (0, 1)
+
+
+async def test_rebuild_with_failed_documents_keeps_the_alias(monkeypatch, sleeps):
+    client = FakeEsClient([])
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    async def load(index):
+        return 3, 1
+
+    with pytest.raises(SearchException):
+        await elasticsearch.rebuild_index("courses", {}, load)
+
+    assert client.indices.created == ["courses_v1"]
+    assert client.indices.deleted == ["courses_v1"]
+    assert client.indices.alias_updates == []
+
+
+class FakeSearchClient:
+    """Answers searches with hits numbered from the search_after value, or raises ``error``."""
+
+    def __init__(self, total=25, error=None):
+        self.total = total
+        self.error = error
+        self.searches = []
+        self.opened = []
+
+    async def open_point_in_time(self, index, keep_alive):
+        self.opened.append(index)
+        return {"id": "pit-1"}
+
+    async def close_point_in_time(self, body):
+        pass
+
+    async def search(self, body, size, index=None, from_=0):
+        self.searches.append({"index": index, **body})
+        if self.error is not None:
+            raise self.error
+        start = body["search_after"][0] + 1 if "search_after" in body else from_
+        hits = [
+            {"_source": {"n": n}, "sort": [n]}
+            for n in range(start, min(start + size, self.total))
+        ]
+        response = {"hits": {"hits": hits, "total": {"value": self.total}}}
+        if "pit" in body:
+            response["pit_id"] = body["pit"]["id"]
+        return response
+
+
+def encoded(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+async def test_cursors_page_with_search_after_without_a_point_in_time(monkeypatch):
+    client = FakeSearchClient()
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+    query = {"query": {"match_all": {}}, "sort": [{"n": "asc"}]}
+
+    first = await elasticsearch.search_page("courses", query, size=10, paginate=True)
+    second = await elasticsearch.search_page("courses", query, size=10, cursor=first.next_cursor)
+    last = await elasticsearch.search_page("courses", query, size=10, cursor=second.next_cursor)
+
+    assert client.opened == []
+    assert elasticsearch._decode_cursor(first.next_cursor) == (None, [9])
+    assert [item["n"] for item in second.items] == list(range(10, 20))
+    assert [item["n"] for item in last.items] == list(range(20, 25))
+    assert last.next_cursor is None
+    assert all(search["index"] == "courses" and "pit" not in search for search in client.searches)
+
+
+async def test_point_in_time_is_opt_in(monkeypatch):
+    client = FakeSearchClient()
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    page = await elasticsearch.search_page("courses", {}, size=10, paginate=True, point_in_time=True)
+    await elasticsearch.search_page("courses", {}, size=10, cursor=page.next_cursor)
+
+    assert client.opened == ["courses"]
+    assert elasticsearch._decode_cursor(page.next_cursor) == ("pit-1", [9])
+    assert client.searches[1]["pit"]["id"] == "pit-1"
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        encoded([1, 2]),
+        encoded({"pit": "pit-1"}),
+        encoded({"after": "9"}),
+        encoded({"pit": 1, "after": [9]}),
+    ],
+)
+async def test_malformed_cursors_are_rejected(monkeypatch, cursor):
+    client = FakeSearchClient()
+    monkeypatch.setattr(elasticsearch, "es_client", client)
+
+    with pytest.raises(BadRequestException) as raised:
+        await elasticsearch.search_page("courses", {}, cursor=cursor)
+
+    assert raised.value.status_code == 400
+    assert client.searches == []
+
+
+async def test_expired_point_in_time_is_a_bad_request(monkeypatch):
+    expired = NotFoundError(404, "search_context_missing_exception", {})
+    monkeypatch.setattr(elasticsearch, "es_client", FakeSearchClient(error=expired))
+
+    with pytest.raises(BadRequestException, match="expired"):
+        await elasticsearch.search_page("courses", {}, cursor=encoded({"pit": "pit-1", "after": [9]}))
+
+
+async def test_cursor_not_matching_the_sort_is_a_bad_request(monkeypatch):
+    mismatched = RequestError(400, "illegal_argument_exception", {})
+    monkeypatch.setattr(elasticsearch, "es_client", FakeSearchClient(error=mismatched))
+
+    with pytest.raises(BadRequestException, match="Invalid"):
+        await elasticsearch.search_page("courses", {}, cursor=encoded({"after": [9, "x", 3]}))
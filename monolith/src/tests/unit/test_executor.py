@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.common.exceptions import ServiceUnavailableException
+from src.common.executor import BoundedExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_runs_calls_on_the_pool(executor):
+    assert await executor.run(threading.current_thread) is not threading.current_thread()
+
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert stats["running"] == stats["queued"] == stats["rejected"] == 0
+
+
+async def test_rejects_calls_beyond_workers_and_queue(executor):
+    release = threading.Event()
+    running = asyncio.create_task(executor.run(release.wait))
+    queued = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ServiceUnavailableException):
+        await executor.run(release.wait)
+    stats = executor.stats()
+    assert (stats["running"], stats["queued"], stats["rejected"]) == (1, 1, 1)
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert executor.stats()["completed"] == 2
+
+
+async def test_errors_propagate_and_free_the_slot(executor):
+    def fail():
+        raise ValueError("bad hash")
+
+    with pytest.raises(ValueError):
+        await executor.run(fail)
+    assert executor.stats()["queued"] == 0
+    assert await executor.run(len, "abc") == 3
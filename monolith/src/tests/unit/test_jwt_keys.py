@@ -0,0 +1,99 @@
+import threading
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.common import jwt_keys as jwt_keys_module
+from src.common.jwt_keys import KeyRing
+
+
+def write_key(keys_dir, kid):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    (keys_dir / f"{kid}.key").write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return key
+
+
+def sign(key, kid):
+    return jwt.encode({"sub": "user-1"}, key, algorithm="RS256", headers={"kid": kid})
+
+
+def verify(key_ring, token):
+    kid = jwt.get_unverified_header(token)["kid"]
+    return jwt.decode(token, key=key_ring.verification_key(kid), algorithms=["RS256"])
+
+
+def wait_for_reload():
+    for thread in threading.enumerate():
+        if thread.name == "jwt-key-reload":
+            thread.join(timeout=5)
+
+
+@pytest.fixture
+def keys_dir(tmp_path):
+    write_key(tmp_path, "2024-01")
+    return tmp_path
+
+
+def test_hs256_uses_the_secret_key():
+    key_ring = KeyRing(algorithm="HS256", secret_key="secret")
+
+    assert key_ring.signing_key() == ("default", "secret")
+    assert key_ring.verification_key(None) == "secret"
+
+
+def test_asymmetric_key_ring_requires_signing_keys(tmp_path):
+    with pytest.raises(ValueError):
+        KeyRing(algorithm="RS256", keys_dir=str(tmp_path), active_kid=None)
+
+
+def test_verifies_tokens_signed_with_the_active_key(keys_dir):
+    key_ring = KeyRing(algorithm="RS256", keys_dir=str(keys_dir), active_kid=None)
+    kid, key = key_ring.signing_key()
+
+    assert kid == "2024-01"
+    assert verify(key_ring, sign(key, kid))["sub"] == "user-1"
+
+
+def test_unknown_kid_is_rejected_then_loaded_in_the_background(keys_dir, monkeypatch):
+    monkeypatch.setattr(jwt_keys_module, "_RELOAD_MIN_INTERVAL", 0.0)
+    key_ring = KeyRing(algorithm="RS256", keys_dir=str(keys_dir), active_kid=None)
+    token = sign(write_key(keys_dir, "2024-02"), "2024-02")
+
+    with pytest.raises(jwt.InvalidKeyError):
+        verify(key_ring, token)
+    wait_for_reload()
+
+    assert verify(key_ring, token)["sub"] == "user-1"
+
+
+def test_unknown_kid_reloads_at_most_once_per_interval(keys_dir):
+    key_ring = KeyRing(algorithm="RS256", keys_dir=str(keys_dir), active_kid=None)
+    token = sign(write_key(keys_dir, "2024-02"), "2024-02")
+
+    with pytest.raises(jwt.InvalidKeyError):
+        verify(key_ring, token)
+    wait_for_reload()
+
+    with pytest.raises(jwt.InvalidKeyError):
+        verify(key_ring, token)
+
+
+def test_failed_reload_keeps_the_loaded_keys(keys_dir, monkeypatch):
+    monkeypatch.setattr(jwt_keys_module, "_RELOAD_MIN_INTERVAL", 0.0)
+    key_ring = KeyRing(algorithm="RS256", keys_dir=str(keys_dir), active_kid=None)
+    kid, key = key_ring.signing_key()
+    (keys_dir / "broken.key").write_bytes(b"not a key")
+
+    with pytest.raises(jwt.InvalidKeyError):
+        key_ring.verification_key("2024-02")
+    wait_for_reload()
+
+    assert verify(key_ring, sign(key, kid))["sub"] == "user-1"
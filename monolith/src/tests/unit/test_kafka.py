@@ -0,0 +1,86 @@
+import asyncio
+import re
+
+import pytest
+
+from src.common import kafka as kafka_module
+from src.common.kafka import KafkaConsumer, KafkaProducer
+
+
+def test_plain_topic_gets_prefix():
+    assert KafkaConsumer._topic_name("course.created") == "elearning.course.created"
+
+
+def test_wildcard_topic_becomes_anchored_regex():
+    pattern = KafkaConsumer._topic_name("course.*")
+
+    assert pattern.startswith("^")
+    assert re.match(pattern, "elearning.course.created")
+    assert re.match(pattern, "elearning.course.updated")
+    assert not re.match(pattern, "elearning.courses.created")
+    assert not re.match(pattern, "elearning.module.created")
+    assert not re.match(pattern, "other.course.created")
+
+
+def test_wildcard_subscription_never_matches_dead_letter_topics():
+    for subscription in ("course.*", "*"):
+        pattern = KafkaConsumer._topic_name(subscription)
+        dead_letter = KafkaConsumer.dead_letter_topic("elearning.course.created")
+
+        assert not re.match(pattern, dead_letter)
+        assert not re.match(pattern, KafkaConsumer.dead_letter_topic(dead_letter))
+
+
+class FullQueueProducer:
+    """A confluent_kafka.Producer whose local queue is full for the first ``full_for`` calls."""
+
+    def __init__(self, full_for):
+        self.full_for = full_for
+        self.produced = []
+        self.polls = 0
+
+    def produce(self, **kwargs):
+        if self.full_for:
+            self.full_for -= 1
+            raise BufferError("Local: Queue full")
+        self.produced.append(kwargs)
+
+    def poll(self, timeout):
+        self.polls += 1
+        return 0
+
+
+def make_producer(full_for):
+    producer = KafkaProducer.__new__(KafkaProducer)
+    producer.producer = FullQueueProducer(full_for)
+    return producer
+
+
+async def test_full_queue_waits_without_blocking_the_loop(monkeypatch):
+    monkeypatch.setattr(kafka_module, "_QUEUE_FULL_RETRY_INTERVAL", 0.01)
+    producer = make_producer(full_for=3)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    await producer.produce_raw("dlq.elearning.course.created", b"key", b"value")
+    task.cancel()
+
+    assert len(producer.producer.produced) == 1
+    assert producer.producer.polls == 0
+    assert ticks > 0
+
+
+async def test_full_queue_gives_up_after_timeout(monkeypatch):
+    monkeypatch.setattr(kafka_module, "_QUEUE_FULL_RETRY_INTERVAL", 0.01)
+    monkeypatch.setattr(kafka_module.settings, "KAFKA_QUEUE_FULL_TIMEOUT", 0.05)
+    producer = make_producer(full_for=1000)
+
+    with pytest.raises(BufferError):
+        await producer.produce_raw("dlq.elearning.course.created", b"key", b"value")
+    assert producer.producer.produced == []
@@ -0,0 +1,109 @@
+import asyncio
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from src.common import oidc
+from src.common.oidc_stub import StubIdentityProvider
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+class FakeOAuthClient:
+    def __init__(self, token):
+        self.token = token
+
+    async def authorize_access_token(self, request):
+        return self.token
+
+    async def fetch_access_token(self, **kwargs):
+        return {"access_token": "access-2", "expires_at": 2000}
+
+
+@pytest.fixture
+def idp():
+    return StubIdentityProvider(latency=0.01)
+
+
+@pytest.fixture
+async def provider(idp):
+    provider = idp.provider()
+    await provider.load()
+    return provider
+
+
+async def test_verifies_with_cached_keys(provider, idp):
+    claims = await provider.verify_id_token(idp.issue_token("user-1"))
+
+    assert claims["sub"] == "user-1"
+    assert idp.fetches == 2
+
+
+async def test_unknown_kid_within_min_ttl_is_rejected_without_fetching(provider, idp):
+    idp.rotate_key()
+
+    with pytest.raises(jwt.InvalidKeyError):
+        await provider.verify_id_token(idp.issue_token("user-1"))
+    assert idp.fetches == 2
+
+
+async def test_concurrent_unknown_kids_share_one_refresh(provider, idp):
+    idp.rotate_key()
+    provider._jwks_fetched_at -= 3600
+    token = idp.issue_token("user-1")
+
+    results = await asyncio.gather(*(provider.verify_id_token(token) for _ in range(5)))
+
+    assert [claims["sub"] for claims in results] == ["user-1"] * 5
+    assert idp.fetches == 3
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(oidc, "get_async_binary_redis", lambda: redis)
+    return redis
+
+
+async def test_callback_keeps_tokens_out_of_the_session(monkeypatch, redis):
+    token = {
+        "access_token": "access-1",
+        "refresh_token": "refresh-1",
+        "id_token": "id-token",
+        "expires_at": 1000,
+        "userinfo": {"sub": "user-1", "email": "a@example.com", "groups": ["admin"]},
+    }
+
+    async def get_client():
+        return FakeOAuthClient(token)
+
+    monkeypatch.setattr(oidc, "get_oauth_client", get_client)
+    request = SimpleNamespace(session={})
+
+    await oidc.callback_oidc(request)
+
+    assert request.session["user"] == {"sub": "user-1", "email": "a@example.com"}
+    assert request.session["token_expires_at"] == 1000
+    assert "refresh-1" not in str(request.session)
+    assert await oidc.get_access_token(request) == "access-1"
+
+    assert await oidc.refresh_access_token(request) == "access-2"
+    assert await oidc.get_access_token(request) == "access-2"
+    assert request.session["token_expires_at"] == 2000
+
+    await oidc.logout_oidc(request)
+    assert request.session == {}
+    assert redis.values == {}
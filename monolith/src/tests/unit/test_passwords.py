@@ -0,0 +1,39 @@
+import bcrypt
+import pytest
+
+from src.common.passwords import ARGON2ID, BCRYPT, PasswordHasher
+
+
+def bcrypt_hash(rounds):
+    return bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def test_weaker_bcrypt_hash_is_upgraded():
+    assert PasswordHasher(BCRYPT, bcrypt_rounds=5).needs_rehash(bcrypt_hash(4))
+
+
+@pytest.mark.parametrize("rounds", [5, 6])
+def test_bcrypt_hash_at_or_above_the_cost_is_kept(rounds):
+    assert not PasswordHasher(BCRYPT, bcrypt_rounds=5).needs_rehash(bcrypt_hash(rounds))
+
+
+def test_unparseable_hash_is_replaced():
+    assert PasswordHasher(BCRYPT, bcrypt_rounds=5).needs_rehash("$2b$x")
+
+
+def test_bcrypt_hash_verifies():
+    hasher = PasswordHasher(BCRYPT, bcrypt_rounds=4)
+    hashed = hasher.hash("secret")
+
+    assert hasher.verify("secret", hashed)
+    assert not hasher.verify("wrong", hashed)
+
+
+def test_argon2_costs_are_only_ever_raised():
+    pytest.importorskip("argon2")
+    weak = PasswordHasher(ARGON2ID, argon2_time_cost=1, argon2_memory_cost=8192)
+    strong = PasswordHasher(ARGON2ID, argon2_time_cost=2, argon2_memory_cost=8192)
+
+    assert strong.needs_rehash(weak.hash("secret"))
+    assert not weak.needs_rehash(strong.hash("secret"))
+    assert strong.needs_rehash(bcrypt_hash(4))
@@ -0,0 +1,40 @@
+import jwt
+import pytest
+from starlette.requests import Request
+
+from src.common import rate_limit as rate_limit_module
+from src.common.rate_limit import PRINCIPAL_USER, get_principal
+
+
+def make_request(token=None):
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({"type": "http", "headers": headers, "client": ("10.0.0.1", 1234)})
+
+
+def decoding_with(result):
+    def decode_token(token):
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return decode_token
+
+
+def test_user_principal_from_verified_token(monkeypatch):
+    monkeypatch.setattr(rate_limit_module, "decode_token", decoding_with({"sub": "user-1"}))
+
+    assert get_principal(make_request("token"), PRINCIPAL_USER) == "user:user-1"
+
+
+@pytest.mark.parametrize(
+    "error",
+    [jwt.InvalidSignatureError("bad signature"), ValueError("No JWT signing keys found")],
+)
+def test_undecodable_token_falls_back_to_ip(monkeypatch, error):
+    monkeypatch.setattr(rate_limit_module, "decode_token", decoding_with(error))
+
+    assert get_principal(make_request("token"), PRINCIPAL_USER) == "ip:10.0.0.1"
+
+
+def test_anonymous_request_counts_against_ip():
+    assert get_principal(make_request(), PRINCIPAL_USER) == "ip:10.0.0.1"
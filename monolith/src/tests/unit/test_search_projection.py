@@ -0,0 +1,96 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from src.common import consumers
+from src.common.consumers import EventConsumer
+from src.common.exceptions import SearchException
+from src.course.search import CourseSearchProjection
+from src.course.subscribers import register_search_projection
+
+
+class FakeMessage:
+    def __init__(self, key, event):
+        self._key = key.encode()
+        self._value = json.dumps(event).encode()
+
+    def key(self):
+        return self._key
+
+    def value(self):
+        return self._value
+
+
+class JsonKafkaConsumer:
+    @staticmethod
+    def decode(msg):
+        return {"value": json.loads(msg.value())}
+
+
+class RecordingProjection(CourseSearchProjection):
+    """Records flushes instead of reading the database and writing the index."""
+
+    def __init__(self, error=None):
+        super().__init__()
+        self.error = error
+        self.flushes = []
+
+    async def flush(self, course_ids, module_ids):
+        self.flushes.append((course_ids, module_ids))
+        if self.error:
+            raise self.error
+
+
+def event(event_type, **data):
+    return {"event_type": event_type, "event_id": str(uuid4()), "data": data}
+
+
+@pytest.fixture
+def consumer(monkeypatch):
+    monkeypatch.setattr(consumers, "KafkaConsumer", JsonKafkaConsumer)
+    return EventConsumer("test", max_retries=0, retry_backoff=0)
+
+
+async def test_batch_is_flushed_once(consumer):
+    projection = register_search_projection(consumer, RecordingProjection())
+    course_id, module_id = uuid4(), uuid4()
+    messages = [
+        FakeMessage("a", event("course.updated", course_id=str(course_id))),
+        FakeMessage("b", event("module.created", course_id=str(course_id), module_id=str(module_id))),
+        FakeMessage("c", event("lesson.updated", module_id=str(module_id))),
+        FakeMessage("a", event("course.published", course_id=str(course_id))),
+    ]
+
+    await consumer.process_batch(messages)
+
+    assert [(set(c), set(m)) for c, m in projection.flushes] == [({course_id}, {module_id})]
+
+
+async def test_each_batch_flushes_only_its_own_courses(consumer):
+    projection = register_search_projection(consumer, RecordingProjection())
+    first, second = uuid4(), uuid4()
+
+    await consumer.process_batch([FakeMessage("a", event("course.updated", course_id=str(first)))])
+    await consumer.process_batch([FakeMessage("b", event("course.updated", course_id=str(second)))])
+
+    assert [course_ids for course_ids, _ in projection.flushes] == [{first}, {second}]
+
+
+async def test_batch_without_course_events_does_not_flush(consumer):
+    projection = register_search_projection(consumer, RecordingProjection())
+
+    @consumer.handler("user.*")
+    async def handle(event):
+        pass
+
+    await consumer.process_batch([FakeMessage("a", event("user.updated", user_id="1"))])
+
+    assert projection.flushes == []
+
+
+async def test_flush_failure_fails_the_batch(consumer):
+    register_search_projection(consumer, RecordingProjection(SearchException("index unavailable")))
+
+    with pytest.raises(SearchException):
+        await consumer.process_batch([FakeMessage("a", event("course.updated", course_id=str(uuid4())))])
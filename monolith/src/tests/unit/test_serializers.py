@@ -0,0 +1,65 @@
+import dataclasses
+import typing
+from uuid import uuid4
+
+import pytest
+
+from src.auth import events as user_events
+from src.common.serializers import ProtobufEventSerializer
+from src.course import events as course_events
+
+
+def _sample_value(annotation):
+    if typing.get_origin(annotation) is typing.Union:
+        annotation = typing.get_args(annotation)[0]
+    return {str: "value", int: 1, bool: True}.get(annotation, uuid4())
+
+
+def _staged_events():
+    staged = []
+
+    def stage_event(session, event_type, data, key=None):
+        staged.append({
+            "event_type": event_type,
+            "event_id": str(uuid4()),
+            "timestamp": data["timestamp"],
+            "data": data,
+        })
+
+    for module in (user_events, course_events):
+        original, module.stage_event = module.stage_event, stage_event
+        try:
+            for cls in vars(module).values():
+                if dataclasses.is_dataclass(cls) and cls.__module__ == module.__name__:
+                    hints = typing.get_type_hints(cls)
+                    cls(**{
+                        field.name: _sample_value(hints[field.name])
+                        for field in dataclasses.fields(cls)
+                        if field.name != "timestamp"
+                    }).stage(session=None)
+        finally:
+            module.stage_event = original
+    return staged
+
+
+@pytest.mark.parametrize("event", _staged_events(), ids=lambda event: event["event_type"])
+def test_every_domain_event_round_trips_through_protobuf(event):
+    serializer = ProtobufEventSerializer()
+
+    decoded = serializer.deserialize(serializer.serialize(event))
+
+    assert decoded["event_type"] == event["event_type"]
+    assert {name: value for name, value in decoded["data"].items() if value is not None} == event["data"]
+
+
+def test_unknown_fields_are_rejected():
+    serializer = ProtobufEventSerializer()
+    event = {
+        "event_type": "user.deleted",
+        "event_id": str(uuid4()),
+        "timestamp": "2024-01-01T00:00:00",
+        "data": {"user_id": str(uuid4()), "timestamp": "2024-01-01T00:00:00", "reason": "spam"},
+    }
+
+    with pytest.raises(ValueError):
+        serializer.serialize(event)
@@ -0,0 +1,37 @@
+import zlib
+
+from src.common.sqltypes import CompressedText
+
+
+def test_short_values_are_stored_raw():
+    column_type = CompressedText(min_size=16)
+
+    stored = column_type.process_bind_param("short", None)
+
+    assert stored == b"\x00short"
+    assert column_type.process_result_value(stored, None) == "short"
+
+
+def test_long_values_are_stored_zlib_compressed():
+    column_type = CompressedText(min_size=16)
+    text = "lesson body " * 100
+
+    stored = column_type.process_bind_param(text, None)
+
+    assert stored[:1] == b"\x01"
+    assert zlib.decompress(stored[1:]).decode("utf-8") == text
+    assert len(stored) < len(text)
+    assert column_type.process_result_value(memoryview(stored), None) == text
+
+
+def test_text_from_an_unmigrated_column_passes_through():
+    column_type = CompressedText()
+
+    assert column_type.process_result_value("plain text", None) == "plain text"
+
+
+def test_none_is_stored_as_null():
+    column_type = CompressedText()
+
+    assert column_type.process_bind_param(None, None) is None
+    assert column_type.process_result_value(None, None) is None
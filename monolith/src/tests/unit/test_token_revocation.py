@@ -0,0 +1,50 @@
+import time
+
+from src.modules.auth.persistence import token_revocation
+from src.modules.auth.persistence.token_revocation import TokenRevocationStore
+
+
+class FakeRedis:
+    def __init__(self, revoked=()):
+        self.revoked = {jti: time.time() + 60 for jti in revoked}
+        self.exists_calls = 0
+
+    async def exists(self, key):
+        self.exists_calls += 1
+        return int(key.rsplit(":", 1)[1] in self.revoked)
+
+    async def zrangebyscore(self, key, minimum, maximum):
+        return [jti for jti, expires_at in self.revoked.items() if expires_at >= minimum]
+
+
+async def test_without_filter_every_check_goes_to_redis(monkeypatch):
+    redis = FakeRedis(revoked=["revoked"])
+    monkeypatch.setattr(token_revocation, "get_async_redis", lambda: redis)
+    store = TokenRevocationStore(capacity=100)
+
+    assert await store.is_revoked("revoked")
+    assert not await store.is_revoked("valid")
+    assert redis.exists_calls == 2
+
+
+async def test_filter_answers_misses_locally_and_confirms_hits(monkeypatch):
+    redis = FakeRedis(revoked=["revoked"])
+    monkeypatch.setattr(token_revocation, "get_async_redis", lambda: redis)
+    store = TokenRevocationStore(capacity=100)
+    await store.rebuild()
+
+    assert not await store.is_revoked("valid")
+    assert redis.exists_calls == 0
+    assert await store.is_revoked("revoked")
+    assert redis.exists_calls == 1
+
+
+async def test_rebuild_drops_expired_revocations(monkeypatch):
+    redis = FakeRedis(revoked=["expired"])
+    redis.revoked["expired"] = time.time() - 1
+    monkeypatch.setattr(token_revocation, "get_async_redis", lambda: redis)
+    store = TokenRevocationStore(capacity=100)
+    await store.rebuild()
+
+    assert not await store.is_revoked("expired")
+    assert redis.exists_calls == 0
@@ -0,0 +1,17 @@
+#!/bin/bash
+
+# Generate a JWT signing key pair: generate_jwt_key.sh <kid> [rsa|ed25519] [keys dir]
+set -e
+
+KID="${1:?usage: generate_jwt_key.sh <kid> [rsa|ed25519] [keys dir]}"
+TYPE="${2:-rsa}"
+KEYS_DIR="${3:-keys/jwt}"
+
+mkdir -p "$KEYS_DIR"
+if [ "$TYPE" = "ed25519" ]; then
+  openssl genpkey -algorithm ed25519 -out "$KEYS_DIR/$KID.key"
+else
+  openssl genpkey -algorithm RSA -pkeyopt rsa_keygen_bits:2048 -out "$KEYS_DIR/$KID.key"
+fi
+openssl pkey -in "$KEYS_DIR/$KID.key" -pubout -out "$KEYS_DIR/$KID.pub"
+chmod 600 "$KEYS_DIR/$KID.key"
@@ -0,0 +1,13 @@
+#!/bin/bash
+
+# Generate the Python protobuf modules used by the Kafka event serializer
+set -e
+
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+
+protoc \
+  -I "$ROOT_DIR/protobuf" \
+  --python_out="$ROOT_DIR/monolith/src/common/proto" \
+  "$ROOT_DIR/protobuf/user.proto" \
+  "$ROOT_DIR/protobuf/course.proto" \
+  "$ROOT_DIR/protobuf/events.proto"